@@ -3,18 +3,29 @@ Main FastAPI application entry point
 """
 import os
 import sys
+import time
+import signal
+import threading
+import asyncio
+import atexit
+import queue
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+
+# All paths are built from the backend directory rather than the CWD, so
+# the server can be started from anywhere without a process-wide chdir
+backend_path = Path(__file__).resolve().parent
 
 # Add src directory to Python path
-src_path = Path(__file__).parent / "src"
+src_path = backend_path / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
-# Change to backend directory for imports
-backend_path = Path(__file__).parent
-os.chdir(backend_path)
+# Production mode disables per-request logging (see log_requests below)
+IS_PRODUCTION = os.getenv("ENVIRONMENT", "").lower() == "production"
 
 # Configure logging to write to file AND console
 logs_dir = backend_path / "logs"
@@ -34,83 +45,281 @@ root_logger.setLevel(logging.INFO)
 # Remove existing handlers to avoid duplicates
 root_logger.handlers.clear()
 
-# File handler with rotation (10MB max, keep 5 backups)
-file_handler = RotatingFileHandler(
+from utils.logging_utils import BufferedRotatingFileHandler
+
+# File handler with rotation (10MB max, keep 5 backups). Writes go through a
+# 64KB buffer (flushed on ERROR, rotation and shutdown) and the file is only
+# opened once the first record arrives.
+file_handler = BufferedRotatingFileHandler(
     log_file,
     maxBytes=10 * 1024 * 1024,  # 10MB
     backupCount=5,
-    encoding='utf-8'
+    encoding='utf-8',
+    delay=True
 )
-file_handler.setLevel(logging.INFO)
+file_handler.setLevel(logging.WARNING if IS_PRODUCTION else logging.INFO)
 file_handler.setFormatter(formatter)
-root_logger.addHandler(file_handler)
 
 # Console handler (for when running directly)
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setLevel(logging.INFO)
 console_handler.setFormatter(formatter)
-root_logger.addHandler(console_handler)
+
+# The event loop only enqueues records; a background listener thread does
+# the blocking file/console writes (and rotation). It is started by main()
+# and by each lifespan (records logged before that wait in the queue), and
+# stopped at the end of a lifespan and at exit.
+log_queue: queue.Queue = queue.Queue(-1)
+root_logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
 
 logger = logging.getLogger(__name__)
 
+# Prefer uvloop + httptools (shipped with uvicorn[standard]); fall back to
+# uvicorn's auto-detection when the C extensions are not available.
+try:
+    import uvloop  # noqa: F401
+    UVICORN_LOOP = "uvloop"
+except ImportError:
+    UVICORN_LOOP = "auto"
+
+try:
+    import httptools  # noqa: F401
+    UVICORN_HTTP = "httptools"
+except ImportError:
+    UVICORN_HTTP = "auto"
+
+if IS_PRODUCTION and "auto" in (UVICORN_LOOP, UVICORN_HTTP):
+    # Not fatal, but the stdlib loop / h11 parser are noticeably slower
+    logger.warning(
+        "uvloop/httptools not available (loop=%s, http=%s); install uvicorn[standard]",
+        UVICORN_LOOP, UVICORN_HTTP
+    )
+
 # Log startup
 logger.info("=" * 80)
 logger.info("Starting Trading API Server")
-logger.info(f"Log file: {log_file}")
+logger.info("Log file: %s", log_file)
 logger.info("=" * 80)
 
 try:
+    import httpx
     from fastapi import FastAPI
+    from fastapi.concurrency import run_in_threadpool
     from fastapi.middleware.cors import CORSMiddleware
-    from api.routes import router as trading_router
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.responses import ORJSONResponse
+    from api.routes import router as trading_router, clear_client_validation_cache, TICKER_BULK_CONCURRENCY
     from api.supabase_routes import router as supabase_router
+    from api.rate_limit import limiter
+    from slowapi import _rate_limit_exceeded_handler
+    from slowapi.errors import RateLimitExceeded
+    from utils.http_client import get_http_client, close_http_client, preconnect, keep_warm
+    from auth.supabase.client import get_supabase_client
+    from config import DELTA_BASE_URL
 except Exception as e:
-    logger.error(f"Failed to import modules: {e}", exc_info=True)
+    logger.error("Failed to import modules: %s", e, exc_info=True)
     raise
 
+
+def register_reload_signal():
+    """Reload the CSV whitelist and cached client validations on SIGHUP"""
+    # Signal handlers can only be installed from the main thread (not e.g. under TestClient)
+    if hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGHUP, lambda signum, frame: clear_client_validation_cache())
+
+
+async def open_http_client(app: FastAPI):
+    """
+    Create the shared outbound HTTP client for this worker and open its
+    Delta Exchange connection up front, so the first ticker poll doesn't pay
+    the DNS + TCP + TLS handshake. A background task keeps it from idling out.
+    Set DELTA_PRECONNECT=false to skip both (e.g. offline development).
+    """
+    app.state.http_client = get_http_client()
+    app.state.keep_warm_task = None
+    if os.getenv("DELTA_PRECONNECT", "true").lower() in ("1", "true", "yes"):
+        warm_url = f"{DELTA_BASE_URL}/v2/tickers/BTCUSD"
+        await preconnect(warm_url)
+        app.state.keep_warm_task = asyncio.create_task(keep_warm(warm_url))
+
+
+async def shutdown_http_client(app: FastAPI):
+    """Stop the keep-warm task and close pooled outbound connections"""
+    if app.state.keep_warm_task is not None:
+        app.state.keep_warm_task.cancel()
+    await close_http_client()
+
+
+async def open_supabase_client():
+    """
+    Resolve the Supabase configuration and create the shared service-role
+    client at startup, so the first authenticated request doesn't pay for
+    create_client. One cheap admin call then opens its connection up front;
+    set SUPABASE_PRECONNECT=false to skip it. Failures are logged, not fatal.
+    """
+    supabase_client = await run_in_threadpool(get_supabase_client)
+    if supabase_client is None:
+        return
+    if os.getenv("SUPABASE_PRECONNECT", "true").lower() not in ("1", "true", "yes"):
+        return
+    try:
+        await run_in_threadpool(supabase_client.auth.admin.list_users, page=1, per_page=1)
+    except Exception as e:
+        logger.warning("Supabase preconnect failed: %s", e)
+
+
+def start_log_listener():
+    """Start the background logging thread (no-op if it is already running)"""
+    if log_listener._thread is None:
+        log_listener.start()
+
+
+def stop_log_listener():
+    """Flush queued log records and stop the background logging thread (idempotent)"""
+    if log_listener._thread is not None:
+        log_listener.stop()
+    file_handler.flush()
+
+
+atexit.register(stop_log_listener)
+
+
+def log_event_loop():
+    """Log which event loop implementation is serving requests"""
+    logger.info(
+        "Event loop: %s (policy: %s)",
+        type(asyncio.get_running_loop()).__name__,
+        type(asyncio.get_event_loop_policy()).__name__,
+    )
+
+
+def configure_thread_pool():
+    """
+    Size the thread pool FastAPI uses for sync dependencies and
+    run_in_threadpool (anyio's default is 40 threads per worker).
+    """
+    import anyio.to_thread
+    
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("BACKEND_THREADPOOL_SIZE", "200"))
+    logger.info("Thread pool size: %d", limiter.total_tokens)
+
+
+async def warm_up(app: FastAPI):
+    """
+    Pay one-off setup costs at boot instead of on the first user request:
+    build the OpenAPI schema and push one in-process request through the
+    middleware stack and router.
+    """
+    start_time = time.perf_counter()
+    app.openapi()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://warmup") as client:
+        await client.get("/")
+    logger.info("Warm-up completed in %.3fs", time.perf_counter() - start_time)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Per-worker startup and shutdown"""
+    start_log_listener()
+    register_reload_signal()
+    # Bounds concurrent upstream fetches of one bulk /tickers request; created
+    # here so it belongs to the loop serving this lifespan
+    app.state.ticker_bulk_semaphore = asyncio.Semaphore(TICKER_BULK_CONCURRENCY)
+    await open_http_client(app)
+    log_event_loop()
+    configure_thread_pool()
+    await open_supabase_client()
+    await warm_up(app)
+    try:
+        yield
+    finally:
+        await shutdown_http_client(app)
+        stop_log_listener()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Trading API",
     description="API for executing trading orders with stop loss and take profit",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Add request/error logging middleware
-@app.middleware("http")
+
 async def log_requests(request, call_next):
     """Log all requests and responses"""
-    import time
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Log request
-    logger.info(f"Request: {request.method} {request.url.path} - Client: {request.client.host if request.client else 'unknown'}")
+    logger.info("Request: %s %s - Client: %s", request.method, request.url.path, request.client.host if request.client else "unknown")
     
     try:
         response = await call_next(request)
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         
         # Log response
-        logger.info(f"Response: {request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.3f}s")
+        logger.info("Response: %s %s - Status: %s - Time: %.3fs", request.method, request.url.path, response.status_code, process_time)
         
         return response
     except Exception as e:
-        process_time = time.time() - start_time
-        logger.error(f"Error in {request.method} {request.url.path}: {e} - Time: {process_time:.3f}s", exc_info=True)
+        process_time = time.perf_counter() - start_time
+        logger.error("Error in %s %s: %s - Time: %.3fs", request.method, request.url.path, e, process_time, exc_info=True)
         raise
 
-# Configure CORS middleware for Postman access
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for Postman
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+
+# Add request/error logging middleware (development only - uvicorn's access
+# log and per-request middleware logging are skipped in production)
+if not IS_PRODUCTION:
+    app.middleware("http")(log_requests)
+
+# Compress larger JSON bodies (order/trade history pages); small responses
+# such as tickers aren't worth the CPU
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=5)
+
+# Configure CORS middleware. Development allows everything (Postman, local UI);
+# production uses an exact origin set and explicit method/header lists.
+CORS_ALLOW_ORIGINS = frozenset(
+    origin.strip() for origin in os.getenv("CORS_ALLOW_ORIGINS", "").split(",") if origin.strip()
 )
+CORS_ALLOW_METHODS = ("GET", "POST", "OPTIONS")
+CORS_ALLOW_HEADERS = (
+    "Authorization", "Content-Type",
+    "X-SRP-Client-ID", "X-SRP-Client-Email",
+    "X-Delta-API-Key", "X-Delta-API-Secret", "X-Delta-Base-URL",
+)
+
+if IS_PRODUCTION and CORS_ALLOW_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ALLOW_ORIGINS,
+        allow_credentials=True,
+        allow_methods=CORS_ALLOW_METHODS,
+        allow_headers=CORS_ALLOW_HEADERS,
+    )
+else:
+    if IS_PRODUCTION:
+        logger.warning("CORS_ALLOW_ORIGINS is not set; allowing all origins")
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Allow all origins for Postman
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 # Include API routes
+# Per-IP / per-client rate limits on login, ticker and order routes (429 when exceeded)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
 app.include_router(trading_router)
 app.include_router(supabase_router)  # Supabase routes (separate module)
 
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -124,30 +333,72 @@ async def root():
     }
 
 
-def main():
-    """Main function to run the FastAPI server"""
+def get_worker_count() -> int:
+    """
+    Number of uvicorn worker processes to run.
+    
+    Uses WEB_CONCURRENCY (or the legacy BACKEND_WORKERS) when set, otherwise
+    a single worker. Each worker imports this module on its own, so running
+    strategies, the ticker/Fear & Greed caches and in-memory rate-limit
+    counters are per process: only raise it (e.g. to 2 * CPU + 1) when the
+    strategy endpoints are unused and RATE_LIMIT_STORAGE_URI is shared.
+    """
+    configured = os.getenv("WEB_CONCURRENCY") or os.getenv("BACKEND_WORKERS")
+    workers = int(configured) if configured else 1
+    return workers if workers > 0 else 1
+
+
+def main(reload: Optional[bool] = None):
+    """
+    Run the FastAPI server. This is the single place uvicorn is configured;
+    app.py (the container entrypoint) calls it with reload=False.
+    
+    Args:
+        reload: Enable hot-reload (defaults to on outside production). Uvicorn
+            cannot reload with multiple workers, so reload implies one worker.
+    """
     import uvicorn
     
     port = int(os.getenv("PORT", 8501))
     host = os.getenv("HOST", "0.0.0.0")
+    if reload is None:
+        reload = not IS_PRODUCTION
+    workers = None if reload else get_worker_count()
+    log_level = os.getenv("UVICORN_LOG_LEVEL", "info")
+    # Shed load with 503s / kernel backlog instead of queueing without bound.
+    # Keep limit_concurrency >= the thread pool size used for blocking calls
+    # so offloaded work cannot exhaust the limit on its own.
+    limit_concurrency = int(os.getenv("UVICORN_LIMIT_CONCURRENCY", "256"))
+    backlog = int(os.getenv("UVICORN_BACKLOG", "2048"))
+    timeout_keep_alive = int(os.getenv("UVICORN_KEEPALIVE", "5"))
     
-    logger.info(f"Starting Trading API server on {host}:{port}")
-    logger.info(f"API Documentation: http://{host}:{port}/docs")
+    start_log_listener()
+    logger.info("Starting Trading API server on %s:%s", host, port)
+    logger.info("API Documentation: http://%s:%s/docs", host, port)
     
     try:
         uvicorn.run(
             "main:app",
             host=host,
             port=port,
-            reload=True,
-            log_level="info",
-            access_log=True
+            reload=reload,
+            workers=workers,
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
+            log_level=log_level,
+            access_log=not IS_PRODUCTION,
+            limit_concurrency=limit_concurrency,
+            backlog=backlog,
+            timeout_keep_alive=timeout_keep_alive,
         )
     except Exception as e:
-        logger.error(f"Failed to start server: {e}", exc_info=True)
+        logger.error("Failed to start server: %s", e, exc_info=True)
         raise
 
 
 if __name__ == "__main__":
+    # `python main.py`: let uvicorn's "main:app" import resolve to this
+    # already-initialized module instead of executing the file a second time
+    # (which would register the app, logging and listener thread twice)
+    sys.modules.setdefault("main", sys.modules[__name__])
     main()
-
@@ -6,15 +6,18 @@ Migrates users from CSV file to Supabase.
 Optionally migrates users from Auth0 (if Auth0 users exist).
 
 Usage:
-    python scripts/migrate_users_to_supabase.py [--auth0] [--dry-run]
+    python scripts/migrate_users_to_supabase.py [--auth0] [--dry-run] [--workers N] [--log-level LEVEL]
 """
 import sys
 import os
 import csv
 import argparse
 import logging
+import httpx
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import batched
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Iterable, List, Dict, Optional, Set, Tuple
 
 # Add backend/src to path
 backend_path = Path(__file__).parent.parent
@@ -22,8 +25,7 @@ src_path = backend_path / "src"
 sys.path.insert(0, str(src_path))
 
 from dotenv import load_dotenv
-from supabase import create_client, Client
-from auth.supabase.config import get_supabase_config
+from auth.supabase.config import SupabaseConfig, get_supabase_config
 from auth.client_auth import ClientAuth
 
 # Load environment variables
@@ -36,19 +38,160 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Concurrency for admin create_user calls (each one is a separate HTTPS request)
+DEFAULT_MAX_WORKERS = 16
+CREATE_BATCH_SIZE = 100
+LIST_USERS_PAGE_SIZE = 1000
+
+# GoTrue admin endpoint used to create users
+ADMIN_USERS_PATH = "/auth/v1/admin/users"
+ADMIN_HTTP_TIMEOUT_SECONDS = 30.0
+
+# Password given to CSV users without one; they must reset it on first login
+TEMP_PASSWORD = "TempPassword123!@#"
+
+
+def fetch_existing_emails(http_client: httpx.Client, per_page: int = LIST_USERS_PAGE_SIZE) -> Set[str]:
+    """
+    Fetch every existing Supabase user email in one paginated pass.
+    
+    Pages are read over the pooled admin client, so the whole sweep costs
+    ceil(users / per_page) requests on a single kept-alive connection.
+    
+    Args:
+        http_client: Client from create_admin_http_client()
+        per_page: Users requested per admin API page
+    
+    Returns:
+        Set of lowercased emails already registered in Supabase
+    """
+    emails: Set[str] = set()
+    page = 1
+    while True:
+        response = http_client.get(ADMIN_USERS_PATH, params={"page": page, "per_page": per_page})
+        response.raise_for_status()
+        users = response.json().get("users") or []
+        emails.update(user["email"].strip().lower() for user in users if user.get("email"))
+        if len(users) < per_page:
+            break
+        page += 1
+    
+    logger.info("Found %d existing users in Supabase", len(emails))
+    return emails
+
+
+def create_admin_http_client(config: SupabaseConfig, max_connections: int = DEFAULT_MAX_WORKERS) -> httpx.Client:
+    """
+    Create the pooled HTTP client used for admin user creation.
+    
+    One keep-alive client shared by every worker thread lets the whole
+    migration reuse a handful of TLS connections (multiplexed over HTTP/2)
+    instead of paying a handshake per created user.
+    
+    Args:
+        config: Supabase configuration (URL and service role key)
+        max_connections: Upper bound on pooled connections
+    
+    Returns:
+        httpx.Client authenticated with the service role key
+    """
+    return httpx.Client(
+        base_url=config.url,
+        http2=True,
+        headers={
+            "apikey": config.service_role_key,
+            "Authorization": f"Bearer {config.service_role_key}",
+        },
+        timeout=ADMIN_HTTP_TIMEOUT_SECONDS,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    )
+
+
+def create_user(http_client: httpx.Client, user_data: Dict) -> Dict:
+    """
+    Create a single user through the Supabase admin REST API.
+    
+    Args:
+        http_client: Client from create_admin_http_client()
+        user_data: Admin create-user payload
+    
+    Returns:
+        Created user as returned by the API
+    
+    Raises:
+        httpx.HTTPStatusError: If the API rejects the user
+    """
+    response = http_client.post(ADMIN_USERS_PATH, json=user_data)
+    response.raise_for_status()
+    return response.json()
+
+
+def create_users_concurrently(
+    http_client: httpx.Client,
+    pending: Iterable[Tuple[str, Dict]],
+    stats: Dict[str, int],
+    on_created: Callable[[str, Dict], None],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    batch_size: int = CREATE_BATCH_SIZE
+) -> None:
+    """
+    Create users through the admin API using a thread pool.
+    
+    Users are submitted in bounded batches so only batch_size requests are
+    in flight (and held in memory) at a time. All workers share http_client,
+    so requests are pipelined over its pooled keep-alive connections.
+    
+    Args:
+        http_client: Client from create_admin_http_client()
+        pending: Iterable of (email, user_data) pairs to create
+        stats: Migration statistics, updated in place
+        on_created: Callback invoked with (email, user_data) for each created user
+        max_workers: Number of concurrent create_user requests
+        batch_size: Number of users submitted per batch
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch in batched(pending, batch_size):
+            futures = {
+                executor.submit(create_user, http_client, user_data): (email, user_data)
+                for email, user_data in batch
+            }
+            for future in as_completed(futures):
+                email, user_data = futures[future]
+                try:
+                    user = future.result()
+                except httpx.HTTPStatusError as e:
+                    logger.error("Error creating user %s: %s %s", email, e.response.status_code, e.response.text)
+                    stats["errors"] += 1
+                    continue
+                except httpx.HTTPError as e:
+                    logger.error("Error creating user %s: %s", email, e)
+                    stats["errors"] += 1
+                    continue
+                
+                if user.get("id"):
+                    stats["created"] += 1
+                    on_created(email, user_data)
+                else:
+                    logger.error("Failed to create user: %s", email)
+                    stats["errors"] += 1
+
 
 def migrate_csv_users_to_supabase(
-    supabase_client: Client,
+    http_client: httpx.Client,
     client_auth: ClientAuth,
-    dry_run: bool = False
+    dry_run: bool = False,
+    existing_emails: Optional[Set[str]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
 ) -> Dict[str, int]:
     """
     Migrate users from CSV file to Supabase.
     
     Args:
-        supabase_client: Supabase client instance
-        client_auth: ClientAuth instance with loaded CSV users
+        http_client: Pooled Supabase admin client (see create_admin_http_client)
+        client_auth: ClientAuth instance whose CSV is streamed via iter_clients()
         dry_run: If True, don't actually create users, just log what would be done
+        existing_emails: Emails already in Supabase (fetched once if not provided)
+        max_workers: Number of concurrent create_user requests
     
     Returns:
         Dictionary with migration statistics
@@ -62,84 +205,77 @@ def migrate_csv_users_to_supabase(
     
     logger.info("Starting CSV to Supabase user migration...")
     
-    for email, client_data in client_auth.clients.items():
-        stats["total"] += 1
-        email = email.strip().lower()
-        client_id = client_data.get("client_id", "").strip()
-        password = client_data.get("password", "").strip()
-        
-        if not email or not client_id:
-            logger.warning(f"Skipping invalid user: email={email}, client_id={client_id}")
-            stats["skipped"] += 1
-            continue
-        
-        # Check if user already exists in Supabase
-        try:
-            existing_user = supabase_client.auth.admin.get_user_by_email(email)
-            if existing_user.user:
-                logger.info(f"User {email} already exists in Supabase, skipping")
+    if existing_emails is None:
+        existing_emails = fetch_existing_emails(http_client)
+    
+    def pending_users():
+        for email, client_data in client_auth.iter_clients():
+            stats["total"] += 1
+            # CSV keys are stored as-is; normalize once for lookups and creation
+            email = email.strip().lower()
+            client_id = client_data.get("client_id", "").strip()
+            password = client_data.get("password", "").strip()
+            
+            if not email or not client_id:
+                logger.warning("Skipping invalid user: email=%s, client_id=%s", email, client_id)
                 stats["skipped"] += 1
                 continue
-        except Exception as e:
-            # User doesn't exist, which is fine
-            pass
-        
-        if dry_run:
-            logger.info(f"[DRY RUN] Would create user: {email} (client_id: {client_id})")
-            stats["created"] += 1
-            continue
-        
-        # Create user in Supabase
-        try:
-            # If password exists, use it; otherwise generate a random password
-            # Users will need to reset password if not provided
-            user_password = password if password else None
             
-            user_data = {
+            if email in existing_emails:
+                logger.info("User %s already exists in Supabase, skipping", email)
+                stats["skipped"] += 1
+                continue
+            # Mark as seen so later duplicates (or the Auth0 pass) skip it
+            existing_emails.add(email)
+            
+            if dry_run:
+                logger.info("[DRY RUN] Would create user: %s (client_id: %s)", email, client_id)
+                stats["created"] += 1
+                continue
+            
+            # If password exists, use it; otherwise use a temporary password
+            # Users will need to reset password if not provided
+            yield email, {
                 "email": email,
-                "password": user_password or "TempPassword123!@#",  # Temporary password
+                "password": password or TEMP_PASSWORD,
                 "email_confirm": True,  # Auto-confirm email
                 "user_metadata": {
                     "client_id": client_id,
                     "migrated_from": "csv",
                 }
             }
-            
-            # Create user using admin API
-            response = supabase_client.auth.admin.create_user(user_data)
-            
-            if response.user:
-                logger.info(f"Created user: {email} (client_id: {client_id})")
-                stats["created"] += 1
-                
-                if not password:
-                    logger.warning(
-                        f"User {email} created with temporary password. "
-                        "User should reset password on first login."
-                    )
-            else:
-                logger.error(f"Failed to create user: {email}")
-                stats["errors"] += 1
-                
-        except Exception as e:
-            logger.error(f"Error creating user {email}: {e}")
-            stats["errors"] += 1
+    
+    def on_created(email: str, user_data: Dict) -> None:
+        client_id = user_data["user_metadata"]["client_id"]
+        logger.info("Created user: %s (client_id: %s)", email, client_id)
+        if user_data["password"] == TEMP_PASSWORD:
+            logger.warning(
+                "User %s created with temporary password. "
+                "User should reset password on first login.",
+                email
+            )
+    
+    create_users_concurrently(http_client, pending_users(), stats, on_created, max_workers=max_workers)
     
     return stats
 
 
 def migrate_auth0_users_to_supabase(
-    supabase_client: Client,
+    http_client: httpx.Client,
     auth0_users: List[Dict],
-    dry_run: bool = False
+    dry_run: bool = False,
+    existing_emails: Optional[Set[str]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
 ) -> Dict[str, int]:
     """
     Migrate users from Auth0 to Supabase.
     
     Args:
-        supabase_client: Supabase client instance
+        http_client: Pooled Supabase admin client (see create_admin_http_client)
         auth0_users: List of Auth0 user dictionaries
         dry_run: If True, don't actually create users, just log what would be done
+        existing_emails: Emails already in Supabase (fetched once if not provided)
+        max_workers: Number of concurrent create_user requests
     
     Returns:
         Dictionary with migration statistics
@@ -153,33 +289,34 @@ def migrate_auth0_users_to_supabase(
     
     logger.info("Starting Auth0 to Supabase user migration...")
     
-    for auth0_user in auth0_users:
-        stats["total"] += 1
-        email = auth0_user.get("email", "").strip().lower()
-        
-        if not email:
-            logger.warning(f"Skipping Auth0 user without email: {auth0_user.get('user_id')}")
-            stats["skipped"] += 1
-            continue
-        
-        # Check if user already exists in Supabase
-        try:
-            existing_user = supabase_client.auth.admin.get_user_by_email(email)
-            if existing_user.user:
-                logger.info(f"User {email} already exists in Supabase, skipping")
+    if existing_emails is None:
+        existing_emails = fetch_existing_emails(http_client)
+    
+    def pending_users():
+        for auth0_user in auth0_users:
+            stats["total"] += 1
+            email = auth0_user.get("email", "").strip().lower()
+            
+            if not email:
+                logger.warning("Skipping Auth0 user without email: %s", auth0_user.get('user_id'))
                 stats["skipped"] += 1
                 continue
-        except Exception:
-            pass
-        
-        if dry_run:
-            logger.info(f"[DRY RUN] Would create user from Auth0: {email}")
-            stats["created"] += 1
-            continue
-        
-        # Create user in Supabase
-        try:
-            user_data = {
+            
+            if email in existing_emails:
+                logger.info("User %s already exists in Supabase, skipping", email)
+                stats["skipped"] += 1
+                continue
+            # Mark as seen so later duplicates (or the Auth0 pass) skip it
+            existing_emails.add(email)
+            
+            if dry_run:
+                logger.info("[DRY RUN] Would create user from Auth0: %s", email)
+                stats["created"] += 1
+                continue
+            
+            # Note: Auth0 passwords cannot be migrated directly
+            # Users will need to reset password
+            yield email, {
                 "email": email,
                 "email_confirm": auth0_user.get("email_verified", False),
                 "user_metadata": {
@@ -188,25 +325,16 @@ def migrate_auth0_users_to_supabase(
                     "auth0_user_id": auth0_user.get("user_id"),
                 }
             }
-            
-            # Note: Auth0 passwords cannot be migrated directly
-            # Users will need to reset password
-            response = supabase_client.auth.admin.create_user(user_data)
-            
-            if response.user:
-                logger.info(f"Created user from Auth0: {email}")
-                logger.warning(
-                    f"User {email} needs to reset password. "
-                    "Auth0 passwords cannot be migrated."
-                )
-                stats["created"] += 1
-            else:
-                logger.error(f"Failed to create user from Auth0: {email}")
-                stats["errors"] += 1
-                
-        except Exception as e:
-            logger.error(f"Error creating user from Auth0 {email}: {e}")
-            stats["errors"] += 1
+    
+    def on_created(email: str, user_data: Dict) -> None:
+        logger.info("Created user from Auth0: %s", email)
+        logger.warning(
+            "User %s needs to reset password. "
+            "Auth0 passwords cannot be migrated.",
+            email
+        )
+    
+    create_users_concurrently(http_client, pending_users(), stats, on_created, max_workers=max_workers)
     
     return stats
 
@@ -228,8 +356,21 @@ def main():
         type=str,
         help="Path to Auth0 users export file (JSON format)"
     )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level (WARNING silences per-user progress messages)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Concurrent Supabase create_user requests (default: {DEFAULT_MAX_WORKERS})"
+    )
     
     args = parser.parse_args()
+    logging.getLogger().setLevel(args.log_level)
     
     # Get Supabase configuration
     config = get_supabase_config()
@@ -237,16 +378,25 @@ def main():
         logger.error("Supabase is not configured. Please set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY in .env")
         sys.exit(1)
     
-    # Create Supabase client
+    # One pooled admin client for every list/create request in this run
+    http_client = create_admin_http_client(config, max_connections=args.workers)
+    
+    # Fetch existing Supabase users once instead of one lookup per user
     try:
-        supabase_client = create_client(config.url, config.service_role_key)
-    except Exception as e:
-        logger.error(f"Failed to create Supabase client: {e}")
+        existing_emails = fetch_existing_emails(http_client)
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to list existing Supabase users: {e}")
         sys.exit(1)
     
-    # Load CSV users
-    client_auth = ClientAuth()
-    csv_stats = migrate_csv_users_to_supabase(supabase_client, client_auth, args.dry_run)
+    # Stream CSV users (rows are read lazily as the thread pool drains batches)
+    client_auth = ClientAuth(load=False)
+    csv_stats = migrate_csv_users_to_supabase(
+        http_client,
+        client_auth,
+        args.dry_run,
+        existing_emails=existing_emails,
+        max_workers=args.workers
+    )
     
     logger.info("=" * 50)
     logger.info("CSV Migration Summary:")
@@ -271,9 +421,11 @@ def main():
             sys.exit(1)
         
         auth0_stats = migrate_auth0_users_to_supabase(
-            supabase_client,
+            http_client,
             auth0_users,
-            args.dry_run
+            args.dry_run,
+            existing_emails=existing_emails,
+            max_workers=args.workers
         )
         
         logger.info("=" * 50)
@@ -283,6 +435,8 @@ def main():
         logger.info(f"  Skipped: {auth0_stats['skipped']}")
         logger.info(f"  Errors: {auth0_stats['errors']}")
     
+    http_client.close()
+    
     logger.info("=" * 50)
     logger.info("Migration completed!")
 
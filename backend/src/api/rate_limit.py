@@ -0,0 +1,20 @@
+"""
+Rate limiting for expensive endpoints (login, ticker proxy, order placement)
+
+Requests over the limit are rejected with 429 before the handler runs.
+"""
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+from starlette.requests import Request
+
+from config import RATE_LIMIT_STORAGE_URI
+
+
+def get_client_id_key(request: Request) -> str:
+    """Rate-limit key: the X-SRP-Client-ID header, falling back to the client IP"""
+    client_id = request.headers.get("X-SRP-Client-ID", "").strip()
+    return f"client:{client_id}" if client_id else get_remote_address(request)
+
+
+# Keyed by client IP unless a route passes key_func=get_client_id_key
+limiter = Limiter(key_func=get_remote_address, storage_uri=RATE_LIMIT_STORAGE_URI)
@@ -1,50 +1,334 @@
 """
 FastAPI routes for trading API
 """
+import asyncio
+import hashlib
 import logging
 import httpx
+import orjson
+import re
 import time
-from fastapi import APIRouter, HTTPException, status, Header, Depends, Query
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from fastapi import APIRouter, HTTPException, status, Header, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response
+from typing import Annotated, Any, Dict, Final, List, Optional, Tuple
 from datetime import datetime, timedelta
+from pydantic import BaseModel
 from models import (
     PlaceLimitOrderWaitRequest, OrderResponse, LoginRequest, LoginResponse,
     StartStrategyRequest, StartStrategyResponse, StopStrategyResponse,
     StrategyStatusResponse, StrategyListResponse, StrategyLogsResponse,
-    PositionResponse, OrderHistoryResponse, PnLSummaryResponse, PollingIntervalResponse,
+    PositionResponse, OrderHistoryResponse,
+    PnLSummaryResponse, PollingIntervalResponse,
     TradeHistoryResponse, TestDeltaConnectionRequest, TestDeltaConnectionResponse
 )
 from services.trading_service import TradingService
 from services.positions_service import PositionsService
 from services.orders_service import OrdersService
 from services.pnl_service import PnLService
-from auth.client_auth import client_auth
+from auth.client_auth import client_auth, is_well_formed, normalize_email, password_digest
 from auth.supabase.middleware import get_current_user
-from auth.email_validator import validate_email_against_csv
-from config import DELTA_BASE_URL, PRICE_FETCH_INTERVAL_SECONDS, DELTA_API_KEY, DELTA_API_SECRET, POSITIONS_POLLING_INTERVAL_SECONDS
-import os
+from utils.http_client import get_http_client
+from api.rate_limit import limiter, get_client_id_key
+from config import (
+    DELTA_BASE_URL, PRICE_FETCH_INTERVAL_SECONDS, DELTA_API_KEY, DELTA_API_SECRET, POSITIONS_POLLING_INTERVAL_SECONDS,
+    RATE_LIMIT_LOGIN, RATE_LIMIT_TICKER, RATE_LIMIT_ORDERS, TICKER_CACHE_TTL_SECONDS,
+    CRYPTO_MARKET_API_KEY
+)
 from strategies.strategy_manager import get_strategy_manager
+from strategies.breakout.breakout_bot import TIMEFRAME_MINUTES
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1", tags=["trading"])
+router = APIRouter(prefix="/api/v1", tags=["trading"], default_response_class=ORJSONResponse)
 trading_service = TradingService()
 
+# Fallback Delta Exchange URL when neither headers nor config provide one
+DEFAULT_BASE_URL: Final[str] = "https://api.india.delta.exchange"
+
 # Cache for Fear & Greed Index (to avoid rate limiting)
 _fear_greed_cache: Optional[Dict[str, Any]] = None
-_fear_greed_cache_time: Optional[float] = None
-FEAR_GREED_CACHE_TTL = 300  # Cache for 5 minutes (300 seconds)
+# Wall-clock expiry of _fear_greed_cache, and end of a CoinMarketCap 429 backoff
+_fear_greed_expires_at = 0.0
+_fear_greed_backoff_until = 0.0
+# Cache for 5 minutes (300 seconds) unless CoinMarketCap's Cache-Control
+# max-age says otherwise; upstream max-age is clamped to the MIN/MAX range
+FEAR_GREED_CACHE_TTL = 300
+FEAR_GREED_MIN_TTL = 60
+FEAR_GREED_MAX_TTL = 3600
+# Backoff after a 429 without a usable Retry-After header
+FEAR_GREED_DEFAULT_RETRY_AFTER = 60
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+# CoinMarketCap can be slow to answer, but a pooled connection should not
+# take long to (re)establish
+FEAR_GREED_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+FEAR_GREED_URL = "https://pro-api.coinmarketcap.com/v3/fear-and-greed/latest"
+# CoinMarketCap request headers, built once (None if no API key is configured)
+_fear_greed_headers: Optional[Dict[str, str]] = {
+    'X-CMC_PRO_API_KEY': CRYPTO_MARKET_API_KEY,
+    'Accept': 'application/json'
+} if CRYPTO_MARKET_API_KEY else None
+if _fear_greed_headers is None:
+    logger.warning("CRYPTO_MARKET_API_KEY is not configured; /fear-greed-index will be unavailable")
+# In-flight refresh shared by concurrent cache misses (None when idle)
+_fear_greed_refresh: "Optional[asyncio.Task[Tuple[Dict[str, Any], bool]]]" = None
+
+# Short-lived ticker cache: concurrent pollers of the same symbol share one
+# upstream request per TTL window (symbol -> (monotonic fetch time, payload))
+TICKER_CACHE_MAX_SYMBOLS = 512
+
+# Delta connection-test failures -> user-facing message, checked in order
+# (first match wins); unmatched errors are reported verbatim
+CONNECTION_ERROR_MESSAGES: Final = (
+    (re.compile(r"401|Unauthorized"), "Invalid API credentials"),
+    (re.compile(r"403|Forbidden"), "API credentials are not authorized"),
+    (re.compile(r"timeout|network", re.IGNORECASE), "Network error. Please check your internet connection."),
+)
+
+# Upper bound on ?limit for /strategies/{id}/logs
+STRATEGY_LOGS_MAX_LINES = 5000
+
+# /tickers fan-out: symbols per request and concurrent upstream fetches
+TICKER_BULK_MAX_SYMBOLS = 50
+# Semaphore bound to the serving event loop: created by the app lifespan
+# (main.py) as app.state.ticker_bulk_semaphore
+TICKER_BULK_CONCURRENCY = 20
+
+# Ticker fields returned as floats by /ticker/{symbol}
+TICKER_PRICE_KEYS = ('mark_price', 'spot_price', 'close', 'high', 'low', 'open', 'volume')
+# Payloads are kept as (raw upstream body, parsed JSON)
+TickerPayload = Tuple[bytes, Dict[str, Any]]
+_ticker_cache: Dict[str, Tuple[float, TickerPayload]] = {}
+_ticker_inflight: Dict[str, "asyncio.Future[TickerPayload]"] = {}
+
+
+class _TickerFetchAbandoned(Exception):
+    """Set on a shared ticker fetch whose owning request was cancelled"""
+
+# Simplified /ticker/{symbol} bodies as (upstream timestamp, orjson bytes)
+_ticker_body_cache: Dict[str, Tuple[Any, bytes]] = {}
+
+
+@lru_cache(maxsize=4096)
+def _validate_client_cached(
+    client_id: str, email: str, generation: int, password_sha256: Optional[bytes] = None
+) -> Tuple[bool, str]:
+    """Memoized client_auth.validate_client_digest for normalized inputs"""
+    return client_auth.validate_client_digest(client_id, email, password_sha256)
+
+
+def validate_client_headers(client_id: str, email: str) -> Tuple[bool, str]:
+    """
+    Validate the X-SRP-Client-ID / X-SRP-Client-Email header pair.
+    
+    Inputs are normalized before hitting the cache so "A@b" and "a@b" share an
+    entry. Entries are keyed on the whitelist generation, so CSV edits picked
+    up by client_auth invalidate them automatically.
+    """
+    return _validate_normalized(client_id, email)
+
+
+def validate_login(client_id: str, email: str, password: Optional[str]) -> Tuple[bool, str]:
+    """
+    Validate /login credentials through the same cache as the headers.
+    
+    Only the password's SHA-256 digest is part of the cache key, so repeat
+    logins never keep the plaintext around.
+    """
+    return _validate_normalized(
+        client_id, email, password_digest(password) if password is not None else None
+    )
+
+
+def _validate_normalized(
+    client_id: Optional[str], email: Optional[str], password_sha256: Optional[bytes] = None
+) -> Tuple[bool, str]:
+    """
+    Normalize and validate through _validate_client_cached. Empty or
+    malformed pairs are answered directly so they can't evict cache entries.
+    """
+    client_id = (client_id or "").strip()
+    email = normalize_email(email or "")
+    if not client_id or not email or not is_well_formed(client_id, email):
+        return client_auth.validate_client_digest(client_id, email, password_sha256)
+    client_auth.refresh_if_changed()
+    return _validate_client_cached(client_id, email, client_auth.generation, password_sha256)
+
+
+def clear_client_validation_cache() -> None:
+    """Reload the CSV whitelist now and drop memoized client validations"""
+    client_auth.reload_clients()
+    _validate_client_cached.cache_clear()
+    logger.info("Client validation cache cleared")
+
+
+@dataclass(frozen=True, slots=True)
+class ClientContext:
+    """Authenticated SRP client (from the X-SRP-Client-* headers)"""
+    client_id: str
+    client_email: str
+
+
+@dataclass(frozen=True, slots=True)
+class SessionUser:
+    """Supabase-authenticated user that is on the CSV whitelist"""
+    email: str
+    client_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class TradingContext:
+    """Authenticated SRP client plus the Delta Exchange credentials to use"""
+    client_id: str
+    client_email: str
+    api_key: str
+    api_secret: str
+    base_url: str
+
+
+# Request headers shared by the auth dependencies below; each Header() is
+# built once at import instead of once per dependency signature
+SrpClientIdHeader = Annotated[str, Header(alias="X-SRP-Client-ID", description="Your SRP Client ID (required)")]
+SrpClientEmailHeader = Annotated[str, Header(alias="X-SRP-Client-Email", description="Your SRP Client Email (required)")]
+DeltaApiKeyHeader = Annotated[Optional[str], Header(alias="X-Delta-API-Key", description="Delta Exchange API Key (optional)")]
+DeltaApiSecretHeader = Annotated[Optional[str], Header(alias="X-Delta-API-Secret", description="Delta Exchange API Secret (optional)")]
+RequiredDeltaApiKeyHeader = Annotated[str, Header(alias="X-Delta-API-Key", description="Delta Exchange API Key (required, client-side only)")]
+RequiredDeltaApiSecretHeader = Annotated[str, Header(alias="X-Delta-API-Secret", description="Delta Exchange API Secret (required, client-side only)")]
+DeltaBaseUrlHeader = Annotated[Optional[str], Header(alias="X-Delta-Base-URL", description="Delta Exchange Base URL (optional)")]
+
+
+async def get_client_context(
+    x_srp_client_id: SrpClientIdHeader,
+    x_srp_client_email: SrpClientEmailHeader
+) -> ClientContext:
+    """
+    Dependency: validate the SRP client headers against the CSV whitelist.
+    
+    Raises:
+        HTTPException: 403 if the client ID / email pair is not whitelisted
+    """
+    is_valid, error_msg = validate_client_headers(x_srp_client_id, x_srp_client_email)
+    if not is_valid:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
+    return ClientContext(x_srp_client_id.strip(), normalize_email(x_srp_client_email))
+
+
+ClientCtx = Annotated[ClientContext, Depends(get_client_context)]
+
+
+async def get_trading_context(
+    client: ClientCtx,
+    x_delta_api_key: DeltaApiKeyHeader = None,
+    x_delta_api_secret: DeltaApiSecretHeader = None,
+    x_delta_base_url: DeltaBaseUrlHeader = None
+) -> TradingContext:
+    """
+    Dependency: authenticated client with Delta credentials from headers,
+    falling back to the server's environment configuration.
+    
+    Raises:
+        HTTPException: 401 if no API key/secret is available
+    """
+    api_key = x_delta_api_key or DELTA_API_KEY
+    api_secret = x_delta_api_secret or DELTA_API_SECRET
+    if not api_key or not api_secret:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="API credentials required (provide via headers or environment variables)"
+        )
+    return TradingContext(
+        client.client_id,
+        client.client_email,
+        api_key,
+        api_secret,
+        x_delta_base_url or DELTA_BASE_URL or DEFAULT_BASE_URL
+    )
+
+
+TradingCtx = Annotated[TradingContext, Depends(get_trading_context)]
+
+
+async def get_client_trading_context(
+    client: ClientCtx,
+    x_delta_api_key: RequiredDeltaApiKeyHeader,
+    x_delta_api_secret: RequiredDeltaApiSecretHeader,
+    x_delta_base_url: DeltaBaseUrlHeader = None
+) -> TradingContext:
+    """
+    Dependency: authenticated client with Delta credentials from headers only.
+    
+    CRITICAL: never falls back to server-stored credentials.
+    
+    Raises:
+        HTTPException: 401 if the API key/secret headers are empty
+    """
+    if not x_delta_api_key or not x_delta_api_secret:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Delta API credentials required via headers (client-side only)"
+        )
+    return TradingContext(
+        client.client_id,
+        client.client_email,
+        x_delta_api_key,
+        x_delta_api_secret,
+        x_delta_base_url or DEFAULT_BASE_URL
+    )
+
+
+ClientTradingCtx = Annotated[TradingContext, Depends(get_client_trading_context)]
+
+
+async def get_session_user(
+    current_user: Annotated[Dict[str, Any], Depends(get_current_user)]
+) -> SessionUser:
+    """
+    Dependency: the signed-in Supabase user, with the normalized email and
+    the client_id that get_current_user matched in the CSV whitelist.
+    
+    Raises:
+        HTTPException: 401 if the session has no email, 403 if not whitelisted
+    """
+    session_email = normalize_email(current_user.get("email") or "")
+    if not session_email:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User email not found in session. Please sign in again."
+        )
+    client_id = current_user.get("client_id")
+    if not client_id:
+        logger.warning("Access denied: User %s is not in CSV whitelist", session_email)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"User {session_email} is not authorized. Please contact administrator."
+        )
+    return SessionUser(session_email, client_id)
+
+
+SessionUserDep = Annotated[SessionUser, Depends(get_session_user)]
+
+
+def get_shared_http_client(request: Request) -> httpx.AsyncClient:
+    """The worker's pooled outbound client, opened by the app lifespan (main.py)"""
+    return getattr(request.app.state, "http_client", None) or get_http_client()
+
+
+SharedHttpClient = Annotated[httpx.AsyncClient, Depends(get_shared_http_client)]
 
 
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
-async def login(request: LoginRequest) -> LoginResponse:
+@limiter.limit(RATE_LIMIT_LOGIN)
+async def login(request: Request, credentials: LoginRequest) -> LoginResponse:
     """Validate client credentials from CSV"""
     try:
         # Validate client authentication with password
-        is_valid, error_msg = client_auth.validate_client(
-            request.srp_client_id,
-            request.srp_client_email,
-            request.srp_password
+        is_valid, error_msg = validate_login(
+            credentials.srp_client_id,
+            credentials.srp_client_email,
+            credentials.srp_password
         )
         
         if not is_valid:
@@ -61,7 +345,7 @@ async def login(request: LoginRequest) -> LoginResponse:
         )
     
     except Exception as e:
-        logger.error(f"Login error: {e}")
+        logger.error("Login error: %s", e)
         return LoginResponse(
             success=False,
             message="Login failed",
@@ -76,7 +360,7 @@ async def verify_client_email(
 ):
     """Check if provided SRP client credentials exist in whitelist CSV."""
     try:
-        normalized_email = email.strip().lower()
+        normalized_email = normalize_email(email)
         if not normalized_email:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -108,10 +392,23 @@ async def verify_client_email(
         )
 
 
-@router.post("/test-delta-connection", response_model=TestDeltaConnectionResponse, status_code=status.HTTP_200_OK)
+def _describe_connection_error(error_message: str) -> str:
+    """Map a failed connection test's exception text to a user-facing message"""
+    for pattern, message in CONNECTION_ERROR_MESSAGES:
+        if pattern.search(error_message):
+            return message
+    return error_message
+
+
+@router.post(
+    "/test-delta-connection",
+    response_model=TestDeltaConnectionResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(get_session_user)]
+)
 async def test_delta_connection(
     request: TestDeltaConnectionRequest,
-    current_user: Dict[str, Any] = Depends(get_current_user)
+    http_client: SharedHttpClient
 ) -> TestDeltaConnectionResponse:
     """
     Test Delta Exchange connection using provided credentials.
@@ -119,33 +416,16 @@ async def test_delta_connection(
     CRITICAL: Credentials are never stored on server.
     """
     try:
-        # Get email from Supabase session
-        session_email = current_user.get("email", "").strip().lower() if current_user else ""
-        
-        if not session_email:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User email not found in session. Please sign in again."
-            )
-        
-        # Validate email against CSV whitelist
-        is_valid, client_id = validate_email_against_csv(session_email)
-        if not is_valid:
-            logger.warning(f"Connection test denied: User {session_email} is not in CSV whitelist")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"User {session_email} is not authorized. Please contact administrator."
-            )
-        
         # Test connection using PositionsService (simple API call)
-        base_url = request.delta_base_url or "https://api.india.delta.exchange"
+        base_url = request.delta_base_url or DEFAULT_BASE_URL
         
         try:
             # Test connection by fetching positions
-            positions_data = PositionsService.get_all_positions(
+            positions_data = await PositionsService.get_all_positions(
                 api_key=request.delta_api_key,
                 api_secret=request.delta_api_secret,
-                base_url=base_url
+                base_url=base_url,
+                http_client=http_client
             )
             
             return TestDeltaConnectionResponse(
@@ -154,14 +434,8 @@ async def test_delta_connection(
                 message="Successfully connected to Delta Exchange"
             )
         except Exception as e:
-            logger.error(f"Delta Exchange connection test failed: {e}")
-            error_message = str(e)
-            if "401" in error_message or "Unauthorized" in error_message:
-                error_message = "Invalid API credentials"
-            elif "403" in error_message or "Forbidden" in error_message:
-                error_message = "API credentials are not authorized"
-            elif "timeout" in error_message.lower() or "network" in error_message.lower():
-                error_message = "Network error. Please check your internet connection."
+            logger.error("Delta Exchange connection test failed: %s", e)
+            error_message = _describe_connection_error(str(e))
             
             return TestDeltaConnectionResponse(
                 success=False,
@@ -172,7 +446,7 @@ async def test_delta_connection(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error testing Delta Exchange connection: {e}", exc_info=True)
+        logger.error("Error testing Delta Exchange connection: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
@@ -180,87 +454,55 @@ async def test_delta_connection(
 
 
 @router.post("/place-limit-order-wait", response_model=OrderResponse, status_code=status.HTTP_200_OK)
+@limiter.limit(RATE_LIMIT_ORDERS)
+@limiter.limit(RATE_LIMIT_ORDERS, key_func=get_client_id_key)
 async def place_limit_order_wait(
-    request: PlaceLimitOrderWaitRequest,
-    current_user: Dict[str, Any] = Depends(get_current_user),
-    x_srp_client_id: str = Header(..., alias="X-SRP-Client-ID", description="Your SRP Client ID (required)"),
-    x_srp_client_email: str = Header(..., alias="X-SRP-Client-Email", description="Your SRP Client Email (required)"),
-    x_delta_api_key: Optional[str] = Header(None, alias="X-Delta-API-Key", description="Delta Exchange API Key (optional)"),
-    x_delta_api_secret: Optional[str] = Header(None, alias="X-Delta-API-Secret", description="Delta Exchange API Secret (optional)"),
-    x_delta_base_url: Optional[str] = Header(None, alias="X-Delta-Base-URL", description="Delta Exchange Base URL (optional)")
+    request: Request,
+    order_request: PlaceLimitOrderWaitRequest,
+    user: SessionUserDep,
+    ctx: TradingCtx
 ) -> OrderResponse:
     """Place a stop-limit order that waits for price to reach entry level, with bracket SL/TP"""
     try:
-        # Get email from Supabase session (authenticated user)
-        session_email = current_user.get("email", "").strip().lower() if current_user else ""
-        
-        # Validate email from session against CSV whitelist
-        if not session_email:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User email not found in session. Please sign in again."
-            )
-        
-        # Validate email against CSV whitelist using email validator
-        is_valid, client_id = validate_email_against_csv(session_email)
-        if not is_valid:
-            logger.warning(f"Order placement denied: User {session_email} is not in CSV whitelist")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"User {session_email} is not authorized to place orders. Please contact administrator."
-            )
-        
-        # Validate that the email from session matches the email in headers (if provided)
-        header_email = x_srp_client_email.strip().lower() if x_srp_client_email else ""
-        if header_email and header_email != session_email:
-            logger.warning(f"Email mismatch: Session email {session_email} does not match header email {header_email}")
+        # Session user is whitelisted (checked by get_session_user); it must
+        # also match the email in the headers (if provided)
+        header_email = ctx.client_email
+        if header_email and header_email != user.email:
+            logger.warning("Email mismatch: Session email %s does not match header email %s", user.email, header_email)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Email mismatch. Please ensure you are using the correct account."
             )
         
-        # Validate client authentication (for backward compatibility)
-        is_valid, error_msg = client_auth.validate_client(x_srp_client_id, x_srp_client_email)
-        if not is_valid:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
-        
-        # Get API credentials
-        from config import DELTA_API_KEY, DELTA_API_SECRET, DELTA_BASE_URL
-        DEFAULT_BASE_URL = "https://api.india.delta.exchange"
-        api_key = x_delta_api_key or DELTA_API_KEY
-        api_secret = x_delta_api_secret or DELTA_API_SECRET
-        base_url = x_delta_base_url or DELTA_BASE_URL or DEFAULT_BASE_URL
-        
-        if not api_key or not api_secret:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="API credentials required"
-            )
-        
-        # Place the stop-limit order with brackets
-        success, order_data, error = trading_service.place_limit_order_wait(
-            entry_price=request.entry_price,
-            size=request.size,
-            side=request.side,
-            stop_loss_price=request.stop_loss_price,
-            take_profit_price=request.take_profit_price,
-            client_order_id=request.client_order_id,
-            product_id=request.product_id,
-            product_symbol=request.product_symbol,
-            symbol=request.symbol,
-            api_key=api_key,
-            api_secret=api_secret,
-            base_url=base_url,
-            wait_time_seconds=request.wait_time_seconds or 60
+        # Place the stop-limit order with brackets (async: waits for the fill
+        # with asyncio.sleep and calls Delta through the shared HTTP client)
+        success, order_data, error = await trading_service.place_limit_order_wait(
+            entry_price=order_request.entry_price,
+            size=order_request.size,
+            side=order_request.side,
+            stop_loss_price=order_request.stop_loss_price,
+            take_profit_price=order_request.take_profit_price,
+            client_order_id=order_request.client_order_id,
+            product_id=order_request.product_id,
+            product_symbol=order_request.product_symbol,
+            symbol=order_request.symbol,
+            api_key=ctx.api_key,
+            api_secret=ctx.api_secret,
+            base_url=ctx.base_url,
+            wait_time_seconds=order_request.wait_time_seconds or 60
         )
         
         if success:
-            order_id = order_data.get("id") if order_data else None
+            order_data = order_data or {}
+            order_id = order_data.get("id")
+            bracket_order = order_data.get("bracket_order")
+            bracket_order_error = order_data.get("bracket_order_error")
+            
             message = "Stop-limit order with bracket SL/TP placed successfully"
-            if order_data.get("bracket_order"):
-                message += " - Bracket orders placed"
-            elif order_data.get("bracket_order_error"):
-                message += f" - Note: {order_data.get('bracket_order_note', '')}"
+            if bracket_order:
+                message = f"{message} - Bracket orders placed"
+            elif bracket_order_error:
+                message = f"{message} - Note: {order_data.get('bracket_order_note', '')}"
             
             return OrderResponse(
                 success=True,
@@ -275,143 +517,275 @@ async def place_limit_order_wait(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Internal server error: {str(e)}")
 
 
-@router.get("/ticker/{symbol}")
-async def get_ticker(symbol: str):
+async def _fetch_ticker_data(http_client: httpx.AsyncClient, symbol: str) -> TickerPayload:
+    """
+    Fetch the Delta Exchange ticker payload for a symbol as (raw body, parsed JSON).
+    
+    Payloads are cached for TICKER_CACHE_TTL_SECONDS, and concurrent misses
+    for the same symbol await a single in-flight upstream request.
+    Failures are propagated to every waiter and never cached. If the request
+    that owns the fetch is cancelled (client disconnect), its waiters retry.
+    """
+    while True:
+        cached = _ticker_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < TICKER_CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        inflight = _ticker_inflight.get(symbol)
+        if inflight is None:
+            break
+        try:
+            return await asyncio.shield(inflight)
+        except _TickerFetchAbandoned:
+            continue
+    
+    future = asyncio.get_running_loop().create_future()
+    _ticker_inflight[symbol] = future
+    try:
+        base_url = DELTA_BASE_URL or DEFAULT_BASE_URL
+        # Shared pooled client: warm requests reuse the kept-alive HTTP/2 connection
+        response = await http_client.get(
+            f"{base_url}/v2/tickers/{symbol}",
+            headers={'Accept': 'application/json'}
+        )
+        response.raise_for_status()
+        payload = (response.content, orjson.loads(response.content))
+    except asyncio.CancelledError:
+        # Don't cancel the other waiters: they start (or join) a new fetch
+        future.set_exception(_TickerFetchAbandoned())
+        future.exception()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved so a waiter-less failure isn't logged by asyncio
+        raise
+    else:
+        future.set_result(payload)
+        _ticker_cache.pop(symbol, None)
+        if len(_ticker_cache) >= TICKER_CACHE_MAX_SYMBOLS:
+            # Evict the least recently fetched symbol (dicts keep insertion order)
+            del _ticker_cache[next(iter(_ticker_cache))]
+        _ticker_cache[symbol] = (time.monotonic(), payload)
+        return payload
+    finally:
+        _ticker_inflight.pop(symbol, None)
+
+
+def _simplify_ticker(ticker_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the simplified /ticker response from a Delta ticker result"""
+    return {
+        "success": True,
+        "symbol": ticker_data.get("symbol"),
+        # Missing/empty/zero prices are reported as None
+        **{key: float(value) if (value := ticker_data.get(key)) else None for key in TICKER_PRICE_KEYS},
+        "timestamp": ticker_data.get("timestamp"),
+        "full_data": ticker_data  # Include full data for reference
+    }
+
+
+def _simplified_ticker_body(symbol: str, ticker_data: Dict[str, Any]) -> bytes:
+    """
+    Serialized _simplify_ticker() response for a symbol, reused while the
+    upstream ticker timestamp is unchanged (cache hits and repeat polls)
+    """
+    timestamp = ticker_data.get("timestamp")
+    cached = _ticker_body_cache.get(symbol)
+    if cached is not None and timestamp is not None and cached[0] == timestamp:
+        return cached[1]
+    # The payload is plain JSON from Delta, so orjson can serialize
+    # full_data without jsonable_encoder
+    body = orjson.dumps(_simplify_ticker(ticker_data))
+    _ticker_body_cache.pop(symbol, None)
+    if len(_ticker_body_cache) >= TICKER_CACHE_MAX_SYMBOLS:
+        del _ticker_body_cache[next(iter(_ticker_body_cache))]
+    _ticker_body_cache[symbol] = (timestamp, body)
+    return body
+
+
+@router.get("/ticker/{symbol}", response_class=ORJSONResponse)
+@limiter.limit(RATE_LIMIT_TICKER)
+async def get_ticker(
+    request: Request,
+    http_client: SharedHttpClient,
+    symbol: str,
+    raw: bool = Query(False, description="Return Delta's ticker response body unchanged")
+):
     """
     Get ticker data for a product by symbol from Delta Exchange.
     No authentication required - this is a public API endpoint.
     
     Args:
         symbol: Product symbol (e.g., BTCUSD, ETHUSD)
+        raw: If True, forward the upstream body as-is (no re-serialization)
     
     Returns:
         Ticker data including mark_price, spot_price, volume, etc.
     """
     try:
-        base_url = DELTA_BASE_URL or "https://api.india.delta.exchange"
-        url = f"{base_url}/v2/tickers/{symbol}"
+        body, data = await _fetch_ticker_data(http_client, symbol)
         
-        headers = {
-            'Accept': 'application/json'
-        }
-        
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        if data.get("success") and data.get("result"):
+            if raw:
+                # Upstream bytes already follow Delta's {success, result} schema
+                return Response(content=body, media_type="application/json")
             
-            if data.get("success") and data.get("result"):
-                ticker_data = data["result"]
-                # Return a simplified response with key price information
-                return {
-                    "success": True,
-                    "symbol": ticker_data.get("symbol"),
-                    "mark_price": float(ticker_data.get("mark_price", 0)) if ticker_data.get("mark_price") else None,
-                    "spot_price": float(ticker_data.get("spot_price", 0)) if ticker_data.get("spot_price") else None,
-                    "close": float(ticker_data.get("close", 0)) if ticker_data.get("close") else None,
-                    "high": float(ticker_data.get("high", 0)) if ticker_data.get("high") else None,
-                    "low": float(ticker_data.get("low", 0)) if ticker_data.get("low") else None,
-                    "open": float(ticker_data.get("open", 0)) if ticker_data.get("open") else None,
-                    "volume": float(ticker_data.get("volume", 0)) if ticker_data.get("volume") else None,
-                    "timestamp": ticker_data.get("timestamp"),
-                    "full_data": ticker_data  # Include full data for reference
-                }
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Ticker data not found for symbol: {symbol}"
-                )
+            # Return a simplified response with key price information,
+            # re-serialized only when the ticker timestamp changes
+            return Response(content=_simplified_ticker_body(symbol, data["result"]), media_type="application/json")
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Ticker data not found for symbol: {symbol}"
+            )
     
+    except HTTPException:
+        raise
     except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error fetching ticker for {symbol}: {e}")
+        logger.error("HTTP error fetching ticker for %s: %s", symbol, e)
         raise HTTPException(
             status_code=e.response.status_code,
             detail=f"Failed to fetch ticker data: {str(e)}"
         )
     except httpx.RequestError as e:
-        logger.error(f"Request error fetching ticker for {symbol}: {e}")
+        logger.error("Request error fetching ticker for %s: %s", symbol, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Unable to connect to Delta Exchange API: {str(e)}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error fetching ticker for {symbol}: {e}")
+        logger.error("Unexpected error fetching ticker for %s: %s", symbol, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 
+@router.get("/tickers", response_class=ORJSONResponse)
+@limiter.limit(RATE_LIMIT_TICKER)
+async def get_tickers(
+    request: Request,
+    http_client: SharedHttpClient,
+    symbols: str = Query(..., description="Comma-separated product symbols (e.g., BTCUSD,ETHUSD)")
+):
+    """
+    Get ticker data for several symbols in one call.
+    No authentication required - this is a public API endpoint.
+    
+    Symbols are fetched concurrently (at most TICKER_BULK_CONCURRENCY upstream
+    requests at a time, sharing the /ticker cache).
+    
+    Args:
+        symbols: Comma-separated product symbols, up to TICKER_BULK_MAX_SYMBOLS
+    
+    Returns:
+        {"success": True, "results": {symbol: ticker or null}}; a symbol is
+        null when Delta has no ticker for it or the fetch failed
+    """
+    requested = list(dict.fromkeys(sym.strip() for sym in symbols.split(",") if sym.strip()))
+    if not requested:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="At least one symbol is required")
+    if len(requested) > TICKER_BULK_MAX_SYMBOLS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {TICKER_BULK_MAX_SYMBOLS} symbols per request"
+        )
+    
+    semaphore: asyncio.Semaphore = request.app.state.ticker_bulk_semaphore
+    
+    async def fetch_one(symbol: str) -> Optional[Dict[str, Any]]:
+        # Any failure only nulls this symbol; letting it escape the TaskGroup
+        # would fail the whole request
+        try:
+            async with semaphore:
+                _, data = await _fetch_ticker_data(http_client, symbol)
+            if data.get("success") and data.get("result"):
+                return _simplify_ticker(data["result"])
+        except Exception as e:
+            logger.warning("Error fetching ticker for %s: %s", symbol, e)
+        return None
+    
+    async with asyncio.TaskGroup() as task_group:
+        tasks = {symbol: task_group.create_task(fetch_one(symbol)) for symbol in requested}
+    
+    return ORJSONResponse({
+        "success": True,
+        "results": {symbol: task.result() for symbol, task in tasks.items()}
+    })
+
+
+def _static_json(payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Serialize a payload that is constant for the life of the process, with
+    headers that let browsers cache it and revalidate with If-None-Match.
+    """
+    body = orjson.dumps(payload)
+    return body, {
+        "Cache-Control": "public, max-age=300",
+        "ETag": f'"{hashlib.sha1(body).hexdigest()}"',
+    }
+
+
+def _static_json_response(request: Request, body: bytes, headers: Dict[str, str]) -> Response:
+    """Response for a _static_json() payload (304 when the client's ETag matches)"""
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+PRICE_FETCH_INTERVAL_BODY, PRICE_FETCH_INTERVAL_HEADERS = _static_json(
+    {"interval_seconds": PRICE_FETCH_INTERVAL_SECONDS}
+)
+
+
 @router.get("/price-fetch-interval")
-async def get_price_fetch_interval():
+async def get_price_fetch_interval(request: Request):
     """
     Get the configured price fetch interval in seconds.
     This is used by the frontend to know how often to poll for price updates.
     """
-    return {
-        "interval_seconds": PRICE_FETCH_INTERVAL_SECONDS
-    }
+    return _static_json_response(request, PRICE_FETCH_INTERVAL_BODY, PRICE_FETCH_INTERVAL_HEADERS)
 
 
 # Strategy endpoints
 @router.post("/strategies/breakout/start", response_model=StartStrategyResponse, status_code=status.HTTP_200_OK)
+@limiter.limit(RATE_LIMIT_ORDERS)
+@limiter.limit(RATE_LIMIT_ORDERS, key_func=get_client_id_key)
 async def start_breakout_strategy(
-    request: StartStrategyRequest,
-    x_srp_client_id: str = Header(..., alias="X-SRP-Client-ID", description="Your SRP Client ID (required)"),
-    x_srp_client_email: str = Header(..., alias="X-SRP-Client-Email", description="Your SRP Client Email (required)"),
-    x_delta_api_key: Optional[str] = Header(None, alias="X-Delta-API-Key", description="Delta Exchange API Key (optional)"),
-    x_delta_api_secret: Optional[str] = Header(None, alias="X-Delta-API-Secret", description="Delta Exchange API Secret (optional)"),
-    x_delta_base_url: Optional[str] = Header(None, alias="X-Delta-Base-URL", description="Delta Exchange Base URL (optional)")
+    request: Request,
+    strategy_request: StartStrategyRequest,
+    ctx: TradingCtx
 ) -> StartStrategyResponse:
     """
     Start a new breakout strategy instance.
     Strategy runs continuously in background until explicitly stopped.
     """
     try:
-        # Validate client authentication
-        is_valid, error_msg = client_auth.validate_client(x_srp_client_id, x_srp_client_email)
-        if not is_valid:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
-        
-        # Get API credentials (from headers or environment)
-        api_key = x_delta_api_key or DELTA_API_KEY
-        api_secret = x_delta_api_secret or DELTA_API_SECRET
-        base_url = x_delta_base_url or DELTA_BASE_URL or "https://api.india.delta.exchange"
-        
-        if not api_key or not api_secret:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="API credentials required (provide via headers or environment variables)"
-            )
-        
-        # Prepare configuration dict
-        config_dict = request.config.model_dump()
+        # Prepare configuration dict (unset optionals are left out; the
+        # strategy reads them with .get() defaults)
+        config_dict = strategy_request.config.model_dump(exclude_none=True)
         
         # Add API credentials to config
-        if not config_dict.get('api'):
-            config_dict['api'] = {}
-        config_dict['api']['api_key'] = api_key
-        config_dict['api']['api_secret'] = api_secret
-        config_dict['api']['base_url'] = base_url
+        config_dict.setdefault('api', {}).update(
+            api_key=ctx.api_key,
+            api_secret=ctx.api_secret,
+            base_url=ctx.base_url
+        )
         
         # Auto-calculate reset_interval_minutes if not provided
         if not config_dict['schedule'].get('reset_interval_minutes'):
             timeframe = config_dict['schedule']['timeframe']
-            timeframe_map = {
-                '1m': 1, '3m': 3, '5m': 5, '15m': 15, '30m': 30,
-                '1h': 60, '2h': 120, '4h': 240, '6h': 360,
-                '1d': 1440, '1w': 10080
-            }
-            config_dict['schedule']['reset_interval_minutes'] = timeframe_map.get(timeframe, 60)
+            config_dict['schedule']['reset_interval_minutes'] = TIMEFRAME_MINUTES.get(timeframe, 60)
         
-        # Start strategy
+        # Start strategy. Off the event loop: it takes the manager lock, which
+        # a concurrent stop holds while cancelling orders and joining threads.
         strategy_manager = get_strategy_manager()
-        strategy_id = strategy_manager.start_strategy(
-            strategy_type=request.strategy_type,
+        strategy_id = await run_in_threadpool(
+            strategy_manager.start_strategy,
+            strategy_type=strategy_request.strategy_type,
             config=config_dict
         )
         
@@ -425,7 +799,7 @@ async def start_breakout_strategy(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error starting strategy: {e}", exc_info=True)
+        logger.error("Error starting strategy: %s", e, exc_info=True)
         return StartStrategyResponse(
             success=False,
             strategy_id=None,
@@ -434,23 +808,18 @@ async def start_breakout_strategy(
         )
 
 
-@router.post("/strategies/{strategy_id}/stop", response_model=StopStrategyResponse, status_code=status.HTTP_200_OK)
+@router.post("/strategies/{strategy_id}/stop", response_model=StopStrategyResponse, status_code=status.HTTP_200_OK, dependencies=[Depends(get_client_context)])
 async def stop_strategy(
-    strategy_id: str,
-    x_srp_client_id: str = Header(..., alias="X-SRP-Client-ID", description="Your SRP Client ID (required)"),
-    x_srp_client_email: str = Header(..., alias="X-SRP-Client-Email", description="Your SRP Client Email (required)")
+    strategy_id: str
 ) -> StopStrategyResponse:
     """
     Stop a specific running strategy instance.
     """
     try:
-        # Validate client authentication
-        is_valid, error_msg = client_auth.validate_client(x_srp_client_id, x_srp_client_email)
-        if not is_valid:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
-        
+        # Blocking (order cancel request + thread joins of up to ~7s), so it
+        # runs in the worker thread pool
         strategy_manager = get_strategy_manager()
-        success = strategy_manager.stop_strategy(strategy_id)
+        success = await run_in_threadpool(strategy_manager.stop_strategy, strategy_id)
         
         if success:
             return StopStrategyResponse(
@@ -468,7 +837,7 @@ async def stop_strategy(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error stopping strategy: {e}", exc_info=True)
+        logger.error("Error stopping strategy: %s", e, exc_info=True)
         return StopStrategyResponse(
             success=False,
             message="Failed to stop strategy",
@@ -476,57 +845,55 @@ async def stop_strategy(
         )
 
 
-@router.get("/strategies", response_model=StrategyListResponse, status_code=status.HTTP_200_OK)
-async def get_all_strategies(
-    x_srp_client_id: str = Header(..., alias="X-SRP-Client-ID", description="Your SRP Client ID (required)"),
-    x_srp_client_email: str = Header(..., alias="X-SRP-Client-Email", description="Your SRP Client Email (required)")
-) -> StrategyListResponse:
+@router.get(
+    "/strategies",
+    response_model=None,
+    responses={200: {"model": StrategyListResponse}},
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(get_client_context)]
+)
+async def get_all_strategies() -> ORJSONResponse:
     """
     Get list of all strategy instances (running and stopped).
     """
     try:
-        # Validate client authentication
-        is_valid, error_msg = client_auth.validate_client(x_srp_client_id, x_srp_client_email)
-        if not is_valid:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
-        
         strategy_manager = get_strategy_manager()
-        strategies_data = strategy_manager.get_all_strategies()
-        
-        strategies = [StrategyStatusResponse(**status) for status in strategies_data]
+        # Threadpool: the manager lock is held by in-progress starts/stops
+        strategies_data = await run_in_threadpool(strategy_manager.get_all_strategies)
         
-        return StrategyListResponse(
-            strategies=strategies,
-            total=len(strategies)
-        )
+        # Server-built status dicts (StrategyStatusResponse shape): serialized
+        # straight to JSON without a Pydantic validate/dump pass
+        return ORJSONResponse({
+            "strategies": strategies_data,
+            "total": len(strategies_data)
+        })
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting strategies: {e}", exc_info=True)
+        logger.error("Error getting strategies: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 
-@router.get("/strategies/{strategy_id}", response_model=StrategyStatusResponse, status_code=status.HTTP_200_OK)
+@router.get(
+    "/strategies/{strategy_id}",
+    response_model=None,
+    responses={200: {"model": StrategyStatusResponse}},
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(get_client_context)]
+)
 async def get_strategy_status(
-    strategy_id: str,
-    x_srp_client_id: str = Header(..., alias="X-SRP-Client-ID", description="Your SRP Client ID (required)"),
-    x_srp_client_email: str = Header(..., alias="X-SRP-Client-Email", description="Your SRP Client Email (required)")
-) -> StrategyStatusResponse:
+    strategy_id: str
+) -> ORJSONResponse:
     """
     Get status and details of a specific strategy instance.
     """
     try:
-        # Validate client authentication
-        is_valid, error_msg = client_auth.validate_client(x_srp_client_id, x_srp_client_email)
-        if not is_valid:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
-        
         strategy_manager = get_strategy_manager()
-        status_data = strategy_manager.get_strategy_status(strategy_id)
+        status_data = await run_in_threadpool(strategy_manager.get_strategy_status, strategy_id)
         
         if not status_data:
             raise HTTPException(
@@ -534,36 +901,35 @@ async def get_strategy_status(
                 detail=f"Strategy {strategy_id} not found"
             )
         
-        return StrategyStatusResponse(**status_data)
+        return ORJSONResponse(status_data)
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting strategy status: {e}", exc_info=True)
+        logger.error("Error getting strategy status: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 
-@router.get("/strategies/{strategy_id}/logs", response_model=StrategyLogsResponse, status_code=status.HTTP_200_OK)
+@router.get(
+    "/strategies/{strategy_id}/logs",
+    response_model=None,
+    responses={200: {"model": StrategyLogsResponse}},
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(get_client_context)]
+)
 async def get_strategy_logs(
     strategy_id: str,
-    limit: int = 100,
-    x_srp_client_id: str = Header(..., alias="X-SRP-Client-ID", description="Your SRP Client ID (required)"),
-    x_srp_client_email: str = Header(..., alias="X-SRP-Client-Email", description="Your SRP Client Email (required)")
-) -> StrategyLogsResponse:
+    limit: int = Query(100, ge=1, le=STRATEGY_LOGS_MAX_LINES, description="Number of most recent log lines")
+) -> ORJSONResponse:
     """
     Get logs from a specific strategy instance.
     """
     try:
-        # Validate client authentication
-        is_valid, error_msg = client_auth.validate_client(x_srp_client_id, x_srp_client_email)
-        if not is_valid:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
-        
         strategy_manager = get_strategy_manager()
-        logs = strategy_manager.get_strategy_logs(strategy_id, limit=limit)
+        logs = await run_in_threadpool(strategy_manager.get_strategy_logs, strategy_id, limit=limit)
         
         if logs is None:
             raise HTTPException(
@@ -571,250 +937,291 @@ async def get_strategy_logs(
                 detail=f"Strategy {strategy_id} not found or logs not available"
             )
         
-        return StrategyLogsResponse(
-            strategy_id=strategy_id,
-            logs=logs
-        )
+        return ORJSONResponse({
+            "strategy_id": strategy_id,
+            "logs": logs
+        })
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting strategy logs: {e}", exc_info=True)
+        logger.error("Error getting strategy logs: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 
+def _model_response(model: BaseModel) -> Response:
+    """
+    JSON response for an already-validated model: pydantic-core serializes it
+    directly, skipping FastAPI's response_model re-validation and encoding.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 # Positions and Orders endpoints - CRITICAL: Only accept credentials via headers, never from server storage
-@router.get("/positions", response_model=PositionResponse, status_code=status.HTTP_200_OK)
+@router.get("/positions", response_model=None, responses={200: {"model": PositionResponse}}, status_code=status.HTTP_200_OK)
 async def get_positions(
-    x_srp_client_id: str = Header(..., alias="X-SRP-Client-ID", description="Your SRP Client ID (required)"),
-    x_srp_client_email: str = Header(..., alias="X-SRP-Client-Email", description="Your SRP Client Email (required)"),
-    x_delta_api_key: str = Header(..., alias="X-Delta-API-Key", description="Delta Exchange API Key (required, client-side only)"),
-    x_delta_api_secret: str = Header(..., alias="X-Delta-API-Secret", description="Delta Exchange API Secret (required, client-side only)"),
-    x_delta_base_url: Optional[str] = Header(None, alias="X-Delta-Base-URL", description="Delta Exchange Base URL (optional)")
-) -> PositionResponse:
+    ctx: ClientTradingCtx,
+    http_client: SharedHttpClient
+) -> Response:
     """
     Get all margined positions.
     CRITICAL: API credentials are only accepted via headers (client-side only, never stored on server).
     """
     try:
-        # Validate client authentication
-        is_valid, error_msg = client_auth.validate_client(x_srp_client_id, x_srp_client_email)
-        if not is_valid:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
-        
-        # CRITICAL: Only use credentials from headers, never from server storage
-        base_url = x_delta_base_url or "https://api.india.delta.exchange"
-        
-        if not x_delta_api_key or not x_delta_api_secret:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Delta API credentials required via headers (client-side only)"
-            )
-        
         # Get positions using PositionsService
-        positions_data = PositionsService.get_all_positions(
-            api_key=x_delta_api_key,
-            api_secret=x_delta_api_secret,
-            base_url=base_url
+        positions_data = await PositionsService.get_all_positions(
+            api_key=ctx.api_key,
+            api_secret=ctx.api_secret,
+            base_url=ctx.base_url,
+            http_client=http_client
         )
         
-        # Convert to Position models
-        from models import Position
-        positions = [Position(**pos) for pos in positions_data]
-        
-        return PositionResponse(
-            success=True,
-            positions=positions
-        )
+        # Validate the whole list in one pass and serialize it in Rust
+        return _model_response(PositionResponse.model_validate({"success": True, "positions": positions_data}))
     
     except HTTPException:
         raise
     except ValueError as e:
-        logger.error(f"Validation error fetching positions: {e}")
+        logger.error("Validation error fetching positions: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Error fetching positions: {e}", exc_info=True)
+        logger.error("Error fetching positions: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 
-@router.get("/orders/history", response_model=OrderHistoryResponse, status_code=status.HTTP_200_OK)
+@router.get("/orders/history", response_model=None, responses={200: {"model": OrderHistoryResponse}}, status_code=status.HTTP_200_OK)
 async def get_order_history(
+    ctx: ClientTradingCtx,
+    http_client: SharedHttpClient,
     page_size: int = 100,
-    after: Optional[str] = None,
-    x_srp_client_id: str = Header(..., alias="X-SRP-Client-ID", description="Your SRP Client ID (required)"),
-    x_srp_client_email: str = Header(..., alias="X-SRP-Client-Email", description="Your SRP Client Email (required)"),
-    x_delta_api_key: str = Header(..., alias="X-Delta-API-Key", description="Delta Exchange API Key (required, client-side only)"),
-    x_delta_api_secret: str = Header(..., alias="X-Delta-API-Secret", description="Delta Exchange API Secret (required, client-side only)"),
-    x_delta_base_url: Optional[str] = Header(None, alias="X-Delta-Base-URL", description="Delta Exchange Base URL (optional)")
-) -> OrderHistoryResponse:
+    after: Optional[str] = None
+) -> Response:
     """
     Get order history with pagination.
     CRITICAL: API credentials are only accepted via headers (client-side only, never stored on server).
     """
     try:
-        # Validate client authentication
-        is_valid, error_msg = client_auth.validate_client(x_srp_client_id, x_srp_client_email)
-        if not is_valid:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
-        
-        # CRITICAL: Only use credentials from headers, never from server storage
-        base_url = x_delta_base_url or "https://api.india.delta.exchange"
-        
-        if not x_delta_api_key or not x_delta_api_secret:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Delta API credentials required via headers (client-side only)"
-            )
-        
         # Validate page_size
         if page_size < 1 or page_size > 500:
             page_size = 100
         
         # Get order history using OrdersService
-        order_history_data = OrdersService.get_order_history(
-            api_key=x_delta_api_key,
-            api_secret=x_delta_api_secret,
-            base_url=base_url,
+        order_history_data = await OrdersService.get_order_history(
+            api_key=ctx.api_key,
+            api_secret=ctx.api_secret,
+            base_url=ctx.base_url,
             page_size=page_size,
-            after=after
+            after=after,
+            http_client=http_client
         )
         
-        # Convert to OrderHistoryItem models
-        from models import OrderHistoryItem, OrderHistoryMeta
-        orders = [OrderHistoryItem(**order) for order in order_history_data.get('result', [])]
-        meta = OrderHistoryMeta(**order_history_data.get('meta', {})) if order_history_data.get('meta') else None
-        
-        return OrderHistoryResponse(
-            success=True,
-            result=orders,
-            meta=meta
-        )
+        # Validate every order before responding (malformed orders -> 400)
+        return _model_response(OrderHistoryResponse.model_validate({
+            "success": True,
+            "result": order_history_data.get('result', []),
+            "meta": order_history_data.get('meta') or None,
+        }))
     
     except HTTPException:
         raise
     except ValueError as e:
-        logger.error(f"Validation error fetching order history: {e}")
+        logger.error("Validation error fetching order history: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Error fetching order history: {e}", exc_info=True)
+        logger.error("Error fetching order history: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 
-@router.get("/pnl", response_model=PnLSummaryResponse, status_code=status.HTTP_200_OK)
+@router.get("/pnl", response_model=None, responses={200: {"model": PnLSummaryResponse}}, status_code=status.HTTP_200_OK)
 async def get_pnl_summary(
-    x_srp_client_id: str = Header(..., alias="X-SRP-Client-ID", description="Your SRP Client ID (required)"),
-    x_srp_client_email: str = Header(..., alias="X-SRP-Client-Email", description="Your SRP Client Email (required)"),
-    x_delta_api_key: str = Header(..., alias="X-Delta-API-Key", description="Delta Exchange API Key (required, client-side only)"),
-    x_delta_api_secret: str = Header(..., alias="X-Delta-API-Secret", description="Delta Exchange API Secret (required, client-side only)"),
-    x_delta_base_url: Optional[str] = Header(None, alias="X-Delta-Base-URL", description="Delta Exchange Base URL (optional)")
-) -> PnLSummaryResponse:
+    ctx: ClientTradingCtx,
+    http_client: SharedHttpClient
+) -> ORJSONResponse:
     """
     Get PnL summary including total, realized, and unrealized PnL.
     CRITICAL: API credentials are only accepted via headers (client-side only, never stored on server).
     """
     try:
-        # Validate client authentication
-        is_valid, error_msg = client_auth.validate_client(x_srp_client_id, x_srp_client_email)
-        if not is_valid:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
-        
-        # CRITICAL: Only use credentials from headers, never from server storage
-        base_url = x_delta_base_url or "https://api.india.delta.exchange"
-        
-        if not x_delta_api_key or not x_delta_api_secret:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Delta API credentials required via headers (client-side only)"
-            )
-        
         # Get PnL summary using PnLService
-        pnl_summary = PnLService.get_pnl_summary(
-            api_key=x_delta_api_key,
-            api_secret=x_delta_api_secret,
-            base_url=base_url
+        pnl_summary = await PnLService.get_pnl_summary(
+            api_key=ctx.api_key,
+            api_secret=ctx.api_secret,
+            base_url=ctx.base_url,
+            http_client=http_client
         )
         
-        # Convert to PnLBySymbol models
-        from models import PnLBySymbol
-        pnl_by_symbol = [PnLBySymbol(**item) for item in pnl_summary.get('pnl_by_symbol', [])]
-        
-        return PnLSummaryResponse(
-            success=True,
-            total_pnl=pnl_summary['total_pnl'],
-            total_realized_pnl=pnl_summary['total_realized_pnl'],
-            total_unrealized_pnl=pnl_summary['total_unrealized_pnl'],
-            position_count=pnl_summary['position_count'],
-            pnl_by_symbol=pnl_by_symbol
-        )
+        # Server-computed floats/counts (PnLSummaryResponse shape): serialized
+        # straight to JSON without a Pydantic validate/dump pass
+        return ORJSONResponse({
+            "success": True,
+            "total_pnl": pnl_summary['total_pnl'],
+            "total_realized_pnl": pnl_summary['total_realized_pnl'],
+            "total_unrealized_pnl": pnl_summary['total_unrealized_pnl'],
+            "position_count": pnl_summary['position_count'],
+            "pnl_by_symbol": pnl_summary.get('pnl_by_symbol', [])
+        })
     
     except HTTPException:
         raise
     except ValueError as e:
-        logger.error(f"Validation error fetching PnL summary: {e}")
+        logger.error("Validation error fetching PnL summary: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Error fetching PnL summary: {e}", exc_info=True)
+        logger.error("Error fetching PnL summary: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 
-@router.get("/polling-interval", response_model=PollingIntervalResponse, status_code=status.HTTP_200_OK)
-async def get_polling_interval() -> PollingIntervalResponse:
+POLLING_INTERVAL_BODY, POLLING_INTERVAL_HEADERS = _static_json(PollingIntervalResponse(
+    interval_seconds=POSITIONS_POLLING_INTERVAL_SECONDS,
+    min_interval=1,
+    max_interval=5
+).model_dump())
+
+
+@router.get(
+    "/polling-interval",
+    response_model=None,
+    responses={200: {"model": PollingIntervalResponse}},
+    status_code=status.HTTP_200_OK
+)
+async def get_polling_interval(request: Request) -> Response:
     """
     Get the configured polling interval for positions/orders updates.
     """
-    return PollingIntervalResponse(
-        interval_seconds=POSITIONS_POLLING_INTERVAL_SECONDS,
-        min_interval=1,
-        max_interval=5
-    )
+    return _static_json_response(request, POLLING_INTERVAL_BODY, POLLING_INTERVAL_HEADERS)
 
 
 @router.get("/fear-greed-index", status_code=status.HTTP_200_OK)
-async def get_fear_greed_index() -> Dict[str, Any]:
+async def get_fear_greed_index(response: Response, http_client: SharedHttpClient) -> Dict[str, Any]:
     """
     Get Fear & Greed Index from CoinMarketCap API.
     This endpoint does NOT require authentication - it's a public market indicator.
     Only requires CRYPTO_MARKET_API_KEY to be configured on the server.
     
-    Implements caching to avoid rate limiting (5 minute cache TTL).
+    Implements caching to avoid rate limiting (CoinMarketCap's max-age, 5
+    minutes by default). Requests that miss the cache together share a single
+    upstream refresh, and the last value is served stale if the refresh fails
+    or while backing off after a 429. X-Cache (HIT, MISS or STALE) and
+    X-Cache-TTL (seconds until expiry) describe the cache state.
     """
-    global _fear_greed_cache, _fear_greed_cache_time
+    global _fear_greed_refresh
+    
+    # Check cache first
+    now = time.time()
+    if _fear_greed_cache and now < _fear_greed_expires_at:
+        logger.debug("Returning cached Fear & Greed Index (expires in %.1fs)", _fear_greed_expires_at - now)
+        _set_fear_greed_cache_headers(response, "HIT")
+        return _fear_greed_cache
+    
+    # Rate limited by CoinMarketCap: don't call it again until Retry-After passes
+    if now < _fear_greed_backoff_until:
+        if _fear_greed_cache:
+            _set_fear_greed_cache_headers(response, "STALE")
+            return _fear_greed_cache
+        raise _fear_greed_rate_limited(_fear_greed_backoff_until - now)
+    
+    # Shielded: a cancelled request doesn't cancel the refresh other requests await
+    if _fear_greed_refresh is None:
+        _fear_greed_refresh = asyncio.create_task(_refresh_fear_greed_index(http_client))
+        _fear_greed_refresh.add_done_callback(_clear_fear_greed_refresh)
+    result, fresh = await asyncio.shield(_fear_greed_refresh)
+    _set_fear_greed_cache_headers(response, "MISS" if fresh else "STALE")
+    return result
+
+
+def _set_fear_greed_cache_headers(response: Response, cache_state: str) -> None:
+    """Set X-Cache / X-Cache-TTL for a Fear & Greed Index response"""
+    remaining = _fear_greed_expires_at - time.time()
+    response.headers["X-Cache"] = cache_state
+    response.headers["X-Cache-TTL"] = str(max(int(remaining), 0))
+
+
+def _fear_greed_rate_limited(retry_after: float) -> HTTPException:
+    """429 for the Fear & Greed Index, telling the client when to retry"""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Rate limit exceeded. Please try again in a few minutes.",
+        headers={"Retry-After": str(max(int(retry_after), 1))}
+    )
+
+
+def _cache_max_age(response: httpx.Response) -> int:
+    """Upstream Cache-Control max-age clamped to the allowed TTL range (default TTL if absent)"""
+    match = _MAX_AGE_RE.search(response.headers.get("Cache-Control", ""))
+    if match is None:
+        return FEAR_GREED_CACHE_TTL
+    return max(FEAR_GREED_MIN_TTL, min(FEAR_GREED_MAX_TTL, int(match.group(1))))
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date)"""
+    value = response.headers.get("Retry-After", "").strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return float(FEAR_GREED_DEFAULT_RETRY_AFTER)
+
+
+def _clear_fear_greed_refresh(task: "asyncio.Task[Tuple[Dict[str, Any], bool]]") -> None:
+    """Done-callback: let the next cache miss start a new refresh"""
+    global _fear_greed_refresh
+    if _fear_greed_refresh is task:
+        _fear_greed_refresh = None
+
+
+async def _refresh_fear_greed_index(http_client: httpx.AsyncClient) -> Tuple[Dict[str, Any], bool]:
+    """
+    Fetch the index from CoinMarketCap and cache it.
+    
+    Returns:
+        (result, fresh): on upstream errors the last cached value (even if
+        expired) is returned with fresh=False instead, if there is one
+    """
+    try:
+        return await _fetch_fear_greed_index(http_client), True
+    except HTTPException as e:
+        if _fear_greed_cache:
+            logger.info("Returning stale cached Fear & Greed Index (%s)", e.detail)
+            return _fear_greed_cache, False
+        raise
+
+
+async def _fetch_fear_greed_index(http_client: httpx.AsyncClient) -> Dict[str, Any]:
+    """
+    Fetch the index from CoinMarketCap and cache it.
+    
+    Raises:
+        HTTPException: for a missing API key and any upstream failure
+    """
+    global _fear_greed_cache, _fear_greed_expires_at, _fear_greed_backoff_until
     
     try:
-        logger.info("Fear & Greed Index endpoint called")
-        
-        # Check cache first
         current_time = time.time()
-        if _fear_greed_cache and _fear_greed_cache_time:
-            cache_age = current_time - _fear_greed_cache_time
-            if cache_age < FEAR_GREED_CACHE_TTL:
-                logger.info(f"Returning cached Fear & Greed Index (age: {cache_age:.1f}s)")
-                return _fear_greed_cache
-        
-        # Get API key from environment
-        api_key = os.getenv("CRYPTO_MARKET_API_KEY")
-        if not api_key:
+        
+        if _fear_greed_headers is None:
             logger.error("CRYPTO_MARKET_API_KEY is not configured in environment variables")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -824,188 +1231,130 @@ async def get_fear_greed_index() -> Dict[str, Any]:
         logger.info("Fetching Fear & Greed Index from CoinMarketCap API...")
         
         # Fetch from CoinMarketCap API using latest endpoint
-        base_url = "https://pro-api.coinmarketcap.com/v3/fear-and-greed/latest"
-        headers = {
-            'X-CMC_PRO_API_KEY': api_key,
-            'Accept': 'application/json',
-            'Accept-Encoding': 'deflate, gzip'
-        }
-        
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.debug(f"Making request to CoinMarketCap API: {base_url}")
-                response = await client.get(base_url, headers=headers)
-                logger.debug(f"CoinMarketCap API response status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Check error_code (can be string '0' or integer 0)
-                    error_code = data.get('status', {}).get('error_code')
-                    if error_code == 0 or error_code == '0' or str(error_code) == '0':
-                        # The /latest endpoint returns data directly, not in an array
-                        index_data = data.get('data', {})
-                        
-                        if index_data:
-                            value = index_data.get('value', 50)
-                            classification = index_data.get('value_classification', 'Neutral')
-                            update_time = index_data.get('update_time', '')
-                            logger.info(f"Fear & Greed Index fetched successfully: {value} ({classification})")
-                            
-                            # Cache the result
-                            result = {
-                                "success": True,
-                                "data": {
-                                    "value": value,
-                                    "value_classification": classification,
-                                    "update_time": update_time,
-                                }
-                            }
-                            _fear_greed_cache = result
-                            _fear_greed_cache_time = current_time
-                            
-                            return result
-                        else:
-                            logger.warning("CoinMarketCap API returned empty data")
-                            # Return cached data if available, even if expired
-                            if _fear_greed_cache:
-                                logger.info("Returning stale cached data due to empty API response")
-                                return _fear_greed_cache
-                            raise HTTPException(
-                                status_code=status.HTTP_404_NOT_FOUND,
-                                detail="No Fear & Greed Index data available"
-                            )
-                    else:
-                        error_msg = data.get('status', {}).get('error_message', 'Unknown error')
-                        logger.error(f"CoinMarketCap API error: error_code={error_code}, message={error_msg}")
-                        # Return cached data if available on API error
-                        if _fear_greed_cache:
-                            logger.info("Returning cached data due to API error")
-                            return _fear_greed_cache
-                        raise HTTPException(
-                            status_code=status.HTTP_502_BAD_GATEWAY,
-                            detail=f"CoinMarketCap API error: {error_msg}"
-                        )
-                elif response.status_code == 429:
-                    # Rate limited - return cached data if available
-                    logger.warning("CoinMarketCap API rate limited (429). Returning cached data if available.")
-                    if _fear_greed_cache:
-                        logger.info("Returning cached data due to rate limit")
-                        return _fear_greed_cache
-                    raise HTTPException(
-                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                        detail="Rate limit exceeded. Please try again in a few minutes."
-                    )
-                else:
-                    response_text = response.text[:500]  # Limit log size
-                    logger.error(f"CoinMarketCap API HTTP error {response.status_code}: {response_text}")
-                    # Return cached data if available on HTTP error
-                    if _fear_greed_cache:
-                        logger.info(f"Returning cached data due to HTTP {response.status_code} error")
-                        return _fear_greed_cache
-                    raise HTTPException(
-                        status_code=status.HTTP_502_BAD_GATEWAY,
-                        detail=f"Failed to fetch Fear & Greed Index: HTTP {response.status_code}"
-                    )
+            logger.debug("Making request to CoinMarketCap API: %s", FEAR_GREED_URL)
+            response = await http_client.get(FEAR_GREED_URL, headers=_fear_greed_headers, timeout=FEAR_GREED_TIMEOUT)
+            logger.debug("CoinMarketCap API response status: %s", response.status_code)
         except httpx.TimeoutException as e:
-            logger.error(f"Timeout while fetching Fear & Greed Index from CoinMarketCap API: {e}")
-            # Return cached data if available on timeout
-            if _fear_greed_cache:
-                logger.info("Returning cached data due to timeout")
-                return _fear_greed_cache
+            logger.error("Timeout while fetching Fear & Greed Index from CoinMarketCap API: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_504_GATEWAY_TIMEOUT,
                 detail="Request to CoinMarketCap API timed out. Please try again later."
             )
         except httpx.RequestError as e:
-            logger.error(f"Request error while fetching Fear & Greed Index: {e}", exc_info=True)
-            # Return cached data if available on request error
-            if _fear_greed_cache:
-                logger.info("Returning cached data due to request error")
-                return _fear_greed_cache
+            logger.error("Request error while fetching Fear & Greed Index: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
                 detail=f"Failed to connect to CoinMarketCap API: {str(e)}"
             )
+        
+        if response.status_code == 429:
+            retry_after = _retry_after_seconds(response)
+            logger.warning("CoinMarketCap API rate limited (429), backing off for %.0fs", retry_after)
+            _fear_greed_backoff_until = time.time() + retry_after
+            raise _fear_greed_rate_limited(retry_after)
+        if response.status_code != 200:
+            response_text = response.text[:500]  # Limit log size
+            logger.error("CoinMarketCap API HTTP error %s: %s", response.status_code, response_text)
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"Failed to fetch Fear & Greed Index: HTTP {response.status_code}"
+            )
+        
+        data = orjson.loads(response.content)
+        
+        # Check error_code (can be string '0' or integer 0)
+        error_code = data.get('status', {}).get('error_code')
+        if str(error_code) != '0':
+            error_msg = data.get('status', {}).get('error_message', 'Unknown error')
+            logger.error("CoinMarketCap API error: error_code=%s, message=%s", error_code, error_msg)
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"CoinMarketCap API error: {error_msg}"
+            )
+        
+        # The /latest endpoint returns data directly, not in an array
+        index_data = data.get('data', {})
+        if not index_data:
+            logger.warning("CoinMarketCap API returned empty data")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No Fear & Greed Index data available"
+            )
+        
+        value = index_data.get('value', 50)
+        classification = index_data.get('value_classification', 'Neutral')
+        update_time = index_data.get('update_time', '')
+        logger.info("Fear & Greed Index fetched successfully: %s (%s)", value, classification)
+        
+        # Cache the result
+        result = {
+            "success": True,
+            "data": {
+                "value": value,
+                "value_classification": classification,
+                "update_time": update_time,
+            }
+        }
+        _fear_greed_cache = result
+        _fear_greed_expires_at = current_time + _cache_max_age(response)
+        
+        return result
     
     except HTTPException:
         # Re-raise HTTP exceptions (they're already logged)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error fetching Fear & Greed Index: {e}", exc_info=True)
-        # Return cached data if available on unexpected error
-        if _fear_greed_cache:
-            logger.info("Returning cached data due to unexpected error")
-            return _fear_greed_cache
+        logger.error("Unexpected error fetching Fear & Greed Index: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 
-@router.get("/trades/history", response_model=TradeHistoryResponse, status_code=status.HTTP_200_OK)
+@router.get("/trades/history", response_model=None, responses={200: {"model": TradeHistoryResponse}}, status_code=status.HTTP_200_OK)
 async def get_trade_history(
+    ctx: ClientTradingCtx,
+    http_client: SharedHttpClient,
     page_size: int = 100,
-    after: Optional[str] = None,
-    x_srp_client_id: str = Header(..., alias="X-SRP-Client-ID", description="Your SRP Client ID (required)"),
-    x_srp_client_email: str = Header(..., alias="X-SRP-Client-Email", description="Your SRP Client Email (required)"),
-    x_delta_api_key: str = Header(..., alias="X-Delta-API-Key", description="Delta Exchange API Key (required, client-side only)"),
-    x_delta_api_secret: str = Header(..., alias="X-Delta-API-Secret", description="Delta Exchange API Secret (required, client-side only)"),
-    x_delta_base_url: Optional[str] = Header(None, alias="X-Delta-Base-URL", description="Delta Exchange Base URL (optional)")
-) -> TradeHistoryResponse:
+    after: Optional[str] = None
+) -> Response:
     """
     Get trade history (fills) with pagination.
     CRITICAL: API credentials are only accepted via headers (client-side only, never stored on server).
     """
     try:
-        # Validate client authentication
-        is_valid, error_msg = client_auth.validate_client(x_srp_client_id, x_srp_client_email)
-        if not is_valid:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_msg)
-        
-        # CRITICAL: Only use credentials from headers, never from server storage
-        base_url = x_delta_base_url or "https://api.india.delta.exchange"
-        
-        if not x_delta_api_key or not x_delta_api_secret:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Delta API credentials required via headers (client-side only)"
-            )
-        
         # Validate page_size
         if page_size < 1 or page_size > 500:
             page_size = 100
         
         # Get trade history using OrdersService
-        trade_history_data = OrdersService.get_trade_history(
-            api_key=x_delta_api_key,
-            api_secret=x_delta_api_secret,
-            base_url=base_url,
+        trade_history_data = await OrdersService.get_trade_history(
+            api_key=ctx.api_key,
+            api_secret=ctx.api_secret,
+            base_url=ctx.base_url,
             page_size=page_size,
-            after=after
+            after=after,
+            http_client=http_client
         )
         
-        # Convert to TradeHistoryItem models
-        from models import TradeHistoryItem, TradeHistoryMeta
-        trades = [TradeHistoryItem(**trade) for trade in trade_history_data.get('result', [])]
-        meta = TradeHistoryMeta(**trade_history_data.get('meta', {})) if trade_history_data.get('meta') else None
-        
-        return TradeHistoryResponse(
-            success=True,
-            result=trades,
-            meta=meta
-        )
+        # Validate the whole upstream payload in one call (malformed fills -> 400)
+        return _model_response(TradeHistoryResponse.model_validate({
+            "success": True,
+            "result": trade_history_data.get('result', []),
+            "meta": trade_history_data.get('meta') or None,
+        }))
     
     except HTTPException:
         raise
     except ValueError as e:
-        logger.error(f"Validation error fetching trade history: {e}")
+        logger.error("Validation error fetching trade history: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Error fetching trade history: {e}", exc_info=True)
+        logger.error("Error fetching trade history: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
@@ -5,17 +5,24 @@ Separate router for Supabase authentication endpoints.
 """
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import Dict, Any
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any, Optional
 from pydantic import BaseModel, EmailStr
+from supabase import Client
 
-from models import UserInfoResponse
+from models import Auth0User, UserInfoResponse
+from auth.client_auth import normalize_email
 from auth.supabase.middleware import get_current_user
-from auth.supabase.config import get_supabase_config
+from auth.supabase.client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+# Users fetched per admin list_users() call while looking up an email
+USER_LOOKUP_PAGE_SIZE = 200
+
 # Create separate router for Supabase routes
-router = APIRouter(prefix="/api/v1/supabase", tags=["supabase"])
+router = APIRouter(prefix="/api/v1/supabase", tags=["supabase"], default_response_class=ORJSONResponse)
 
 
 class ConfirmEmailRequest(BaseModel):
@@ -38,8 +45,6 @@ async def get_current_user_info(
     Returns Supabase user info along with client_id from CSV whitelist.
     """
     try:
-        from models import Auth0User  # Reuse Auth0User model structure
-        
         user = Auth0User(
             email=current_user["email"],
             sub=current_user["sub"],
@@ -55,13 +60,30 @@ async def get_current_user_info(
         )
     
     except Exception as e:
-        logger.error(f"Error getting user info: {e}", exc_info=True)
+        logger.error("Error getting user info: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 
+def _find_user_by_email(admin_client: Client, email: str) -> Optional[Any]:
+    """
+    Page through Supabase users until one matches email (blocking).
+    
+    Returns:
+        The matching user, or None if no user has this email
+    """
+    email = normalize_email(email)
+    page = 1
+    while True:
+        users = admin_client.auth.admin.list_users(page=page, per_page=USER_LOOKUP_PAGE_SIZE)
+        user = next((u for u in users if normalize_email(u.email or "") == email), None)
+        if user is not None or len(users) < USER_LOOKUP_PAGE_SIZE:
+            return user
+        page += 1
+
+
 @router.post("/confirm-email", response_model=ConfirmEmailResponse, status_code=status.HTTP_200_OK)
 async def confirm_user_email(request: ConfirmEmailRequest) -> ConfirmEmailResponse:
     """
@@ -73,22 +95,17 @@ async def confirm_user_email(request: ConfirmEmailRequest) -> ConfirmEmailRespon
     WARNING: This should be disabled or restricted in production!
     """
     try:
-        config = get_supabase_config()
-        if not config:
+        # Shared service-role client (keeps its connection between requests)
+        admin_client = get_supabase_client()
+        if not admin_client:
             return ConfirmEmailResponse(
                 success=False,
                 message="Supabase not configured",
                 error="Supabase configuration is missing"
             )
         
-        from supabase import create_client
-        
-        # Create admin client with service role key
-        admin_client = create_client(config.url, config.service_role_key)
-        
-        # Find user by email
-        users_response = admin_client.auth.admin.list_users()
-        user = next((u for u in users_response.data.users if u.email == request.email), None)
+        # Find user by email (the Supabase client is blocking: keep it off the event loop)
+        user = await run_in_threadpool(_find_user_by_email, admin_client, request.email)
         
         if not user:
             return ConfirmEmailResponse(
@@ -102,10 +119,10 @@ async def confirm_user_email(request: ConfirmEmailRequest) -> ConfirmEmailRespon
             "email_confirm": True
         }
         
-        response = admin_client.auth.admin.update_user_by_id(user.id, update_data)
+        response = await run_in_threadpool(admin_client.auth.admin.update_user_by_id, user.id, update_data)
         
         if response.user and response.user.email_confirmed_at:
-            logger.info(f"Email confirmed for user: {request.email}")
+            logger.info("Email confirmed for user: %s", request.email)
             return ConfirmEmailResponse(
                 success=True,
                 message=f"Email confirmed successfully for {request.email}",
@@ -119,7 +136,7 @@ async def confirm_user_email(request: ConfirmEmailRequest) -> ConfirmEmailRespon
             )
     
     except Exception as e:
-        logger.error(f"Error confirming email: {e}", exc_info=True)
+        logger.error("Error confirming email: %s", e, exc_info=True)
         return ConfirmEmailResponse(
             success=False,
             message="Internal server error",
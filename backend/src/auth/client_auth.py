@@ -2,68 +2,181 @@
 Client authentication module for validating client credentials
 """
 import csv
+import hashlib
+import hmac
 import os
+import re
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 
-# Path to client credentials CSV file
-# Go up 3 levels from backend/src/auth/client_auth.py to reach backend directory
-# Then go to privatedata/srp_client_trading.csv
-CSV_FILE_PATH = Path(__file__).parent.parent.parent / "privatedata" / "srp_client_trading.csv"
+# Path to client credentials CSV file: CLIENT_CSV_PATH if set, otherwise go up
+# 3 levels from backend/src/auth/client_auth.py to reach backend directory,
+# then go to privatedata/srp_client_trading.csv
+CSV_FILE_PATH = Path(
+    os.getenv("CLIENT_CSV_PATH")
+    or Path(__file__).parent.parent.parent / "privatedata" / "srp_client_trading.csv"
+).resolve()
+
+# How often (at most) validation stats the CSV to pick up edits
+RELOAD_CHECK_INTERVAL_SECONDS = 1.0
+
+# Shape of (normalized) client IDs and emails; anything else is rejected
+# before the whitelist is consulted
+CLIENT_ID_PATTERN = re.compile(r"[A-Za-z0-9_\-]{1,64}")
+EMAIL_PATTERN = re.compile(r"[^@\s]{1,64}@[^@\s]{1,255}")
+
+# In-memory whitelist entry: (client_id, password_digest() or None if the CSV has no password)
+ClientRecord = Tuple[str, Optional[bytes]]
+
+
+def password_digest(password: str) -> bytes:
+    """SHA-256 of a stripped password, as compared by validate_client_digest"""
+    return hashlib.sha256(password.strip().encode()).digest()
+
+
+def normalize_email(email: str) -> str:
+    """Whitelist key for an email: stripped and case-folded"""
+    return email.strip().casefold()
+
+
+def is_well_formed(client_id: str, email: str) -> bool:
+    """True if a stripped client ID / email pair could possibly be whitelisted"""
+    return CLIENT_ID_PATTERN.fullmatch(client_id) is not None and EMAIL_PATTERN.fullmatch(email) is not None
+
+
+def _column_index(header: List[str], *names: str) -> Optional[int]:
+    """Position of the first of names present in a CSV header row, or None"""
+    columns = [column.strip() for column in header]
+    for name in names:
+        if name in columns:
+            return columns.index(name)
+    return None
+
+
+def _cell(row: List[str], index: Optional[int]) -> str:
+    """Stripped value at index, or '' if the column is absent or the row is short"""
+    if index is None or index >= len(row):
+        return ''
+    return row[index].strip()
 
 
 class ClientAuth:
     """Client authentication handler"""
     
-    def __init__(self, csv_path: Optional[Path] = None):
+    def __init__(self, csv_path: Optional[Path] = None, load: bool = True):
         """
         Initialize client authentication
         
         Args:
             csv_path: Optional path to CSV file. Defaults to privatedata/srp_client_trading.csv
+            load: Load the CSV into memory now (False for one-pass consumers of iter_clients)
         """
         self.csv_path = csv_path or CSV_FILE_PATH
-        self.clients: Dict[str, Dict[str, str]] = {}
-        self._load_clients()
+        self.clients: Dict[str, ClientRecord] = {}
+        # (st_mtime_ns, st_size) of the CSV as last loaded; None if missing
+        self._file_key: Optional[Tuple[int, int]] = None
+        self._last_reload_check = 0.0
+        # Serializes reloads across threadpool workers
+        self._reload_lock = threading.Lock()
+        # Incremented on every (re)load so callers can key caches on it
+        self.generation = 0
+        if load:
+            self._load_clients()
     
-    def _load_clients(self):
-        """Load client credentials from CSV file"""
+    def iter_clients(self) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """
+        Stream client credentials from the CSV file one row at a time.
+        
+        Yields:
+            (email, client_data) tuples; client_data has client_id, email, password
+        """
         if not self.csv_path.exists():
             print(f"CSV file not found at: {self.csv_path}")
             return
         
-        # Try multiple encodings to handle different CSV formats
+        # Try multiple encodings to handle different CSV formats. A decode
+        # error can surface mid-file, so rows already yielded are skipped on retry.
         encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'iso-8859-1']
+        rows_done = 0
         
         for encoding in encodings:
             try:
-                with open(self.csv_path, 'r', encoding=encoding) as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # Get email and client_id from CSV (handle various column name variations)
-                        email = (row.get('srp_client_emailid', '') or row.get('srp_client_email', '') or '').strip()
-                        client_id = (row.get('srp_client_id', '') or '').strip()
-                        # Password is optional - check if column exists
-                        password = (row.get('srp_client_password', '') or row.get('password', '') or '').strip()
+                with open(self.csv_path, 'r', encoding=encoding, newline='') as f:
+                    reader = csv.reader(f)
+                    # Resolve column positions once from the header (handle
+                    # various column name variations) instead of a dict per row
+                    header = next(reader, [])
+                    email_col = _column_index(header, 'srp_client_emailid', 'srp_client_email')
+                    client_id_col = _column_index(header, 'srp_client_id')
+                    # Password is optional - may have no column
+                    password_col = _column_index(header, 'srp_client_password', 'password')
+                    
+                    for row_number, row in enumerate(reader):
+                        if row_number < rows_done:
+                            continue
+                        rows_done += 1
+                        
+                        email = _cell(row, email_col)
+                        client_id = _cell(row, client_id_col)
+                        password = _cell(row, password_col)
                         
                         # Skip empty rows
                         if not email or not client_id:
                             continue
                         
-                        # Store client by email (primary key)
-                        self.clients[email] = {
+                        yield email, {
                             'client_id': client_id,
                             'email': email,
                             'password': password  # May be empty if not in CSV
                         }
-                print(f"Loaded {len(self.clients)} clients from CSV file")
-                break  # Successfully loaded, exit loop
+                return  # Successfully read, stop trying encodings
             except UnicodeDecodeError:
                 continue
             except Exception as e:
                 # If all encodings fail, log and continue
                 print(f"Error loading clients CSV: {e}")
-                break
+                return
+    
+    def _get_file_key(self) -> Optional[Tuple[int, int]]:
+        """(mtime in ns, size) of the CSV file, or None if it doesn't exist"""
+        try:
+            st = os.stat(self.csv_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+    
+    def _load_clients(self):
+        """Load client credentials from CSV file"""
+        self._file_key = self._get_file_key()
+        # Store clients by normalize_email() (primary key), with interned client
+        # IDs and the password pre-hashed; built aside and swapped in so lookups
+        # never see a half-loaded dict
+        clients = {
+            normalize_email(email): (
+                sys.intern(client_data['client_id']),
+                password_digest(client_data['password']) if client_data['password'] else None
+            )
+            for email, client_data in self.iter_clients()
+        }
+        self.clients = clients
+        self.generation += 1
+        if self._file_key is not None:
+            print(f"Loaded {len(self.clients)} clients from CSV file")
+    
+    def refresh_if_changed(self):
+        """Reload the CSV if it changed, statting it at most once per RELOAD_CHECK_INTERVAL_SECONDS"""
+        now = time.monotonic()
+        if now - self._last_reload_check < RELOAD_CHECK_INTERVAL_SECONDS:
+            return
+        self._last_reload_check = now
+        if self._get_file_key() != self._file_key:
+            with self._reload_lock:
+                # Another thread may have reloaded while we waited
+                if self._get_file_key() != self._file_key:
+                    self._load_clients()
     
     def validate_client(self, client_id: str, email: str, password: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -74,46 +187,67 @@ class ClientAuth:
             email: Client email to validate
             password: Client password to validate (optional - only validated if present in CSV)
         
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        return self.validate_client_digest(
+            client_id, email, password_digest(password) if password is not None else None
+        )
+    
+    def validate_client_digest(self, client_id: str, email: str, password_sha256: Optional[bytes] = None) -> Tuple[bool, str]:
+        """
+        Validate client credentials, taking the password as its password_digest().
+        
+        Same checks as validate_client; lets callers cache results without
+        holding plaintext passwords.
+        
+        Args:
+            client_id: Client ID to validate
+            email: Client email to validate
+            password_sha256: password_digest() of the password (optional)
+        
         Returns:
             Tuple of (is_valid, error_message)
         """
         if not client_id or not email:
             return False, "Client ID and email are required"
         
-        email = email.strip().lower()
+        email = normalize_email(email)
         client_id = client_id.strip()
         
-        # Reload clients from CSV to ensure we have latest data
-        self.reload_clients()
+        # Reject malformed input without touching the whitelist
+        if not is_well_formed(client_id, email):
+            return False, "Invalid credentials format"
+        
+        # Pick up CSV edits (cheap: at most one stat per second)
+        self.refresh_if_changed()
         
         # Check if we have any clients loaded
         if not self.clients:
             return False, "No clients found in database. Please check CSV file."
         
         # Check if email exists in clients
-        if email not in self.clients:
+        record = self.clients.get(email)
+        if record is None:
             return False, "Invalid or unauthorized client email"
         
         # Check if client_id matches
-        stored_client_id = self.clients[email].get('client_id', '').strip()
+        stored_client_id, stored_password_sha256 = record
         if stored_client_id != client_id:
             return False, "Invalid or unauthorized client ID"
         
         # If password is provided, validate it only if password exists in CSV for this client
-        if password is not None:
-            stored_password = self.clients[email].get('password', '').strip()
-            # Only validate password if it exists in CSV (not empty)
-            if stored_password:
-                if stored_password != password.strip():
-                    return False, "Invalid password"
-            # If password not in CSV, skip password validation (password is optional)
+        # (if password not in CSV, skip password validation - password is optional)
+        if password_sha256 is not None and stored_password_sha256 is not None:
+            if not hmac.compare_digest(stored_password_sha256, password_sha256):
+                return False, "Invalid password"
         
         return True, "Valid client"
     
     def reload_clients(self):
-        """Reload client credentials from CSV file"""
-        self.clients.clear()
-        self._load_clients()
+        """Force a reload of client credentials from CSV file"""
+        with self._reload_lock:
+            self._load_clients()
     
     def validate_user_email(self, email: str) -> bool:
         """
@@ -128,8 +262,8 @@ class ClientAuth:
         if not email:
             return False
         
-        email = email.strip().lower()
-        self.reload_clients()
+        email = normalize_email(email)
+        self.refresh_if_changed()
         return email in self.clients
     
     def get_client_id_by_email(self, email: str) -> Optional[str]:
@@ -145,13 +279,11 @@ class ClientAuth:
         if not email:
             return None
         
-        email = email.strip().lower()
-        self.reload_clients()
-        
-        if email in self.clients:
-            return self.clients[email].get('client_id')
+        email = normalize_email(email)
+        self.refresh_if_changed()
         
-        return None
+        record = self.clients.get(email)
+        return record[0] if record is not None else None
 
 
 # Create singleton instance
@@ -3,7 +3,7 @@ Email validation middleware for backend API routes
 Validates user email against CSV whitelist
 """
 from typing import Tuple, Optional
-from auth.client_auth import client_auth
+from auth.client_auth import client_auth, normalize_email
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,26 +24,14 @@ def validate_email_against_csv(email: str) -> Tuple[bool, Optional[str]]:
     if not email:
         return False, None
     
-    email = email.strip().lower()
+    email = normalize_email(email)
     
-    # Check if email exists in CSV whitelist
-    is_whitelisted = client_auth.validate_user_email(email)
-    
-    if not is_whitelisted:
-        logger.warning(f"Email validation failed: {email} is not in CSV whitelist")
-        return False, None
-    
-    # Get client_id from CSV
+    # Single in-memory lookup: rows without a client_id are never loaded
     client_id = client_auth.get_client_id_by_email(email)
     
     if not client_id:
-        logger.warning(f"Email found in whitelist but client_id not found for: {email}")
+        logger.warning("Email validation failed: %s is not in CSV whitelist", email)
         return False, None
     
-    logger.info(f"Email validated successfully: {email} (client_id: {client_id})")
+    logger.debug("Email validated successfully: %s (client_id: %s)", email, client_id)
     return True, client_id
-
-
-
-
-
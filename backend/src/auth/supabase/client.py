@@ -29,7 +29,8 @@ def get_supabase_client() -> Optional[Client]:
     
     config = get_supabase_config()
     if not config:
-        logger.warning("Cannot create Supabase client: configuration not available")
+        # get_supabase_config() has already warned (once) about the missing settings
+        logger.debug("Cannot create Supabase client: configuration not available")
         return None
     
     try:
@@ -37,7 +38,7 @@ def get_supabase_client() -> Optional[Client]:
         logger.info("Supabase client created successfully")
         return _client
     except Exception as e:
-        logger.error(f"Failed to create Supabase client: {e}")
+        logger.error("Failed to create Supabase client: %s", e)
         return None
 
 
@@ -52,7 +53,8 @@ def get_supabase_client_anon() -> Optional[Client]:
     """
     config = get_supabase_config()
     if not config:
-        logger.warning("Cannot create Supabase client: configuration not available")
+        # get_supabase_config() has already warned (once) about the missing settings
+        logger.debug("Cannot create Supabase client: configuration not available")
         return None
     
     if not config.anon_key:
@@ -62,7 +64,7 @@ def get_supabase_client_anon() -> Optional[Client]:
     try:
         return create_client(config.url, config.anon_key)
     except Exception as e:
-        logger.error(f"Failed to create Supabase client with anon key: {e}")
+        logger.error("Failed to create Supabase client with anon key: %s", e)
         return None
 
 
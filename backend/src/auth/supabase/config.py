@@ -11,65 +11,71 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SupabaseConfig:
-    """Supabase configuration"""
+    """Supabase configuration (immutable; use from_env to build it)"""
     url: str
     service_role_key: str
     anon_key: Optional[str] = None
+    # JWT secret for verifying access tokens locally (admin API lookup if unset)
+    jwt_secret: Optional[str] = None
     
-    def __post_init__(self):
-        """Validate configuration after initialization"""
-        if not self.url:
+    @classmethod
+    def from_env(cls) -> "SupabaseConfig":
+        """
+        Build and validate the configuration from environment variables.
+        
+        Raises:
+            ValueError: If SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY is not set
+        """
+        url = os.getenv("SUPABASE_URL")
+        service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+        if not url:
             raise ValueError("SUPABASE_URL is required")
-        if not self.service_role_key:
+        if not service_role_key:
             raise ValueError("SUPABASE_SERVICE_ROLE_KEY is required")
         
-        # Remove trailing slash from URL if present
-        self.url = self.url.rstrip("/")
+        return cls(
+            # Remove trailing slash from URL if present
+            url=url.rstrip("/"),
+            service_role_key=service_role_key,
+            anon_key=os.getenv("SUPABASE_ANON_KEY"),
+            jwt_secret=os.getenv("SUPABASE_JWT_SECRET"),
+        )
 
 
 _config: Optional[SupabaseConfig] = None
+# Environment is read once; a missing/invalid configuration is remembered too
+_config_loaded = False
 
 
 def get_supabase_config() -> Optional[SupabaseConfig]:
     """
     Get Supabase configuration from environment variables.
     
+    Resolved on first call (after .env has been loaded) and memoized,
+    including the unconfigured case, so per-request callers don't re-read
+    the environment or repeat the warning.
+    
     Returns:
         SupabaseConfig instance if all required variables are set, None otherwise.
     """
-    global _config
+    global _config, _config_loaded
     
-    if _config is not None:
+    if _config_loaded:
         return _config
+    _config_loaded = True
     
-    url = os.getenv("SUPABASE_URL")
-    service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-    anon_key = os.getenv("SUPABASE_ANON_KEY")
-    
-    if not url or not service_role_key:
+    try:
+        _config = SupabaseConfig.from_env()
+    except ValueError as e:
         logger.warning(
-            "Supabase is not fully configured. "
+            "Supabase is not fully configured (%s). "
             "Required: SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY. "
-            "Optional: SUPABASE_ANON_KEY"
+            "Optional: SUPABASE_ANON_KEY, SUPABASE_JWT_SECRET",
+            e,
         )
         return None
     
-    try:
-        _config = SupabaseConfig(
-            url=url,
-            service_role_key=service_role_key,
-            anon_key=anon_key
-        )
-        logger.info("Supabase configuration loaded successfully")
-        return _config
-    except ValueError as e:
-        logger.error(f"Invalid Supabase configuration: {e}")
-        return None
-
-
-
-
-
-
+    logger.info("Supabase configuration loaded successfully")
+    return _config
@@ -3,16 +3,117 @@ Supabase Authentication Middleware
 
 FastAPI dependency functions for Supabase authentication.
 """
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 from fastapi import Depends, HTTPException, status, Header
+from fastapi.concurrency import run_in_threadpool
+from jose import ExpiredSignatureError, JWTError, jwt
+from jose.exceptions import JWTClaimsError
 from supabase import Client
 
 from .client import get_supabase_client
+from .config import get_supabase_config
 from ..client_auth import client_auth
 
 logger = logging.getLogger(__name__)
 
+# Resolved users are reused for repeat requests with the same token, for at
+# most AUTH_CACHE_TTL_SECONDS and never past the token's exp claim. Keyed by a
+# token digest (the raw token is never stored):
+# digest -> (expires_at, whitelist generation, user dict)
+AUTH_CACHE_TTL_SECONDS = 30.0
+AUTH_CACHE_MAX_ENTRIES = 10000
+_verified_users: Dict[bytes, Tuple[float, int, Dict[str, Any]]] = {}
+
+
+def _token_digest(token: str) -> bytes:
+    """Cache key for a bearer token"""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def _cache_verified_user(digest: bytes, user: Dict[str, Any], token_exp: Optional[Any]) -> None:
+    """Remember a resolved user until the TTL or the token's expiry, whichever is first"""
+    expires_at = time.time() + AUTH_CACHE_TTL_SECONDS
+    if isinstance(token_exp, (int, float)):
+        expires_at = min(expires_at, token_exp)
+    _verified_users.pop(digest, None)
+    if len(_verified_users) >= AUTH_CACHE_MAX_ENTRIES:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _verified_users[next(iter(_verified_users))]
+    _verified_users[digest] = (expires_at, client_auth.generation, user)
+
+
+def _invalid_token(detail: str) -> HTTPException:
+    """401 asking the client to re-authenticate"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _verify_token_locally(token: str, jwt_secret: str) -> Dict[str, Any]:
+    """
+    Verify a Supabase access token's HS256 signature, audience and expiry.
+    
+    Returns:
+        The token's claims (sub, aud and exp are guaranteed present)
+    
+    Raises:
+        HTTPException: 401 if the token is invalid or expired
+    """
+    try:
+        return jwt.decode(
+            token,
+            jwt_secret,
+            algorithms=["HS256"],
+            audience="authenticated",
+            options={"require_aud": True, "require_exp": True, "require_sub": True},
+        )
+    except JWTError as e:
+        logger.debug("Rejected Supabase token: %s", e)
+        raise _invalid_token("Invalid or expired token")
+
+
+async def _verify_token_with_admin_api(supabase_client: Client, token: str) -> Tuple[Dict[str, Any], Any]:
+    """
+    Resolve a token's user through the Supabase admin API (used when
+    SUPABASE_JWT_SECRET is not configured).
+    
+    Returns:
+        (unverified claims, Supabase user)
+    
+    Raises:
+        HTTPException: 401 if the token is malformed/expired or the user doesn't exist
+    """
+    # Decode token without signature verification first to get user ID
+    # (expired or incomplete tokens are rejected here, without a network call)
+    try:
+        claims = jwt.decode(
+            token,
+            None,
+            options={"verify_signature": False, "verify_aud": False, "require_exp": True, "require_sub": True},
+        )
+    except (ExpiredSignatureError, JWTClaimsError):
+        raise _invalid_token("Invalid or expired token")
+    except JWTError:
+        raise _invalid_token("Invalid token format")
+    
+    user_id = claims.get("sub")
+    if not user_id:
+        raise _invalid_token("Invalid token: missing user ID")
+    
+    # Then use admin API to get user details (admin API will verify the user
+    # exists). The SDK call is blocking network I/O, so it runs in the worker
+    # thread pool.
+    user_response = await run_in_threadpool(supabase_client.auth.admin.get_user_by_id, user_id)
+    if not user_response.user:
+        raise _invalid_token("User not found")
+    
+    return claims, user_response.user
+
 
 async def get_current_user(
     authorization: Optional[str] = Header(None, alias="Authorization")
@@ -20,8 +121,9 @@ async def get_current_user(
     """
     FastAPI dependency function to get current authenticated user from Supabase.
     
-    Extracts JWT token from Authorization header, verifies it with Supabase,
-    and validates user against CSV whitelist (if enabled).
+    Extracts JWT token from Authorization header, verifies it (locally with
+    SUPABASE_JWT_SECRET if set, otherwise with the Supabase admin API), and
+    validates user against CSV whitelist (if enabled).
     
     Args:
         authorization: Authorization header value (Bearer token)
@@ -52,92 +154,45 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Parse Bearer token
-    try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            raise ValueError("Invalid authorization scheme")
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header format. Expected: Bearer <token>",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
+    # Parse Bearer token ("Bearer <token>", scheme case-insensitive)
+    if authorization[:7].lower() != "bearer ":
+        raise _invalid_token("Invalid authorization header format. Expected: Bearer <token>")
+    token = authorization[7:].strip()
     if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token is required",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _invalid_token("Token is required")
+    if " " in token:
+        raise _invalid_token("Invalid authorization header format. Expected: Bearer <token>")
+    
+    digest = _token_digest(token)
+    cached = _verified_users.get(digest)
+    if cached is not None:
+        client_auth.refresh_if_changed()
+        expires_at, generation, user_info = cached
+        if time.time() < expires_at and generation == client_auth.generation:
+            return user_info
+        _verified_users.pop(digest, None)
     
     try:
-        # Verify token with Supabase using admin API
-        # The admin API can verify tokens without requiring a session
         try:
-            # Use admin API to get user by token
-            # Note: Supabase Python SDK admin API requires setting the token in headers
-            # We'll use the admin client to verify the token
-            from supabase import create_client
-            from .config import get_supabase_config
-            
             config = get_supabase_config()
-            if not config:
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="Supabase configuration not available"
-                )
-            
-            # Create a temporary client with the user's token to verify it
-            # The service role key allows us to verify any token
-            admin_client = create_client(config.url, config.service_role_key)
-            
-            # Set the user's token in the client to verify it
-            # We'll use the admin API to get user info from the token
-            # Actually, we need to decode and verify the JWT token
-            # For now, let's use a simpler approach: create a client with the token
-            # and try to get the user
-            
-            # Better approach: Use admin API to get user by setting auth header
-            # But Supabase Python SDK doesn't directly support this
-            # So we'll decode the JWT token to get user info
-            import jwt as pyjwt
-            
-            # Decode token without verification first to get user ID
-            # Then use admin API to get user details (admin API will verify the user exists)
-            try:
-                decoded = pyjwt.decode(token, options={"verify_signature": False})
-                user_id = decoded.get("sub")
-                
-                if not user_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Invalid token: missing user ID",
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-                
-                # Get user from Supabase using admin API
-                user_response = admin_client.auth.admin.get_user_by_id(user_id)
-                
-                if not user_response.user:
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="User not found",
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-                
-                user = user_response.user
+            if config is not None and config.jwt_secret:
+                # Signature checked locally: no Supabase round-trip
+                claims = _verify_token_locally(token, config.jwt_secret)
+                sub = claims["sub"]
+                email = claims.get("email")
+                user_metadata = claims.get("user_metadata") or {}
+                email_verified = bool(claims.get("email_confirmed_at") or user_metadata.get("email_verified"))
+            else:
+                claims, user = await _verify_token_with_admin_api(supabase_client, token)
+                sub = user.id
                 email = user.email
-                
-            except pyjwt.DecodeError:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid token format",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
+                user_metadata = user.user_metadata or {}
+                email_verified = user.email_confirmed_at is not None
+        
+        except HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Error verifying Supabase token: {e}")
+            logger.error("Error verifying Supabase token: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired token",
@@ -151,34 +206,33 @@ async def get_current_user(
             )
         
         # Validate against CSV whitelist and get client_id
-        email_lower = email.strip().lower()
-        is_whitelisted = client_auth.validate_user_email(email_lower)
-        client_id = None
+        client_id = client_auth.get_client_id_by_email(email)
+        is_whitelisted = client_id is not None
         
-        if is_whitelisted:
-            client_id = client_auth.get_client_id_by_email(email_lower)
-        else:
-            logger.warning(f"User {email} is not in CSV whitelist")
+        if not is_whitelisted:
+            logger.warning("User %s is not in CSV whitelist", email)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"User {email} is not authorized. Please contact administrator."
             )
         
         # Combine Supabase user info with whitelist info
-        return {
+        user_info = {
             "email": email,
-            "sub": user.id,
-            "name": user.user_metadata.get("name") if user.user_metadata else None,
-            "email_verified": user.email_confirmed_at is not None,
+            "sub": sub,
+            "name": user_metadata.get("name"),
+            "email_verified": email_verified,
             "client_id": client_id,
             "whitelisted": is_whitelisted,
-            "user_metadata": user.user_metadata or {},
+            "user_metadata": user_metadata,
         }
+        _cache_verified_user(digest, user_info, claims.get("exp"))
+        return user_info
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in Supabase authentication: {e}", exc_info=True)
+        logger.error("Unexpected error in Supabase authentication: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal authentication error"
@@ -12,9 +12,24 @@ DELTA_API_KEY = os.getenv("DELTA_API_KEY")
 DELTA_API_SECRET = os.getenv("DELTA_API_SECRET")
 DELTA_BASE_URL = os.getenv("DELTA_BASE_URL", "https://api.india.delta.exchange")
 
+# CoinMarketCap API key for /fear-greed-index (endpoint returns 500 without it)
+CRYPTO_MARKET_API_KEY = os.getenv("CRYPTO_MARKET_API_KEY")
+
 # Price fetch interval in seconds (configurable via environment variable, default 5 seconds)
 PRICE_FETCH_INTERVAL_SECONDS = int(os.getenv("PRICE_FETCH_INTERVAL_SECONDS", "5"))
 
 # Positions polling interval in seconds (configurable via environment variable, default 1 second, max 5 seconds)
 POSITIONS_POLLING_INTERVAL_SECONDS = max(1, min(5, int(os.getenv("POSITIONS_POLLING_INTERVAL_SECONDS", "1"))))
 
+# How long /ticker responses are reused per symbol (default: half the price
+# fetch interval, at most 1 second). 0 disables caching; concurrent requests
+# for the same symbol still share one upstream call.
+TICKER_CACHE_TTL_SECONDS = float(os.getenv("TICKER_CACHE_TTL_SECONDS", min(PRICE_FETCH_INTERVAL_SECONDS / 2, 1.0)))
+
+# Rate limits for expensive endpoints ("<count>/<period>", e.g. "5/minute").
+# Counters live in process memory by default (per worker); point
+# RATE_LIMIT_STORAGE_URI at e.g. redis://host:6379 to share them across workers.
+RATE_LIMIT_LOGIN = os.getenv("RATE_LIMIT_LOGIN", "5/minute")
+RATE_LIMIT_TICKER = os.getenv("RATE_LIMIT_TICKER", "60/minute")
+RATE_LIMIT_ORDERS = os.getenv("RATE_LIMIT_ORDERS", "10/minute")
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
@@ -23,9 +23,9 @@ LOG_CLEANUP_INTERVAL_HOURS = int(os.getenv("LOG_CLEANUP_INTERVAL_HOURS", "24"))
 # Logging format
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
-# Sensitive fields to sanitize in logs
-SENSITIVE_FIELDS = [
+# Sensitive fields to sanitize in logs (lowercase: callers compare key.lower())
+SENSITIVE_FIELDS = frozenset({
     "api_key", "api_secret", "x_delta_api_key", "x_delta_api_secret",
-    "X-Delta-API-Key", "X-Delta-API-Secret", "password", "credential"
-]
+    "x-delta-api-key", "x-delta-api-secret", "password", "credential"
+})
 
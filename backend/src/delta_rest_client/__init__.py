@@ -1,3 +1,4 @@
 from .delta_rest_client import DeltaRestClient, create_order_format, cancel_order_format, round_by_tick_size, OrderType, TimeInForce
+from .async_delta_rest_client import AsyncDeltaRestClient, DeltaAPIError
 from .version import __version__
 
@@ -0,0 +1,159 @@
+import hashlib
+import hmac
+
+import httpx
+import orjson
+
+from .delta_rest_client import get_time_stamp, query_string, body_string
+from .version import __version__ as version
+
+
+class DeltaAPIError(Exception):
+  """Raised when Delta Exchange returns an error status or success=false"""
+
+  def __init__(self, message, response=None):
+    super().__init__(message)
+    self.response = response
+
+
+class AsyncDeltaRestClient:
+
+  """
+  asyncio counterpart of DeltaRestClient.
+
+  Requests are signed exactly like DeltaRestClient, but go through a shared
+  httpx.AsyncClient so connections (and TLS sessions) are pooled across
+  requests and credentials instead of opening a new session per client.
+  Only the endpoints used by the API services are implemented.
+  """
+  def __init__(self, base_url, http_client, api_key=None, api_secret=None, raise_for_status=True):
+    self.base_url = base_url
+    self.api_key = api_key
+    self.api_secret = api_secret
+    self.raise_for_status = raise_for_status
+    self.http_client = http_client
+    # HMAC keyed once per client; each request signs a copy of it
+    self._signer = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256) if api_secret is not None else None
+
+  async def request(self, method, path, payload=None, query=None, auth=False, base_url=None):
+    if base_url == None:
+      base_url = self.base_url
+    # Build the query string ourselves so the URL matches the signed string exactly
+    query_str = query_string(query)
+    url = '%s%s%s' % (base_url, path, query_str)
+    body = body_string(payload)
+
+    if auth:
+      if self.api_key is None or self.api_secret is None:
+        raise Exception('Api_key or Api_secret missing')
+      timestamp = get_time_stamp()
+      signature_data = method + timestamp + path + query_str + body
+      signer = self._signer.copy()
+      signer.update(signature_data.encode('utf-8'))
+      signature = signer.hexdigest()
+      headers = {"Content-Type": "application/json", "api-key": self.api_key, "timestamp": timestamp,
+                 "signature": signature, "User-Agent": "delta-rest-client-v" + str(version)}
+    else:
+      headers = {'User-Agent': 'delta-rest-client-v%s' % version, 'Content-Type': 'application/json'}
+
+    res = await self.http_client.request(
+      method, url, content=body or None, headers=headers, timeout=httpx.Timeout(6.0, connect=3.0)
+    )
+
+    if self.raise_for_status:
+      raise_for_status(res)
+    return res
+
+  async def create_order(self, order):
+    response = await self.request('POST', "/v2/orders", order, auth=True)
+    return parseResponse(response)
+
+  async def get_live_orders(self, query=None):
+    response = await self.request("GET", "/v2/orders", query=query, auth=True)
+    return parseResponse(response)
+
+  async def get_ticker(self, identifier, auth=False):
+    response = await self.request("GET", "/v2/tickers/%s" % (identifier), auth=auth)
+    return parseResponse(response)
+
+  async def get_margined_position(self, product_id):
+    response = await self.request(
+      "GET",
+      "/v2/positions/margined",
+      query={
+        'product_ids': product_id
+      },
+      auth=True
+    )
+    positions = parseResponse(response)
+    if len(positions) == 0:
+      return None
+    else:
+      return positions[0]
+
+  async def get_all_margined_positions(self):
+    """Get all margined positions without filtering by product_id"""
+    response = await self.request("GET", "/v2/positions/margined", query=None, auth=True)
+    positions = parseResponse(response)
+    return positions if positions else []
+
+  async def order_history(self, query=None, page_size=100, after=None):
+    query = dict(query or {})
+    if after is not None:
+      query['after'] = after
+    query['page_size'] = page_size
+    response = await self.request('GET', '/v2/orders/history', query=query, auth=True)
+    return orjson.loads(response.content)
+
+  async def fills(self, query=None, page_size=100, after=None):
+    query = dict(query or {})
+    if after is not None:
+      query['after'] = after
+    query['page_size'] = page_size
+    response = await self.request('GET', '/v2/fills', query=query, auth=True)
+    return orjson.loads(response.content)
+
+  async def create_bracket_order(self, product_id=None, product_symbol=None, stop_loss_order=None, take_profit_order=None, bracket_stop_trigger_method="last_traded_price"):
+    """
+    Create bracket orders (stop loss and take profit) for an existing position
+
+    See DeltaRestClient.create_bracket_order for the arguments.
+    """
+    bracket_payload = {
+      "bracket_stop_trigger_method": bracket_stop_trigger_method
+    }
+
+    if product_id:
+      bracket_payload["product_id"] = product_id
+    elif product_symbol:
+      bracket_payload["product_symbol"] = product_symbol
+    else:
+      raise Exception("Either product_id or product_symbol must be provided")
+
+    if stop_loss_order:
+      bracket_payload["stop_loss_order"] = stop_loss_order
+
+    if take_profit_order:
+      bracket_payload["take_profit_order"] = take_profit_order
+
+    response = await self.request('POST', "/v2/orders/bracket", bracket_payload, auth=True)
+    return parseResponse(response)
+
+
+def parseResponse(response):
+  response = orjson.loads(response.content)
+  if response['success']:
+    return response['result']
+  elif 'error' in response:
+    raise DeltaAPIError(response['error'])
+  else:
+    raise DeltaAPIError("Delta Exchange request failed")
+
+
+def raise_for_status(response):
+  """Raises :class:`DeltaAPIError` with the same message format as the sync client"""
+  if 400 <= response.status_code < 600:
+    reason = response.reason_phrase + " " + str(response.text)
+    raise DeltaAPIError(
+      f"{response.status_code} HTTP Error: {reason} for url: {response.url}", response=response
+    )
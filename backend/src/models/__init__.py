@@ -1,13 +1,21 @@
 """
 Pydantic models for request/response validation
 """
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing import Optional, Literal, Dict, Any, List
 
 
-class PlaceLimitOrderWaitRequest(BaseModel):
+class FrozenModel(BaseModel):
+    """Base for API models: instances are immutable once validated"""
+    
+    model_config = ConfigDict(frozen=True)
+
+
+class PlaceLimitOrderWaitRequest(FrozenModel):
     """Request model for placing limit orders that wait for price to reach entry level"""
     
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+    
     symbol: Optional[str] = Field(default="BTC", description="Trading symbol (default: BTC)")
     product_id: Optional[int] = Field(None, description="Product ID - optional if symbol provided")
     product_symbol: Optional[str] = Field(None, description="Product symbol (e.g., BTCUSD, ETHUSD)")
@@ -28,17 +36,17 @@ class PlaceLimitOrderWaitRequest(BaseModel):
         return self
 
 
-class OrderResponse(BaseModel):
+class OrderResponse(FrozenModel):
     """Response model for order placement"""
     
     success: bool = Field(..., description="Whether the order was placed successfully")
     order_id: Optional[int] = Field(None, description="Order ID if successful")
     message: str = Field(..., description="Response message")
-    order_data: Optional[dict] = Field(None, description="Full order data from exchange")
+    order_data: Optional[Dict[str, Any]] = Field(None, description="Full order data from exchange")
     error: Optional[str] = Field(None, description="Error message if failed")
 
 
-class LoginRequest(BaseModel):
+class LoginRequest(FrozenModel):
     """Request model for login"""
     
     srp_client_id: str = Field(..., description="SRP Client ID")
@@ -46,7 +54,7 @@ class LoginRequest(BaseModel):
     srp_password: str = Field(..., description="SRP Client Password")
 
 
-class LoginResponse(BaseModel):
+class LoginResponse(FrozenModel):
     """Response model for login"""
     
     success: bool = Field(..., description="Whether login was successful")
@@ -55,7 +63,10 @@ class LoginResponse(BaseModel):
 
 
 # Strategy models
-class TradingConfig(BaseModel):
+Timeframe = Literal["1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "1d", "1w"]
+
+
+class TradingConfig(FrozenModel):
     """Trading configuration for breakout strategy"""
     symbol: str = Field(..., description="Trading symbol (e.g., BTCUSD)")
     product_id: int = Field(..., description="Product ID", gt=0)
@@ -64,36 +75,36 @@ class TradingConfig(BaseModel):
     check_existing_orders: Optional[bool] = Field(True, description="Check for existing orders before placing new ones")
 
 
-class ScheduleConfig(BaseModel):
+class ScheduleConfig(FrozenModel):
     """Schedule configuration for breakout strategy"""
-    timeframe: str = Field(..., pattern="^(1m|3m|5m|15m|30m|1h|2h|4h|6h|1d|1w)$", description="Timeframe for trading")
+    timeframe: Timeframe = Field(..., description="Timeframe for trading")
     timezone: str = Field(default="Asia/Kolkata", description="Timezone")
     wait_for_next_candle: Optional[bool] = Field(False, description="Wait for next candle before placing orders")
     startup_delay_minutes: Optional[int] = Field(0, ge=0, description="Startup delay in minutes")
     reset_interval_minutes: Optional[int] = Field(None, description="Reset interval in minutes (auto-calculated from timeframe if not provided)")
 
 
-class RiskManagementConfig(BaseModel):
+class RiskManagementConfig(FrozenModel):
     """Risk management configuration for breakout strategy"""
     stop_loss_points: float = Field(..., gt=0, description="Stop loss in points")
     take_profit_points: float = Field(..., gt=0, description="Take profit in points")
     breakeven_trigger_points: float = Field(..., gt=0, description="Breakeven trigger in points")
 
 
-class MonitoringConfig(BaseModel):
+class MonitoringConfig(FrozenModel):
     """Monitoring configuration for breakout strategy"""
     order_check_interval: Optional[int] = Field(10, ge=1, description="Order check interval in seconds")
     position_check_interval: Optional[int] = Field(5, ge=1, description="Position check interval in seconds")
 
 
-class APIConfig(BaseModel):
+class APIConfig(FrozenModel):
     """API configuration for breakout strategy"""
     base_url: Optional[str] = Field(None, description="Delta Exchange base URL (uses default if not provided)")
     api_key: Optional[str] = Field(None, description="Delta Exchange API key (required if not in headers)")
     api_secret: Optional[str] = Field(None, description="Delta Exchange API secret (required if not in headers)")
 
 
-class BreakoutStrategyConfig(BaseModel):
+class BreakoutStrategyConfig(FrozenModel):
     """Complete configuration for breakout strategy"""
     trading: TradingConfig
     schedule: ScheduleConfig
@@ -102,13 +113,13 @@ class BreakoutStrategyConfig(BaseModel):
     api: Optional[APIConfig] = Field(default_factory=APIConfig)
 
 
-class StartStrategyRequest(BaseModel):
+class StartStrategyRequest(FrozenModel):
     """Request to start a breakout strategy"""
     strategy_type: Literal["breakout"] = Field("breakout", description="Strategy type")
     config: BreakoutStrategyConfig
 
 
-class StrategyStatusResponse(BaseModel):
+class StrategyStatusResponse(FrozenModel):
     """Response model for strategy status"""
     strategy_id: str
     status: str
@@ -127,13 +138,13 @@ class StrategyStatusResponse(BaseModel):
     breakeven_applied: Optional[bool] = None
 
 
-class StrategyListResponse(BaseModel):
+class StrategyListResponse(FrozenModel):
     """Response model for list of strategies"""
     strategies: List[StrategyStatusResponse]
     total: int
 
 
-class StartStrategyResponse(BaseModel):
+class StartStrategyResponse(FrozenModel):
     """Response model for starting a strategy"""
     success: bool
     strategy_id: Optional[str] = None
@@ -141,21 +152,21 @@ class StartStrategyResponse(BaseModel):
     error: Optional[str] = None
 
 
-class StopStrategyResponse(BaseModel):
+class StopStrategyResponse(FrozenModel):
     """Response model for stopping a strategy"""
     success: bool
     message: str
     error: Optional[str] = None
 
 
-class StrategyLogsResponse(BaseModel):
+class StrategyLogsResponse(FrozenModel):
     """Response model for strategy logs"""
     strategy_id: str
     logs: str
 
 
 # Positions and Orders models
-class Position(BaseModel):
+class Position(FrozenModel):
     """Position data structure"""
     user_id: int
     size: float
@@ -171,13 +182,13 @@ class Position(BaseModel):
     realized_funding: Optional[str] = None
 
 
-class PositionResponse(BaseModel):
+class PositionResponse(FrozenModel):
     """Response model for positions"""
     success: bool = True
     positions: List[Position]
 
 
-class OrderHistoryItem(BaseModel):
+class OrderHistoryItem(FrozenModel):
     """Single order history item"""
     id: int
     user_id: int
@@ -198,27 +209,27 @@ class OrderHistoryItem(BaseModel):
     product_symbol: str
 
 
-class OrderHistoryMeta(BaseModel):
+class OrderHistoryMeta(FrozenModel):
     """Pagination metadata for order history"""
     after: Optional[str] = None
     before: Optional[str] = None
 
 
-class OrderHistoryResponse(BaseModel):
+class OrderHistoryResponse(FrozenModel):
     """Response model for order history"""
     success: bool = True
     result: List[OrderHistoryItem]
     meta: Optional[OrderHistoryMeta] = None
 
 
-class PnLBySymbol(BaseModel):
+class PnLBySymbol(FrozenModel):
     """PnL breakdown by symbol"""
     symbol: str
     realized_pnl: float
     position_count: int
 
 
-class PnLSummaryResponse(BaseModel):
+class PnLSummaryResponse(FrozenModel):
     """Response model for PnL summary"""
     success: bool = True
     total_pnl: float
@@ -228,15 +239,24 @@ class PnLSummaryResponse(BaseModel):
     pnl_by_symbol: List[PnLBySymbol]
 
 
-class PollingIntervalResponse(BaseModel):
-    """Response model for polling interval configuration"""
+class PollingIntervalResponse(FrozenModel):
+    """
+    Response model for polling interval configuration.
+    
+    Clients poll every interval_seconds while results change; after an
+    unchanged result they multiply the interval by backoff_multiplier (capped
+    at max_interval), add up to jitter_seconds of random delay, and reset to
+    interval_seconds on the next change.
+    """
     interval_seconds: int
     min_interval: int = 1
     max_interval: int = 5
+    backoff_multiplier: float = Field(1.5, ge=1, description="Interval growth factor after an unchanged poll")
+    jitter_seconds: float = Field(0.25, ge=0, description="Maximum random delay added to each poll")
 
 
 # Auth0 User Models
-class Auth0User(BaseModel):
+class Auth0User(FrozenModel):
     """User information from Auth0 token"""
     email: str
     sub: str
@@ -246,13 +266,13 @@ class Auth0User(BaseModel):
     whitelisted: bool = False
 
 
-class UserInfoResponse(BaseModel):
+class UserInfoResponse(FrozenModel):
     """Response model for user info endpoint"""
     success: bool = True
     user: Auth0User
 
 
-class TradeHistoryItem(BaseModel):
+class TradeHistoryItem(FrozenModel):
     """Single trade/fill history item"""
     id: int
     user_id: int
@@ -267,27 +287,27 @@ class TradeHistoryItem(BaseModel):
     created_at: str
 
 
-class TradeHistoryMeta(BaseModel):
+class TradeHistoryMeta(FrozenModel):
     """Pagination metadata for trade history"""
     after: Optional[str] = None
     before: Optional[str] = None
 
 
-class TradeHistoryResponse(BaseModel):
+class TradeHistoryResponse(FrozenModel):
     """Response model for trade history"""
     success: bool = True
     result: List[TradeHistoryItem]
     meta: Optional[TradeHistoryMeta] = None
 
 
-class TestDeltaConnectionRequest(BaseModel):
+class TestDeltaConnectionRequest(FrozenModel):
     """Request model for testing Delta Exchange connection"""
     delta_api_key: str = Field(..., description="Delta Exchange API Key")
     delta_api_secret: str = Field(..., description="Delta Exchange API Secret")
     delta_base_url: Optional[str] = Field(None, description="Delta Exchange Base URL (optional)")
 
 
-class TestDeltaConnectionResponse(BaseModel):
+class TestDeltaConnectionResponse(FrozenModel):
     """Response model for Delta Exchange connection test"""
     success: bool = Field(..., description="Whether the connection test was successful")
     connected: bool = Field(..., description="Whether the connection is established")
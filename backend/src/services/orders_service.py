@@ -3,7 +3,9 @@ Orders Service - Single Responsibility: Handle all order-related operations
 """
 import logging
 from typing import List, Dict, Any, Optional
-from delta_rest_client import DeltaRestClient
+import httpx
+from delta_rest_client import AsyncDeltaRestClient
+from utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -12,12 +14,13 @@ class OrdersService:
     """Service for managing trading orders"""
 
     @staticmethod
-    def get_order_history(
+    async def get_order_history(
         api_key: str,
         api_secret: str,
         base_url: str = "https://api.india.delta.exchange",
         page_size: int = 100,
-        after: Optional[str] = None
+        after: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ) -> Dict[str, Any]:
         """
         Fetch order history for the given API credentials.
@@ -28,6 +31,7 @@ class OrdersService:
             base_url: Delta Exchange base URL (default: India production)
             page_size: Number of orders to fetch per page (default: 100)
             after: Pagination cursor (optional)
+            http_client: Pooled client to send the request on (default: the shared one)
         
         Returns:
             Dictionary with 'result' (list of orders) and 'meta' (pagination info)
@@ -40,8 +44,9 @@ class OrdersService:
             raise ValueError("API key and secret must be provided (client-side only, never stored on server)")
         
         try:
-            client = DeltaRestClient(
+            client = AsyncDeltaRestClient(
                 base_url=base_url,
+                http_client=http_client or get_http_client(),
                 api_key=api_key,
                 api_secret=api_secret,
                 raise_for_status=True
@@ -51,21 +56,22 @@ class OrdersService:
             if after:
                 query['after'] = after
             
-            order_history = client.order_history(query=query, page_size=page_size, after=after)
+            order_history = await client.order_history(query=query, page_size=page_size, after=after)
             
             # order_history returns a dict with 'result' and 'meta' keys
-            logger.info(f"Fetched order history: {len(order_history.get('result', []))} orders")
+            logger.info("Fetched order history: %s orders", len(order_history.get('result', [])))
             return order_history
         
         except Exception as e:
-            logger.error(f"Error fetching order history: {e}")
+            logger.error("Error fetching order history: %s", e)
             raise
 
     @staticmethod
-    def get_active_orders(
+    async def get_active_orders(
         api_key: str,
         api_secret: str,
-        base_url: str = "https://api.india.delta.exchange"
+        base_url: str = "https://api.india.delta.exchange",
+        http_client: Optional[httpx.AsyncClient] = None
     ) -> List[Dict[str, Any]]:
         """
         Fetch active/live orders for the given API credentials.
@@ -74,6 +80,7 @@ class OrdersService:
             api_key: Delta Exchange API key (from client, never stored on server)
             api_secret: Delta Exchange API secret (from client, never stored on server)
             base_url: Delta Exchange base URL (default: India production)
+            http_client: Pooled client to send the request on (default: the shared one)
         
         Returns:
             List of active order dictionaries
@@ -86,28 +93,30 @@ class OrdersService:
             raise ValueError("API key and secret must be provided (client-side only, never stored on server)")
         
         try:
-            client = DeltaRestClient(
+            client = AsyncDeltaRestClient(
                 base_url=base_url,
+                http_client=http_client or get_http_client(),
                 api_key=api_key,
                 api_secret=api_secret,
                 raise_for_status=True
             )
             
-            live_orders = client.get_live_orders(query=None)
-            logger.info(f"Fetched {len(live_orders)} active orders")
+            live_orders = await client.get_live_orders(query=None)
+            logger.info("Fetched %s active orders", len(live_orders))
             return live_orders if live_orders else []
         
         except Exception as e:
-            logger.error(f"Error fetching active orders: {e}")
+            logger.error("Error fetching active orders: %s", e)
             raise
 
     @staticmethod
-    def get_trade_history(
+    async def get_trade_history(
         api_key: str,
         api_secret: str,
         base_url: str = "https://api.india.delta.exchange",
         page_size: int = 100,
-        after: Optional[str] = None
+        after: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ) -> Dict[str, Any]:
         """
         Fetch trade history (fills) for the given API credentials.
@@ -118,6 +127,7 @@ class OrdersService:
             base_url: Delta Exchange base URL (default: India production)
             page_size: Number of trades to fetch per page (default: 100)
             after: Pagination cursor (optional)
+            http_client: Pooled client to send the request on (default: the shared one)
         
         Returns:
             Dictionary with 'result' (list of fills/trades) and 'meta' (pagination info)
@@ -130,8 +140,9 @@ class OrdersService:
             raise ValueError("API key and secret must be provided (client-side only, never stored on server)")
         
         try:
-            client = DeltaRestClient(
+            client = AsyncDeltaRestClient(
                 base_url=base_url,
+                http_client=http_client or get_http_client(),
                 api_key=api_key,
                 api_secret=api_secret,
                 raise_for_status=True
@@ -141,13 +152,13 @@ class OrdersService:
             if after:
                 query['after'] = after
             
-            trade_history = client.fills(query=query, page_size=page_size, after=after)
+            trade_history = await client.fills(query=query, page_size=page_size, after=after)
             
             # fills returns a dict with 'result' and 'meta' keys
-            logger.info(f"Fetched trade history: {len(trade_history.get('result', []))} trades")
+            logger.info("Fetched trade history: %s trades", len(trade_history.get('result', [])))
             return trade_history
         
         except Exception as e:
-            logger.error(f"Error fetching trade history: {e}")
+            logger.error("Error fetching trade history: %s", e)
             raise
 
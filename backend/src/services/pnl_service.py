@@ -2,7 +2,8 @@
 PnL Service - Single Responsibility: Calculate and aggregate PnL metrics
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import httpx
 from services.positions_service import PositionsService
 
 logger = logging.getLogger(__name__)
@@ -12,10 +13,11 @@ class PnLService:
     """Service for calculating PnL metrics"""
 
     @staticmethod
-    def get_pnl_summary(
+    async def get_pnl_summary(
         api_key: str,
         api_secret: str,
-        base_url: str = "https://api.india.delta.exchange"
+        base_url: str = "https://api.india.delta.exchange",
+        http_client: Optional[httpx.AsyncClient] = None
     ) -> Dict[str, Any]:
         """
         Get comprehensive PnL summary including total, realized, and unrealized PnL.
@@ -24,6 +26,7 @@ class PnLService:
             api_key: Delta Exchange API key (from client, never stored on server)
             api_secret: Delta Exchange API secret (from client, never stored on server)
             base_url: Delta Exchange base URL (default: India production)
+            http_client: Pooled client to send the request on (default: the shared one)
         
         Returns:
             Dictionary with PnL summary including:
@@ -35,7 +38,7 @@ class PnLService:
         """
         try:
             # Get all positions using PositionsService
-            positions = PositionsService.get_all_positions(api_key, api_secret, base_url)
+            positions = await PositionsService.get_all_positions(api_key, api_secret, base_url, http_client)
             
             # Calculate aggregate PnL
             aggregate_pnl = PositionsService.calculate_total_pnl(positions)
@@ -71,6 +74,6 @@ class PnLService:
             }
         
         except Exception as e:
-            logger.error(f"Error calculating PnL summary: {e}")
+            logger.error("Error calculating PnL summary: %s", e)
             raise
 
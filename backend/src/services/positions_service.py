@@ -3,7 +3,9 @@ Positions Service - Single Responsibility: Handle all position-related operation
 """
 import logging
 from typing import List, Dict, Any, Optional
-from delta_rest_client import DeltaRestClient
+import httpx
+from delta_rest_client import AsyncDeltaRestClient
+from utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +14,12 @@ class PositionsService:
     """Service for managing trading positions"""
 
     @staticmethod
-    def get_all_positions(api_key: str, api_secret: str, base_url: str = "https://api.india.delta.exchange") -> List[Dict[str, Any]]:
+    async def get_all_positions(
+        api_key: str,
+        api_secret: str,
+        base_url: str = "https://api.india.delta.exchange",
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> List[Dict[str, Any]]:
         """
         Fetch all margined positions for the given API credentials.
         
@@ -20,6 +27,7 @@ class PositionsService:
             api_key: Delta Exchange API key (from client, never stored on server)
             api_secret: Delta Exchange API secret (from client, never stored on server)
             base_url: Delta Exchange base URL (default: India production)
+            http_client: Pooled client to send the request on (default: the shared one)
         
         Returns:
             List of position dictionaries
@@ -32,19 +40,20 @@ class PositionsService:
             raise ValueError("API key and secret must be provided (client-side only, never stored on server)")
         
         try:
-            client = DeltaRestClient(
+            client = AsyncDeltaRestClient(
                 base_url=base_url,
+                http_client=http_client or get_http_client(),
                 api_key=api_key,
                 api_secret=api_secret,
                 raise_for_status=True
             )
             
-            positions = client.get_all_margined_positions()
-            logger.info(f"Fetched {len(positions)} positions")
+            positions = await client.get_all_margined_positions()
+            logger.info("Fetched %s positions", len(positions))
             return positions
         
         except Exception as e:
-            logger.error(f"Error fetching positions: {e}")
+            logger.error("Error fetching positions: %s", e)
             raise
 
     @staticmethod
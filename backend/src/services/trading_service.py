@@ -1,8 +1,9 @@
+import asyncio
 import logging
-import time
 from typing import Dict, Optional, Tuple
-from delta_rest_client import DeltaRestClient
+from delta_rest_client import AsyncDeltaRestClient
 from config import DELTA_BASE_URL, DELTA_API_KEY, DELTA_API_SECRET
+from utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -10,25 +11,23 @@ class TradingService:
     """Service for executing trading orders with stop loss and take profit"""
 
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
-        """Initialize trading service with Delta Exchange client"""
+        """Initialize trading service with default Delta Exchange credentials"""
         self.api_key = api_key or DELTA_API_KEY
         self.api_secret = api_secret or DELTA_API_SECRET
         self.base_url = DELTA_BASE_URL
 
         if self.api_key and self.api_secret:
-            self.client = DeltaRestClient(
-                base_url=self.base_url,
-                api_key=self.api_key,
-                api_secret=self.api_secret,
-                raise_for_status=True
-            )
             logger.info("Trading service initialized")
         else:
-            self.client = None
             logger.info("Trading service initialized without credentials (will use per-request credentials)")
 
-    def _get_client(self, api_key: Optional[str] = None, api_secret: Optional[str] = None, base_url: Optional[str] = None) -> DeltaRestClient:
-        """Get or create a DeltaRestClient with specified credentials"""
+    def _get_client(self, api_key: Optional[str] = None, api_secret: Optional[str] = None, base_url: Optional[str] = None) -> AsyncDeltaRestClient:
+        """
+        Create an AsyncDeltaRestClient with the specified credentials.
+        
+        Clients are cheap wrappers: every one shares the pooled HTTP client, so
+        connections are reused whichever credentials are used.
+        """
         key = api_key or self.api_key
         secret = api_secret or self.api_secret
         url = base_url or self.base_url
@@ -36,19 +35,17 @@ class TradingService:
         if not key or not secret:
             raise ValueError("API key and secret must be provided via headers or environment variables")
 
-        if key == self.api_key and secret == self.api_secret and url == self.base_url and self.client:
-            return self.client
-
-        return DeltaRestClient(
+        return AsyncDeltaRestClient(
             base_url=url,
+            http_client=get_http_client(),
             api_key=key,
             api_secret=secret,
             raise_for_status=True
         )
 
-    def _check_position_exists(
+    async def _check_position_exists(
         self,
-        client: DeltaRestClient,
+        client: AsyncDeltaRestClient,
         product_id: Optional[int],
         product_symbol: Optional[str]
     ) -> bool:
@@ -60,31 +57,31 @@ class TradingService:
         """
         try:
             if product_id:
-                position = client.get_margined_position(product_id)
+                position = await client.get_margined_position(product_id)
                 if position:
                     size = float(position.get('size', 0))
                     if size != 0:
-                        logger.info(f"✓ Position exists: size={size}, product_id={product_id}, realized_pnl={position.get('realized_pnl', 'N/A')}, entry_price={position.get('entry_price', 'N/A')}")
+                        logger.info("✓ Position exists: size=%s, product_id=%s, realized_pnl=%s, entry_price=%s", size, product_id, position.get('realized_pnl', 'N/A'), position.get('entry_price', 'N/A'))
                         return True
                     else:
-                        logger.debug(f"Position found but size is 0: {position}")
+                        logger.debug("Position found but size is 0: %s", position)
                 else:
-                    logger.debug(f"No position returned for product_id={product_id}")
+                    logger.debug("No position returned for product_id=%s", product_id)
             else:
-                logger.warning(f"No product_id provided, cannot check position")
+                logger.warning("No product_id provided, cannot check position")
             return False
         except Exception as e:
             error_msg = str(e)
             # If error indicates no position, that's fine - position doesn't exist yet
             if "not found" in error_msg.lower() or "no position" in error_msg.lower() or "404" in error_msg:
-                logger.debug(f"No position exists yet for product_id={product_id}: {error_msg}")
+                logger.debug("No position exists yet for product_id=%s: %s", product_id, error_msg)
             else:
-                logger.warning(f"Error checking position for product_id={product_id}: {error_msg}")
+                logger.warning("Error checking position for product_id=%s: %s", product_id, error_msg)
             return False
 
-    def _place_bracket_orders(
+    async def _place_bracket_orders(
         self,
-        client: DeltaRestClient,
+        client: AsyncDeltaRestClient,
         product_id: Optional[int],
         product_symbol: Optional[str],
         stop_loss_price: Optional[float],
@@ -100,7 +97,7 @@ class TradingService:
         FIXED: Increased retries to 60 (60 seconds) to ensure brackets are placed.
         
         Args:
-            client: DeltaRestClient instance
+            client: AsyncDeltaRestClient instance
             product_id: Product ID
             product_symbol: Product symbol
             stop_loss_price: Stop loss price
@@ -115,25 +112,25 @@ class TradingService:
         # First, wait for position to exist (only if we have product_id)
         position_exists = False
         if product_id:
-            logger.info(f"Waiting for position to exist (product_id={product_id}, max_retries={max_retries}, retry_delay={retry_delay}s)...")
+            logger.info("Waiting for position to exist (product_id=%s, max_retries=%s, retry_delay=%ss)...", product_id, max_retries, retry_delay)
             for attempt in range(max_retries):
-                position_exists = self._check_position_exists(client, product_id, product_symbol)
+                position_exists = await self._check_position_exists(client, product_id, product_symbol)
                 if position_exists:
-                    logger.info(f"✓ Position confirmed to exist on attempt {attempt + 1}/{max_retries} (after {attempt * retry_delay:.1f}s)")
+                    logger.info("✓ Position confirmed to exist on attempt %s/%s (after %.1fs)", attempt + 1, max_retries, attempt * retry_delay)
                     break
                 else:
                     if attempt < max_retries - 1:
                         if attempt % 5 == 0 or attempt < 3:  # Log every 5 attempts or first 3 attempts
-                            logger.info(f"Waiting for position (attempt {attempt + 1}/{max_retries}, elapsed: {attempt * retry_delay:.1f}s)...")
-                        time.sleep(retry_delay)
+                            logger.info("Waiting for position (attempt %s/%s, elapsed: %.1fs)...", attempt + 1, max_retries, attempt * retry_delay)
+                        await asyncio.sleep(retry_delay)
                     else:
                         # Log on last attempt
-                        logger.info(f"Last attempt to find position (attempt {attempt + 1}/{max_retries})...")
+                        logger.info("Last attempt to find position (attempt %s/%s)...", attempt + 1, max_retries)
             
             if not position_exists:
                 error_msg = f"Position not found after {max_retries} attempts ({max_retries * retry_delay:.1f}s). Bracket orders require an existing position. Please ensure the order has been filled."
-                logger.error(f"✗ {error_msg}")
-                logger.error(f"Please check: 1) Order was filled, 2) Product ID {product_id} is correct, 3) Position exists in your account")
+                logger.error("✗ %s", error_msg)
+                logger.error("Please check: 1) Order was filled, 2) Product ID %s is correct, 3) Position exists in your account", product_id)
                 return None, error_msg
         else:
             # If we only have product_symbol, we can't check position existence
@@ -175,13 +172,13 @@ class TradingService:
             if not stop_loss_order and not take_profit_order:
                 return None, "No stop loss or take profit price provided"
             
-            logger.info(f"Placing bracket orders: product_id={product_id}, product_symbol={product_symbol}, SL={stop_loss_price}, TP={take_profit_price}")
-            logger.info(f"Stop Loss Order: {stop_loss_order}")
-            logger.info(f"Take Profit Order: {take_profit_order}")
+            logger.info("Placing bracket orders: product_id=%s, product_symbol=%s, SL=%s, TP=%s", product_id, product_symbol, stop_loss_price, take_profit_price)
+            logger.info("Stop Loss Order: %s", stop_loss_order)
+            logger.info("Take Profit Order: %s", take_profit_order)
             
             # Place bracket order
             try:
-                bracket_result = client.create_bracket_order(
+                bracket_result = await client.create_bracket_order(
                     product_id=product_id,
                     product_symbol=product_symbol,
                     stop_loss_order=stop_loss_order,
@@ -189,20 +186,20 @@ class TradingService:
                     bracket_stop_trigger_method="last_traded_price"
                 )
                 
-                logger.info(f"✓ Bracket orders placed successfully! Result: {bracket_result}")
+                logger.info("✓ Bracket orders placed successfully! Result: %s", bracket_result)
                 return bracket_result, None
             except Exception as bracket_exception:
                 error_msg = f"Failed to place bracket orders: {str(bracket_exception)}"
-                logger.error(f"✗ {error_msg}")
-                logger.error(f"Bracket order exception details: {type(bracket_exception).__name__}: {bracket_exception}")
+                logger.error("✗ %s", error_msg)
+                logger.error("Bracket order exception details: %s: %s", type(bracket_exception).__name__, bracket_exception)
                 return None, error_msg
                 
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"✗ Error placing bracket orders: {error_msg}")
+            logger.error("✗ Error placing bracket orders: %s", error_msg)
             return None, error_msg
 
-    def place_limit_order_wait(
+    async def place_limit_order_wait(
         self,
         entry_price: float,
         size: int,
@@ -298,21 +295,20 @@ class TradingService:
 
             product_info = f"product_id={final_product_id}" if final_product_id else f"product_symbol={final_product_symbol}"
             logger.info(
-                f"Placing stop-limit order (wait): {side} {size} {product_info} at {entry_price}, "
-                f"SL: {stop_loss_price}, TP: {take_profit_price}"
+                "Placing stop-limit order (wait): %s %s %s at %s, SL: %s, TP: %s", side, size, product_info, entry_price, stop_loss_price, take_profit_price
             )
 
             # Get client and place entry order (stop-limit without brackets)
             client = self._get_client(api_key=api_key, api_secret=api_secret, base_url=base_url)
-            logger.info(f"Stop-limit entry order payload: {order}")
+            logger.info("Stop-limit entry order payload: %s", order)
             
-            result = client.create_order(order)
-            logger.info(f"✓ Stop-limit entry order placed successfully: {result}")
+            result = await client.create_order(order)
+            logger.info("✓ Stop-limit entry order placed successfully: %s", result)
             
             # Extract product_id from order result if available (more reliable)
             order_product_id = result.get("product_id") if result else None
             if order_product_id:
-                logger.info(f"Extracted product_id={order_product_id} from order result")
+                logger.info("Extracted product_id=%s from order result", order_product_id)
                 final_product_id = int(order_product_id)
             
             # Check if order executed immediately
@@ -321,7 +317,7 @@ class TradingService:
             average_fill_price = result.get("average_fill_price") if result else None
             order_executed = order_state == "closed" and average_fill_price is not None
             
-            logger.info(f"Order state: {order_state}, Order ID: {order_id}, Executed: {order_executed}, Product ID: {final_product_id}, Product Symbol: {final_product_symbol}")
+            logger.info("Order state: %s, Order ID: %s, Executed: %s, Product ID: %s, Product Symbol: %s", order_state, order_id, order_executed, final_product_id, final_product_symbol)
             
             # If SL/TP provided, place bracket orders
             bracket_result = None
@@ -329,8 +325,8 @@ class TradingService:
             if stop_loss_price or take_profit_price:
                 if order_executed:
                     # Order executed immediately - place brackets right away
-                    logger.info(f"✓ Entry order executed immediately (order_id={order_id}, price={average_fill_price}), placing bracket orders...")
-                    bracket_result, bracket_error = self._place_bracket_orders(
+                    logger.info("✓ Entry order executed immediately (order_id=%s, price=%s), placing bracket orders...", order_id, average_fill_price)
+                    bracket_result, bracket_error = await self._place_bracket_orders(
                         client=client,
                         product_id=final_product_id,
                         product_symbol=final_product_symbol,
@@ -341,14 +337,18 @@ class TradingService:
                         retry_delay=0.5
                     )
                 else:
-                    # Order is waiting for price - wait for position then place bracket orders
-                    logger.info(f"Entry order is {order_state or 'open'} (order_id={order_id}, waiting for price), will wait {wait_time_seconds}s then place bracket orders once position is created...")
-                    # Wait for the specified wait time first
-                    logger.info(f"Waiting {wait_time_seconds} seconds for order to execute...")
-                    time.sleep(wait_time_seconds)
-                    logger.info(f"Wait time completed, checking position and placing bracket orders...")
-                    max_retries = max(30, int(wait_time_seconds))  # Use wait_time_seconds from request
-                    bracket_result, bracket_error = self._place_bracket_orders(
+                    # Order is waiting for price - poll for the position (yielding to the
+                    # event loop between checks) and place brackets as soon as it exists.
+                    # The window still covers wait_time_seconds plus the usual retry period.
+                    max_retries = int(wait_time_seconds) + max(30, int(wait_time_seconds))
+                    if final_product_id is None:
+                        # Without a product_id the position can't be polled, so give the
+                        # entry order the full wait before the brackets are sent
+                        logger.info("Entry order is %s (order_id=%s, waiting for price), waiting %ss before placing bracket orders (no product_id to poll)...", order_state or 'open', order_id, wait_time_seconds)
+                        await asyncio.sleep(wait_time_seconds)
+                    else:
+                        logger.info("Entry order is %s (order_id=%s, waiting for price), polling up to %ss for the position before placing bracket orders...", order_state or 'open', order_id, max_retries)
+                    bracket_result, bracket_error = await self._place_bracket_orders(
                         client=client,
                         product_id=final_product_id,
                         product_symbol=final_product_symbol,
@@ -360,10 +360,10 @@ class TradingService:
                     )
                 
                 if bracket_result:
-                    logger.info(f"✓ Bracket orders placed successfully: {bracket_result}")
+                    logger.info("✓ Bracket orders placed successfully: %s", bracket_result)
                     result["bracket_order"] = bracket_result
                 else:
-                    logger.warning(f"✗ Bracket orders could not be placed: {bracket_error}")
+                    logger.warning("✗ Bracket orders could not be placed: %s", bracket_error)
                     # Store bracket error but don't fail the entire request
                     result["bracket_order_error"] = bracket_error
                     result["bracket_order_note"] = "Bracket orders will be placed automatically once position is created"
@@ -372,6 +372,6 @@ class TradingService:
 
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"Error placing stop-limit order (wait): {error_msg}")
+            logger.error("Error placing stop-limit order (wait): %s", error_msg)
             return False, None, error_msg
 
@@ -3,7 +3,8 @@
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Final, Mapping, Optional, Tuple
 import pytz
 
 # Handle both direct execution and module import
@@ -14,6 +15,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Candle timeframe -> minutes (unknown timeframes are treated as 1h)
+TIMEFRAME_MINUTES: Final[Mapping[str, int]] = MappingProxyType({
+    '1m': 1, '3m': 3, '5m': 5, '15m': 15, '30m': 30,
+    '1h': 60, '2h': 120, '4h': 240, '6h': 360,
+    '1d': 1440, '1w': 10080
+})
+
 
 class BreakoutTradingBot:
     """
@@ -351,12 +359,7 @@ class BreakoutTradingBot:
     
     def _timeframe_to_minutes(self) -> int:
         """Convert timeframe string to minutes"""
-        timeframe_map = {
-            '1m': 1, '3m': 3, '5m': 5, '15m': 15, '30m': 30,
-            '1h': 60, '2h': 120, '4h': 240, '6h': 360,
-            '1d': 1440, '1w': 10080
-        }
-        return timeframe_map.get(self.timeframe, 60)
+        return TIMEFRAME_MINUTES.get(self.timeframe, 60)
     
     def place_breakout_orders(self) -> bool:
         """
@@ -6,7 +6,7 @@ import logging
 import io
 from typing import Dict, Any, Optional
 from ..base_strategy import BaseStrategy, StrategyStatus
-from .breakout_bot import BreakoutTradingBot
+from .breakout_bot import BreakoutTradingBot, TIMEFRAME_MINUTES
 from .delta_client import DeltaExchangeClient
 
 logger = logging.getLogger(__name__)
@@ -87,12 +87,7 @@ class BreakoutService(BaseStrategy):
     
     def _timeframe_to_minutes(self, timeframe: str) -> int:
         """Convert timeframe string to minutes"""
-        timeframe_map = {
-            '1m': 1, '3m': 3, '5m': 5, '15m': 15, '30m': 30,
-            '1h': 60, '2h': 120, '4h': 240, '6h': 360,
-            '1d': 1440, '1w': 10080
-        }
-        return timeframe_map.get(timeframe, 60)
+        return TIMEFRAME_MINUTES.get(timeframe, 60)
     
     def _run_bot(self):
         """Run bot in background thread"""
@@ -239,7 +234,12 @@ class BreakoutService(BaseStrategy):
             Log string
         """
         log_content = self.log_capture.getvalue()
-        lines = log_content.split('\n')
-        recent_lines = lines[-limit:] if len(lines) > limit else lines
-        return '\n'.join(recent_lines)
+        # Walk back over the last `limit` newlines instead of splitting the
+        # whole capture into a list of every line
+        start = len(log_content)
+        for _ in range(limit):
+            start = log_content.rfind('\n', 0, start)
+            if start == -1:
+                break
+        return log_content[start + 1:]
 
@@ -0,0 +1,92 @@
+"""
+Shared HTTP client for outbound API calls (Delta Exchange, CoinMarketCap)
+
+One pooled httpx.AsyncClient per worker process keeps connections and TLS
+sessions alive across requests instead of handshaking on every call.
+Responses are requested compressed: httpx advertises gzip/deflate, plus br
+when the brotli extra is installed, and decodes transparently.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT_SECONDS = 10.0
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+# Idle pooled connections are kept this long (httpx defaults to 5s, which
+# drops the connection between typical 5s price polls)
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+PRECONNECT_TIMEOUT_SECONDS = 5.0
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared httpx.AsyncClient.
+    
+    Created on application startup; created lazily here if used before that
+    (e.g. from tests or scripts).
+    
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _client
+    
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        logger.info("Shared HTTP client created")
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared httpx.AsyncClient (on application shutdown)"""
+    global _client
+    
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Shared HTTP client closed")
+
+
+async def preconnect(url: str, timeout: float = PRECONNECT_TIMEOUT_SECONDS) -> bool:
+    """
+    Issue a cheap GET so the pool holds an open (TLS, HTTP/2) connection to
+    url's host before the first real request needs it.
+    
+    Args:
+        url: Any inexpensive URL on the host to warm
+        timeout: Give up after this many seconds
+    
+    Returns:
+        True if the request completed, False if it failed (logged, not raised)
+    """
+    try:
+        response = await asyncio.wait_for(get_http_client().get(url), timeout=timeout)
+    except (httpx.HTTPError, asyncio.TimeoutError) as e:
+        logger.warning("Preconnect to %s failed: %s", url, e)
+        return False
+    logger.debug("Preconnected to %s (%s, %s)", url, response.http_version, response.status_code)
+    return True
+
+
+async def keep_warm(url: str, interval: float = HTTP_KEEPALIVE_EXPIRY_SECONDS - 5) -> None:
+    """
+    Re-issue preconnect() every interval seconds so the pooled connection is
+    not closed as idle between user requests. Runs until cancelled.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await preconnect(url)
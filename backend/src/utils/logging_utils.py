@@ -2,10 +2,70 @@
 Logging utilities for per-user logging and log sanitization
 """
 import logging
+import os
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from config.logging_config import USER_LOGS_DIR, LOG_FORMAT, SENSITIVE_FIELDS
 
 
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a large buffer.
+    
+    The stock handler flushes after every record (one write() per log line).
+    Here records accumulate in a buffer_size buffer and are written in bulk;
+    records at flush_level or above, rotation and close() still flush
+    immediately so errors are never held back.
+    """
+
+    def __init__(self, filename, buffer_size: int = 64 * 1024, flush_level: int = logging.ERROR, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        # Size of the current file, tracked here so the rollover check never
+        # seeks/tells the stream (which would flush the buffer on every record)
+        self._bytes_written = 0
+        super().__init__(filename, **kwargs)
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._bytes_written = os.path.getsize(self.baseFilename)
+        return stream
+
+    def _exceeds_max_bytes(self, message_length: int) -> bool:
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        if self._bytes_written + message_length < self.maxBytes:
+            return False
+        # Never rotate special files such as /dev/null
+        return not os.path.exists(self.baseFilename) or os.path.isfile(self.baseFilename)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        return self._exceeds_max_bytes(len(self.format(record) + self.terminator))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._bytes_written = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record) + self.terminator
+            if self._exceeds_max_bytes(len(message)):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(message)
+            self._bytes_written += len(message)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 def setup_user_logger(client_id: str, error: bool = False) -> logging.Logger:
     """
     Sets up a logger for a specific user (client_id).
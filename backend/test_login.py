@@ -22,8 +22,8 @@ def test_login():
     client_auth.reload_clients()
     
     print(f"\nClients loaded: {len(client_auth.clients)}")
-    for email, data in client_auth.clients.items():
-        print(f"  {email}: client_id={data['client_id']}, password={'***' if data['password'] else 'N/A'}")
+    for email, (client_id, password_sha256) in client_auth.clients.items():
+        print(f"  {email}: client_id={client_id}, password={'***' if password_sha256 else 'N/A'}")
     
     # Test cases
     print("\n" + "=" * 50)
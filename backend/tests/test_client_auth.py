@@ -0,0 +1,89 @@
+"""
+Unit tests for ClientAuth
+"""
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auth import client_auth as client_auth_module
+from auth.client_auth import ClientAuth, password_digest
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Whitelist CSV with one complete row and one incomplete row"""
+    path = tmp_path / "clients.csv"
+    path.write_text(
+        "srp_client_id,srp_client_emailid,srp_client_password\n"
+        "C1,alice@example.com,secret\n"
+        ",missing-id@example.com,\n",
+        encoding="utf-8"
+    )
+    return path
+
+
+class TestClientAuth:
+    """Test cases for ClientAuth"""
+
+    def test_iter_clients_streams_valid_rows(self, csv_file):
+        """Test that iter_clients yields only complete rows without loading the dict"""
+        auth = ClientAuth(csv_path=csv_file, load=False)
+
+        clients = list(auth.iter_clients())
+
+        assert auth.clients == {}
+        assert clients == [
+            ("alice@example.com", {"client_id": "C1", "email": "alice@example.com", "password": "secret"})
+        ]
+
+    def test_iter_clients_missing_file(self, tmp_path):
+        """Test that a missing CSV yields nothing"""
+        auth = ClientAuth(csv_path=tmp_path / "missing.csv", load=False)
+
+        assert list(auth.iter_clients()) == []
+
+    def test_validate_client(self, csv_file):
+        """Test client ID, email and password validation"""
+        auth = ClientAuth(csv_path=csv_file)
+
+        assert auth.validate_client("C1", "Alice@Example.com ") == (True, "Valid client")
+        assert auth.validate_client("C2", "alice@example.com") == (False, "Invalid or unauthorized client ID")
+        assert auth.validate_client("C1", "alice@example.com", "wrong") == (False, "Invalid password")
+        assert auth.validate_client("C1", "bob@example.com") == (False, "Invalid or unauthorized client email")
+        assert auth.validate_client("C1; DROP", "alice@example.com") == (False, "Invalid credentials format")
+        assert auth.validate_client("C1", "not-an-email") == (False, "Invalid credentials format")
+
+    def test_validate_client_digest(self, csv_file):
+        """Test that digest validation matches plaintext validation"""
+        auth = ClientAuth(csv_path=csv_file)
+
+        assert auth.validate_client_digest("C1", "alice@example.com", password_digest(" secret ")) == (True, "Valid client")
+        assert auth.validate_client_digest("C1", "alice@example.com", password_digest("wrong")) == (False, "Invalid password")
+        assert auth.validate_client_digest("C1", "alice@example.com") == (True, "Valid client")
+
+    def test_validate_client_reloads_changed_csv(self, csv_file, monkeypatch):
+        """Test that CSV edits are picked up via the mtime check, not on every call"""
+        auth = ClientAuth(csv_path=csv_file)
+        generation = auth.generation
+        csv_file.write_text(
+            "srp_client_id,srp_client_emailid,srp_client_password\n"
+            "C2,Bob@Example.com,\n",
+            encoding="utf-8"
+        )
+        stat = csv_file.stat()
+        os.utime(csv_file, (stat.st_atime, stat.st_mtime + 10))
+
+        # Within the check interval the in-memory whitelist is used as-is
+        monkeypatch.setattr(client_auth_module, "RELOAD_CHECK_INTERVAL_SECONDS", 3600.0)
+        auth._last_reload_check = client_auth_module.time.monotonic()
+        assert auth.validate_client("C2", "bob@example.com") == (False, "Invalid or unauthorized client email")
+        assert auth.generation == generation
+
+        monkeypatch.setattr(client_auth_module, "RELOAD_CHECK_INTERVAL_SECONDS", 0.0)
+        assert auth.validate_client("C2", "bob@example.com") == (True, "Valid client")
+        assert auth.validate_client("C1", "alice@example.com") == (False, "Invalid or unauthorized client email")
+        assert auth.generation == generation + 1
@@ -0,0 +1,74 @@
+"""
+Unit tests for the cached SRP client header validation in api.routes
+"""
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi import HTTPException
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api import routes
+from auth.client_auth import ClientAuth
+
+
+@pytest.fixture
+def client_auth(tmp_path, monkeypatch):
+    """ClientAuth over a one-row whitelist, installed in api.routes with an empty cache"""
+    path = tmp_path / "clients.csv"
+    path.write_text(
+        "srp_client_id,srp_client_emailid,srp_client_password\n"
+        "C1,alice@example.com,\n",
+        encoding="utf-8"
+    )
+    auth = ClientAuth(csv_path=path)
+    monkeypatch.setattr(routes, "client_auth", auth)
+    routes._validate_client_cached.cache_clear()
+    yield auth
+    routes._validate_client_cached.cache_clear()
+
+
+class TestClientValidation:
+    """Test cases for validate_client_headers / get_client_context"""
+
+    def test_validate_client_headers_is_memoized(self, client_auth):
+        """Test that repeat header pairs (in any case/spacing) skip the whitelist lookup"""
+        with patch.object(client_auth, "validate_client_digest", wraps=client_auth.validate_client_digest) as spy:
+            assert routes.validate_client_headers("C1", "alice@example.com") == (True, "Valid client")
+            assert routes.validate_client_headers(" C1 ", "Alice@Example.com") == (True, "Valid client")
+            assert routes.validate_client_headers("C2", "alice@example.com")[0] is False
+
+        assert spy.call_count == 2
+
+    def test_reload_invalidates_cached_results(self, client_auth):
+        """Test that a whitelist reload (new generation) re-validates cached pairs"""
+        assert routes.validate_client_headers("C1", "alice@example.com")[0] is True
+
+        client_auth.csv_path.write_text("srp_client_id,srp_client_emailid\nC2,bob@example.com\n", encoding="utf-8")
+        client_auth.reload_clients()
+
+        assert routes.validate_client_headers("C1", "alice@example.com")[0] is False
+        assert routes.validate_client_headers("C2", "bob@example.com")[0] is True
+
+    def test_get_client_context(self, client_auth):
+        """Test that the dependency returns the normalized client or raises 403"""
+        context = asyncio.run(routes.get_client_context(" C1", "Alice@Example.com"))
+        assert context == routes.ClientContext("C1", "alice@example.com")
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(routes.get_client_context("C1", "bob@example.com"))
+        assert exc_info.value.status_code == 403
+
+    def test_get_session_user(self):
+        """Test that the session dependency normalizes the email and requires a whitelisted client_id"""
+        user = asyncio.run(routes.get_session_user({"email": " Alice@Example.com", "client_id": "C1"}))
+        assert user == routes.SessionUser("alice@example.com", "C1")
+
+        for current_user, status_code in (({"email": ""}, 401), ({"email": "bob@example.com", "client_id": None}, 403)):
+            with pytest.raises(HTTPException) as exc_info:
+                asyncio.run(routes.get_session_user(current_user))
+            assert exc_info.value.status_code == status_code
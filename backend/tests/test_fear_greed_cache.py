@@ -0,0 +1,80 @@
+"""
+Unit tests for the /fear-greed-index cache
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+from fastapi import Response
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api import routes
+
+
+INDEX_BODY = {"status": {"error_code": 0}, "data": {"value": 60, "value_classification": "Greed"}}
+
+
+class TestFearGreedCache:
+    """Test cases for get_fear_greed_index"""
+
+    def setup_method(self):
+        routes._fear_greed_cache = None
+        routes._fear_greed_expires_at = 0.0
+        routes._fear_greed_backoff_until = 0.0
+
+    def test_cache_headers_and_stale_fallback(self, monkeypatch):
+        """Test HIT/MISS/STALE reporting and that upstream errors serve the expired value"""
+        monkeypatch.setattr(routes, "_fear_greed_headers", {"X-CMC_PRO_API_KEY": "test-key"})
+        responses = [
+            httpx.Response(200, json=INDEX_BODY),
+            httpx.Response(500),
+        ]
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return responses[len(requests_seen) - 1]
+
+        async def fetch(client):
+            response = Response()
+            result = await routes.get_fear_greed_index(response, client)
+            return result["data"]["value"], response.headers["X-Cache"]
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                results = [await fetch(client), await fetch(client)]
+                routes._fear_greed_expires_at = 0.0
+                results.append(await fetch(client))
+                return results
+
+        assert asyncio.run(run()) == [(60, "MISS"), (60, "HIT"), (60, "STALE")]
+        assert len(requests_seen) == 2
+
+    def test_upstream_max_age_and_retry_after(self, monkeypatch):
+        """Test that the TTL follows Cache-Control and a 429 suppresses refreshes for Retry-After"""
+        monkeypatch.setattr(routes, "_fear_greed_headers", {"X-CMC_PRO_API_KEY": "test-key"})
+        responses = [
+            httpx.Response(200, json=INDEX_BODY, headers={"Cache-Control": "public, max-age=120"}),
+            httpx.Response(429, headers={"Retry-After": "30"}),
+        ]
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return responses[len(requests_seen) - 1]
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                first = Response()
+                await routes.get_fear_greed_index(first, client)
+                routes._fear_greed_expires_at = 0.0
+                for _ in range(2):
+                    await routes.get_fear_greed_index(Response(), client)
+                return first.headers["X-Cache-TTL"]
+
+        assert int(asyncio.run(run())) in (119, 120)
+        assert len(requests_seen) == 2
+        assert 25 < routes._fear_greed_backoff_until - routes.time.time() <= 30
@@ -0,0 +1,53 @@
+"""
+Unit tests for BufferedRotatingFileHandler
+"""
+import logging
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.logging_utils import BufferedRotatingFileHandler
+
+
+def _record(level: int, message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+class TestBufferedRotatingFileHandler:
+    """Test cases for BufferedRotatingFileHandler"""
+
+    def test_records_below_flush_level_stay_buffered(self, tmp_path):
+        """Test that WARNING records are only written on flush() or an ERROR record"""
+        log_file = tmp_path / "bot.log"
+        handler = BufferedRotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=1, encoding="utf-8")
+        try:
+            for i in range(5):
+                handler.emit(_record(logging.WARNING, f"warning {i}"))
+            assert log_file.stat().st_size == 0
+
+            handler.emit(_record(logging.ERROR, "error"))
+            assert log_file.read_text().splitlines() == [f"warning {i}" for i in range(5)] + ["error"]
+
+            handler.emit(_record(logging.WARNING, "after error"))
+            assert "after error" not in log_file.read_text()
+            handler.flush()
+            assert log_file.read_text().endswith("after error\n")
+        finally:
+            handler.close()
+
+    def test_rolls_over_on_tracked_size(self, tmp_path):
+        """Test that rotation follows the bytes written, including a pre-existing file"""
+        log_file = tmp_path / "bot.log"
+        log_file.write_text("x" * 15 + "\n")
+        handler = BufferedRotatingFileHandler(log_file, maxBytes=20, backupCount=1, encoding="utf-8", delay=True)
+        try:
+            handler.emit(_record(logging.WARNING, "first"))
+            handler.emit(_record(logging.WARNING, "second"))
+            handler.flush()
+        finally:
+            handler.close()
+
+        assert (tmp_path / "bot.log.1").read_text() == "x" * 15 + "\n"
+        assert log_file.read_text() == "first\nsecond\n"
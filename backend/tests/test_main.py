@@ -0,0 +1,79 @@
+"""
+Unit tests for the application lifespan in main.py
+"""
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+from fastapi.testclient import TestClient
+
+# main.py lives in the backend directory (it adds src to the path itself)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import main
+from api import routes
+
+
+class TestLifespan:
+    """Test cases for the FastAPI lifespan"""
+
+    def test_lifespan_can_run_twice(self):
+        """Test that a second lifespan restarts log delivery and shuts down cleanly"""
+        delivered = []
+        handler = logging.Handler()
+        handler.emit = delivered.append
+
+        with patch.dict(os.environ, {"DELTA_PRECONNECT": "false"}), \
+                patch.object(main.log_listener, "handlers", (handler,)):
+            for run in range(2):
+                with TestClient(main.app) as client:
+                    assert client.get("/").status_code == 200
+                    logging.getLogger("test_main").warning("inside lifespan %d", run)
+                assert main.log_listener._thread is None
+
+        assert [r.getMessage() for r in delivered if r.name == "test_main"] == [
+            "inside lifespan 0", "inside lifespan 1"
+        ]
+
+
+class TestTickersEndpoint:
+    """Test cases for the bulk /tickers endpoint"""
+
+    def setup_method(self):
+        routes._ticker_cache.clear()
+        routes._ticker_inflight.clear()
+
+    def teardown_method(self):
+        main.app.dependency_overrides.clear()
+
+    def test_symbol_cap_and_failed_symbol(self):
+        """Test the symbol cap, and that one failing symbol is null while the rest succeed (in two lifespans)"""
+        async def handler(request):
+            # Yield so concurrent fetches actually contend for the semaphore
+            await asyncio.sleep(0)
+            symbol = request.url.path.rsplit("/", 1)[-1]
+            if symbol == "BADUSD":
+                return httpx.Response(200, content=b"not json")
+            return httpx.Response(200, json={"success": True, "result": {"symbol": symbol, "mark_price": "1"}})
+
+        symbols = ["BADUSD"] + [f"SYM{i}USD" for i in range(49)]
+
+        with patch.dict(os.environ, {"DELTA_PRECONNECT": "false"}):
+            for _ in range(2):
+                self.setup_method()
+                with TestClient(main.app) as client:
+                    upstream = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                    main.app.dependency_overrides[routes.get_shared_http_client] = lambda: upstream
+
+                    too_many = client.get("/api/v1/tickers", params={"symbols": ",".join(symbols + ["EXTRAUSD"])})
+                    response = client.get("/api/v1/tickers", params={"symbols": ",".join(symbols)})
+
+                assert too_many.status_code == 400
+                assert response.status_code == 200
+                results = response.json()["results"]
+                assert results["BADUSD"] is None
+                assert all(results[symbol]["mark_price"] == 1.0 for symbol in symbols[1:])
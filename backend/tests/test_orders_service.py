@@ -1,10 +1,11 @@
 """
 Unit tests for OrdersService
 """
+import asyncio
 import pytest
 import sys
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 # Add src to path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -30,16 +31,16 @@ class TestOrdersService:
             "meta": {"after": "cursor123"}
         }
 
-        with patch("services.orders_service.DeltaRestClient") as mock_client_class:
+        with patch("services.orders_service.AsyncDeltaRestClient") as mock_client_class:
             mock_client = Mock()
-            mock_client.order_history.return_value = mock_history
+            mock_client.order_history = AsyncMock(return_value=mock_history)
             mock_client_class.return_value = mock_client
 
-            result = OrdersService.get_order_history(
+            result = asyncio.run(OrdersService.get_order_history(
                 api_key="test_key",
                 api_secret="test_secret",
                 page_size=100
-            )
+            ))
 
             assert result == mock_history
             mock_client_class.assert_called_once()
@@ -47,10 +48,10 @@ class TestOrdersService:
     def test_get_order_history_missing_credentials(self):
         """Test that missing credentials raise ValueError"""
         with pytest.raises(ValueError, match="API key and secret must be provided"):
-            OrdersService.get_order_history(
+            asyncio.run(OrdersService.get_order_history(
                 api_key="",
                 api_secret="test_secret"
-            )
+            ))
 
     def test_get_active_orders_success(self):
         """Test successfully fetching active orders"""
@@ -59,15 +60,15 @@ class TestOrdersService:
             {"id": 2, "state": "open"},
         ]
 
-        with patch("services.orders_service.DeltaRestClient") as mock_client_class:
+        with patch("services.orders_service.AsyncDeltaRestClient") as mock_client_class:
             mock_client = Mock()
-            mock_client.get_live_orders.return_value = mock_orders
+            mock_client.get_live_orders = AsyncMock(return_value=mock_orders)
             mock_client_class.return_value = mock_client
 
-            result = OrdersService.get_active_orders(
+            result = asyncio.run(OrdersService.get_active_orders(
                 api_key="test_key",
                 api_secret="test_secret"
-            )
+            ))
 
             assert result == mock_orders
 
@@ -1,10 +1,11 @@
 """
 Unit tests for PnLService
 """
+import asyncio
 import pytest
 import sys
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 # Add src to path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -28,13 +29,13 @@ class TestPnLService:
             },
         ]
 
-        with patch("services.pnl_service.PositionsService.get_all_positions") as mock_get_positions:
+        with patch("services.pnl_service.PositionsService.get_all_positions", new_callable=AsyncMock) as mock_get_positions:
             mock_get_positions.return_value = mock_positions
 
-            result = PnLService.get_pnl_summary(
+            result = asyncio.run(PnLService.get_pnl_summary(
                 api_key="test_key",
                 api_secret="test_secret"
-            )
+            ))
 
             assert result["total_realized_pnl"] == 50.25
             assert result["position_count"] == 2
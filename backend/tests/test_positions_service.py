@@ -1,10 +1,12 @@
 """
 Unit tests for PositionsService
 """
+import asyncio
+import httpx
 import pytest
 import sys
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 # Add src to path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -29,28 +31,52 @@ class TestPositionsService:
             }
         ]
 
-        with patch("services.positions_service.DeltaRestClient") as mock_client_class:
+        with patch("services.positions_service.AsyncDeltaRestClient") as mock_client_class:
             mock_client = Mock()
-            mock_client.get_all_margined_positions.return_value = mock_positions
+            mock_client.get_all_margined_positions = AsyncMock(return_value=mock_positions)
             mock_client_class.return_value = mock_client
 
-            result = PositionsService.get_all_positions(
+            result = asyncio.run(PositionsService.get_all_positions(
                 api_key="test_key",
                 api_secret="test_secret",
                 base_url="https://api.test.delta.exchange"
-            )
+            ))
 
             assert result == mock_positions
             mock_client_class.assert_called_once()
-            mock_client.get_all_margined_positions.assert_called_once()
+            mock_client.get_all_margined_positions.assert_awaited_once()
+
+    def test_get_all_positions_uses_given_http_client(self):
+        """Test that the signed request goes out on the http_client passed in"""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={"success": True, "result": [{"product_id": 27, "size": 1}]})
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await PositionsService.get_all_positions(
+                    api_key="test_key",
+                    api_secret="test_secret",
+                    base_url="https://api.test.delta.exchange",
+                    http_client=client
+                )
+
+        result = asyncio.run(run())
+
+        assert result == [{"product_id": 27, "size": 1}]
+        assert len(requests_seen) == 1
+        assert requests_seen[0].url == "https://api.test.delta.exchange/v2/positions/margined"
+        assert requests_seen[0].headers["api-key"] == "test_key"
 
     def test_get_all_positions_missing_credentials(self):
         """Test that missing credentials raise ValueError"""
         with pytest.raises(ValueError, match="API key and secret must be provided"):
-            PositionsService.get_all_positions(
+            asyncio.run(PositionsService.get_all_positions(
                 api_key="",
                 api_secret="test_secret"
-            )
+            ))
 
     def test_calculate_total_pnl(self):
         """Test calculating total PnL from positions"""
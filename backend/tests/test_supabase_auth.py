@@ -0,0 +1,88 @@
+"""
+Unit tests for the Supabase get_current_user dependency
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auth.supabase import middleware
+
+
+JWT_SECRET = "test-secret-of-at-least-32-bytes!"
+
+
+def make_token(sub="user-1", exp_in=3600, **claims):
+    return jwt.encode({"sub": sub, "exp": int(time.time()) + exp_in, **claims}, JWT_SECRET, algorithm="HS256")
+
+
+@pytest.fixture
+def supabase_client():
+    """Fake service-role client resolving every user to alice@example.com / C1"""
+    client = MagicMock()
+    client.auth.admin.get_user_by_id.return_value = SimpleNamespace(user=SimpleNamespace(
+        id="user-1", email="alice@example.com", user_metadata={"name": "Alice"}, email_confirmed_at="2024-01-01"
+    ))
+    middleware._verified_users.clear()
+    with patch.object(middleware, "get_supabase_client", return_value=client), \
+            patch.object(middleware, "get_supabase_config", return_value=None), \
+            patch.object(middleware.client_auth, "get_client_id_by_email", return_value="C1"):
+        yield client
+    middleware._verified_users.clear()
+
+
+class TestGetCurrentUser:
+    """Test cases for get_current_user"""
+
+    def test_repeat_tokens_use_the_cache(self, supabase_client):
+        """Test that a token is only resolved through Supabase once while cached"""
+        token = make_token()
+
+        users = [asyncio.run(middleware.get_current_user(f"Bearer {token}")) for _ in range(3)]
+
+        assert supabase_client.auth.admin.get_user_by_id.call_count == 1
+        assert users[0] == users[2]
+        assert users[0]["client_id"] == "C1"
+        assert token.encode() not in b"".join(middleware._verified_users)
+
+    def test_cache_entries_expire_with_the_token(self, supabase_client):
+        """Test that cache entries never outlive the token's exp claim"""
+        token = make_token(exp_in=5)
+
+        with patch.object(middleware, "AUTH_CACHE_TTL_SECONDS", 60.0):
+            asyncio.run(middleware.get_current_user(f"Bearer {token}"))
+
+        (expires_at, _, _), = middleware._verified_users.values()
+        assert expires_at == jwt.get_unverified_claims(token)["exp"]
+
+    def test_expired_token_rejected_without_lookup(self, supabase_client):
+        """Test that an expired token gets a 401 before any Supabase call"""
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(middleware.get_current_user(f"Bearer {make_token(exp_in=-60)}"))
+
+        assert exc_info.value.status_code == 401
+        supabase_client.auth.admin.get_user_by_id.assert_not_called()
+
+    def test_local_verification_skips_admin_api(self, supabase_client):
+        """Test that with a JWT secret configured, signed claims are used without a Supabase call"""
+        config = SimpleNamespace(jwt_secret=JWT_SECRET)
+        token = make_token(email="Alice@Example.com", aud="authenticated", user_metadata={"name": "Alice"})
+        forged = make_token(email="alice@example.com", aud="authenticated")[:-2] + "xx"
+
+        with patch.object(middleware, "get_supabase_config", return_value=config):
+            user = asyncio.run(middleware.get_current_user(f"Bearer {token}"))
+            with pytest.raises(HTTPException) as exc_info:
+                asyncio.run(middleware.get_current_user(f"Bearer {forged}"))
+
+        assert (user["sub"], user["email"], user["name"]) == ("user-1", "Alice@Example.com", "Alice")
+        assert exc_info.value.status_code == 401
+        supabase_client.auth.admin.get_user_by_id.assert_not_called()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the /ticker upstream cache
+"""
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api import routes
+from api.routes import _fetch_ticker_data
+
+
+class TestTickerCache:
+    """Test cases for _fetch_ticker_data"""
+
+    def setup_method(self):
+        routes._ticker_cache.clear()
+        routes._ticker_inflight.clear()
+        routes._ticker_body_cache.clear()
+
+    def test_concurrent_requests_share_one_upstream_call(self):
+        """Test that concurrent misses for a symbol wait on a single request, then hit the cache"""
+        requests_seen = []
+
+        async def handler(request):
+            requests_seen.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"success": True, "result": {"symbol": "BTCUSD", "mark_price": "50000"}})
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                results = await asyncio.gather(*(_fetch_ticker_data(client, "BTCUSD") for _ in range(10)))
+                results.append(await _fetch_ticker_data(client, "BTCUSD"))
+                return results
+
+        results = asyncio.run(run())
+
+        assert len(requests_seen) == 1
+        assert requests_seen[0].url.path == "/v2/tickers/BTCUSD"
+        assert all(data["result"]["mark_price"] == "50000" for _, data in results)
+
+    def test_expired_entries_and_failures_are_refetched(self):
+        """Test that errors are not cached and entries older than the TTL are refreshed"""
+        responses = [httpx.Response(502), httpx.Response(200, json={"success": True, "result": {}})]
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return responses[min(len(requests_seen), len(responses)) - 1]
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                try:
+                    await _fetch_ticker_data(client, "ETHUSD")
+                except httpx.HTTPStatusError:
+                    pass
+                await _fetch_ticker_data(client, "ETHUSD")
+                with patch("api.routes.TICKER_CACHE_TTL_SECONDS", 0):
+                    await _fetch_ticker_data(client, "ETHUSD")
+
+        asyncio.run(run())
+
+        assert len(requests_seen) == 3
+
+    def test_waiters_refetch_when_owner_is_cancelled(self):
+        """Test that cancelling the request that owns a fetch doesn't cancel other waiters"""
+        requests_seen = []
+
+        async def handler(request):
+            requests_seen.append(request)
+            await asyncio.sleep(0.05 if len(requests_seen) == 1 else 0)
+            return httpx.Response(200, json={"success": True, "result": {"symbol": "BTCUSD"}})
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                owner = asyncio.create_task(_fetch_ticker_data(client, "BTCUSD"))
+                await asyncio.sleep(0.01)
+                waiter = asyncio.create_task(_fetch_ticker_data(client, "BTCUSD"))
+                await asyncio.sleep(0.01)
+                owner.cancel()
+                return await waiter, owner
+
+        (_, data), owner = asyncio.run(run())
+
+        assert owner.cancelled()
+        assert data["result"]["symbol"] == "BTCUSD"
+        assert len(requests_seen) == 2
+
+    def test_simplified_body_reused_until_timestamp_changes(self):
+        """Test that the simplified /ticker body is only re-serialized for a new timestamp"""
+        ticker = {"symbol": "BTCUSD", "mark_price": "50000", "timestamp": 1}
+
+        with patch("api.routes._simplify_ticker", wraps=routes._simplify_ticker) as spy:
+            first = routes._simplified_ticker_body("BTCUSD", ticker)
+            assert routes._simplified_ticker_body("BTCUSD", dict(ticker)) is first
+            updated = routes._simplified_ticker_body("BTCUSD", {**ticker, "mark_price": "50100", "timestamp": 2})
+
+        assert spy.call_count == 2
+        assert b'"mark_price":50100.0' in updated
@@ -0,0 +1,154 @@
+"""
+Unit tests for TradingService
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.trading_service import TradingService
+
+
+def _mock_http_client(handler):
+    """httpx.AsyncClient that answers every request with handler(request)"""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestTradingService:
+    """Test cases for TradingService"""
+
+    def test_place_limit_order_wait_without_brackets(self):
+        """Test placing an entry order signs the request and returns the order"""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={"success": True, "result": {"id": 42, "state": "open", "product_id": 27}})
+
+        async def run():
+            async with _mock_http_client(handler) as client:
+                with patch("services.trading_service.get_http_client", return_value=client):
+                    return await TradingService().place_limit_order_wait(
+                        entry_price=50000,
+                        size=1,
+                        side="buy",
+                        product_id=27,
+                        api_key="test_key",
+                        api_secret="test_secret",
+                        base_url="https://api.test.delta.exchange"
+                    )
+
+        success, order_data, error = asyncio.run(run())
+
+        assert success is True
+        assert order_data["id"] == 42
+        assert error is None
+        assert len(requests_seen) == 1
+        request = requests_seen[0]
+        assert request.url == "https://api.test.delta.exchange/v2/orders"
+        assert request.headers["api-key"] == "test_key"
+        assert "signature" in request.headers
+        assert json.loads(request.content)["product_id"] == 27
+
+    def test_place_limit_order_wait_api_error(self):
+        """Test that an HTTP error from Delta is returned as a failure"""
+        def handler(request):
+            return httpx.Response(401, json={"success": False, "error": {"code": "invalid_api_key"}})
+
+        async def run():
+            async with _mock_http_client(handler) as client:
+                with patch("services.trading_service.get_http_client", return_value=client):
+                    return await TradingService().place_limit_order_wait(
+                        entry_price=50000,
+                        size=1,
+                        side="buy",
+                        product_id=27,
+                        api_key="test_key",
+                        api_secret="test_secret"
+                    )
+
+        success, order_data, error = asyncio.run(run())
+
+        assert success is False
+        assert order_data is None
+        assert error.startswith("401 HTTP Error")
+
+    def test_place_limit_order_wait_places_brackets_once_position_exists(self):
+        """Test that brackets are placed as soon as the position appears, without sleeping the full wait"""
+        positions_polls = []
+
+        def handler(request):
+            if request.url.path == "/v2/orders":
+                return httpx.Response(200, json={"success": True, "result": {"id": 42, "state": "open", "product_id": 27}})
+            if request.url.path == "/v2/positions/margined":
+                positions_polls.append(request)
+                size = 1 if len(positions_polls) >= 2 else 0
+                return httpx.Response(200, json={"success": True, "result": [{"product_id": 27, "size": size}]})
+            return httpx.Response(200, json={"success": True, "result": {"id": 43}})
+
+        sleep = AsyncMock()
+
+        async def run():
+            async with _mock_http_client(handler) as client:
+                with patch("services.trading_service.get_http_client", return_value=client), \
+                        patch("services.trading_service.asyncio.sleep", sleep):
+                    return await TradingService().place_limit_order_wait(
+                        entry_price=50000,
+                        size=1,
+                        side="buy",
+                        product_id=27,
+                        stop_loss_price=49000,
+                        wait_time_seconds=60,
+                        api_key="test_key",
+                        api_secret="test_secret"
+                    )
+
+        success, order_data, error = asyncio.run(run())
+
+        assert success is True
+        assert error is None
+        assert order_data["bracket_order"] == {"id": 43}
+        assert len(positions_polls) == 2
+        assert [call.args[0] for call in sleep.await_args_list] == [1.0]
+
+    def test_place_limit_order_wait_symbol_only_waits_before_brackets(self):
+        """Test that without a product_id to poll, brackets are sent only after wait_time_seconds"""
+        events = []
+
+        def handler(request):
+            if request.url.path == "/v2/orders":
+                events.append("entry")
+                return httpx.Response(200, json={"success": True, "result": {"id": 42, "state": "open"}})
+            events.append("bracket")
+            return httpx.Response(200, json={"success": True, "result": {"id": 43}})
+
+        async def fake_sleep(seconds):
+            events.append(("sleep", seconds))
+
+        async def run():
+            async with _mock_http_client(handler) as client:
+                with patch("services.trading_service.get_http_client", return_value=client), \
+                        patch("services.trading_service.asyncio.sleep", fake_sleep):
+                    return await TradingService().place_limit_order_wait(
+                        entry_price=50000,
+                        size=1,
+                        side="buy",
+                        symbol="BTC",
+                        stop_loss_price=49000,
+                        wait_time_seconds=45,
+                        api_key="test_key",
+                        api_secret="test_secret"
+                    )
+
+        success, order_data, error = asyncio.run(run())
+
+        assert success is True
+        assert error is None
+        assert order_data["bracket_order"] == {"id": 43}
+        assert events == ["entry", ("sleep", 45), "bracket"]
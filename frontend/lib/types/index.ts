@@ -230,6 +230,10 @@ export interface PollingIntervalResponse {
   interval_seconds: number;
   min_interval: number;
   max_interval: number;
+  // Adaptive polling: grow the interval by backoff_multiplier (up to
+  // max_interval) while results are unchanged, plus up to jitter_seconds
+  backoff_multiplier: number;
+  jitter_seconds: number;
 }
 
 export interface DeltaCredentials {